@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import platform
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from OCRB.metrics.fused import BaselineTotals
+
+
+def environment_fingerprint() -> Dict[str, Any]:
+    """
+    Identifies the machine + interpreter a baseline was measured on.
+    REC baselines are only reused where this matches exactly.
+    """
+    return {
+        "node": platform.node(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "executable": sys.executable,
+    }
+
+
+def baseline_key_material(
+    *,
+    workload_id: str,
+    workload_version: str,
+    workload_config: Dict[str, Any],
+    execution_environment: Dict[str, Any],
+    clock: Optional[str] = None,
+    resource_dimension: Optional[str] = None,
+) -> Dict[str, Any]:
+    return {
+        "workload_id": workload_id,
+        "workload_version": workload_version,
+        "workload_config": workload_config,
+        "execution_environment": execution_environment,
+        "clock": clock,
+        "resource_dimension": resource_dimension,
+        "fingerprint": environment_fingerprint(),
+    }
+
+
+def baseline_key(material: Dict[str, Any]) -> str:
+    blob = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def load_baseline(path: Path, key: str) -> Optional[BaselineTotals]:
+    """
+    Read a baseline record written by store_baseline; None if missing,
+    unreadable or measured under a different key.
+    """
+    try:
+        data = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("key") != key:
+        return None
+    return BaselineTotals(work=float(data["work"]), resources=float(data["resources"]))
+
+
+def baseline_wall_s(path: Path, key: str) -> Optional[float]:
+    """
+    Real wall time the SP-0 execution of a stored baseline took; None if
+    unknown (or the record is missing or measured under a different key).
+    """
+    try:
+        data = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("key") != key or data.get("wall_s") is None:
+        return None
+    return float(data["wall_s"])
+
+
+def store_baseline(
+    path: Path,
+    key: str,
+    material: Dict[str, Any],
+    totals: BaselineTotals,
+    source: str,
+    wall_s: Optional[float] = None,
+) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "key": key,
+        "key_material": material,
+        "work": totals.work,
+        "resources": totals.resources,
+        "source": source,
+        "wall_s": wall_s,
+    }
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=2, sort_keys=True, default=str))
+    tmp.replace(path)
+
+
+def cached_baseline_path(cache_dir: str, key: str) -> Path:
+    return Path(cache_dir) / "baselines" / f"{key}.json"
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 import time
 import random
 
@@ -34,6 +34,12 @@ class RunManifest:
 
     execution_environment: Dict[str, str]
 
+    # W2-A checkpoint storage backend (None for workloads without checkpoints)
+    checkpoint_backend: Optional[str] = None
+
+    # Profilers of profiled runs and their measured overhead (None if no run was profiled)
+    profiling: Optional[Dict[str, Any]] = None
+
 
 def generate_seeds(master_seed: Optional[int] = None) -> StressSeeds:
     rng = random.Random(master_seed)
@@ -53,6 +59,7 @@ def create_manifest(
     stress_parameters: Dict[str, dict],
     execution_environment: Dict[str, str],
     master_seed: Optional[int] = None,
+    checkpoint_backend: Optional[str] = None,
 ) -> RunManifest:
     seeds = generate_seeds(master_seed)
     return RunManifest(
@@ -66,4 +73,5 @@ def create_manifest(
         stress_parameters=stress_parameters,
         seeds=seeds,
         execution_environment=execution_environment,
+        checkpoint_backend=checkpoint_backend,
     )
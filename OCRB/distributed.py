@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import json
+import queue
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from OCRB.config import StressSeeds
+from OCRB.metrics.fused import BaselineTotals
+from OCRB.report.schema import RunRecord, run_record_from_dict, to_dict
+from OCRB.runner import (
+    _BenchmarkPlan,
+    _RunContext,
+    _execute_run,
+    _finish_benchmark,
+    _plan_benchmark,
+    _run_seed,
+)
+from OCRB.sweep import (
+    CellOutcome,
+    SweepCell,
+    _cell_path,
+    _estimated_cost,
+    _prepare_baselines,
+    _write_index,
+)
+
+
+# Wire protocol: one JSON object per line, worker-initiated.
+#
+#   worker -> {"op": "get"}
+#   coord  -> {"op": "work", "item": {...}} | {"op": "wait"} | {"op": "done"}
+#   worker -> {"op": "result", "item_id": n, "record": {...}}
+#           | {"op": "failed", "item_id": n, "error": "..."}
+#   coord  -> {"op": "ack"}
+#
+# A malformed worker message, including a record that is not a RunRecord,
+# gets {"op": "error", "error": "..."} back and changes nothing; the
+# connection stays open.
+#
+# An item leased to a connection that closes before returning its result is
+# put back at the head of the queue and handed to the next worker asking.
+
+
+def _send(f: Any, msg: Dict[str, Any]) -> None:
+    f.write(json.dumps(msg, separators=(",", ":")).encode("utf-8") + b"\n")
+    f.flush()
+
+
+def _recv(f: Any) -> Optional[Dict[str, Any]]:
+    line = f.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def _context_to_dict(ctx: _RunContext) -> Dict[str, Any]:
+    return asdict(ctx)
+
+
+def _context_from_dict(d: Dict[str, Any]) -> _RunContext:
+    d = dict(d)
+    d["seeds"] = StressSeeds(**d["seeds"])
+    d["baseline"] = BaselineTotals(**d["baseline"])
+    return _RunContext(**d)
+
+
+_WORKER_OPS = ("get", "result", "failed")
+
+
+def _message_error(msg: Any) -> Optional[str]:
+    """
+    Why a worker message does not follow the wire protocol, or None.
+    """
+    if not isinstance(msg, dict):
+        return f"Message must be a JSON object, not {type(msg).__name__}"
+    op = msg.get("op")
+    if op not in _WORKER_OPS:
+        return f"Unknown op: {op!r} (expected one of {_WORKER_OPS})"
+    if op == "get":
+        return None
+    item_id = msg.get("item_id")
+    if not isinstance(item_id, int) or isinstance(item_id, bool):
+        return f"{op!r} needs an integer item_id, got {item_id!r}"
+    if op == "result" and not isinstance(msg.get("record"), dict):
+        return "'result' needs a record object"
+    if op == "failed" and not isinstance(msg.get("error"), str):
+        return "'failed' needs an error string"
+    return None
+
+
+class _WorkQueue:
+    """
+    Coordinator state shared by the connection handler threads.
+    """
+    def __init__(self, items: List[Dict[str, Any]]):
+        self._lock = threading.Lock()
+        self._items = {item["item_id"]: item for item in items}
+        self._pending: Deque[int] = deque(self._items)
+        self._leases: Dict[int, int] = {}              # item_id -> connection id
+        self._remaining: Dict[str, int] = {}           # cell_id -> unsettled items
+        for item in items:
+            self._remaining[item["cell_id"]] = self._remaining.get(item["cell_id"], 0) + 1
+        self.results: Dict[int, RunRecord] = {}
+        self.errors: Dict[str, str] = {}               # cell_id -> first error
+        self.settled: "queue.Queue[str]" = queue.Queue()  # cell ids with every item settled
+
+    def lease(self, conn_id: int) -> Dict[str, Any]:
+        with self._lock:
+            if self._pending:
+                item_id = self._pending.popleft()
+                self._leases[item_id] = conn_id
+                return {"op": "work", "item": self._items[item_id]}
+            if self._leases:
+                return {"op": "wait"}
+            return {"op": "done"}
+
+    def settle(self, conn_id: int, item_id: int, record: Optional[RunRecord], error: Optional[str]) -> None:
+        with self._lock:
+            if self._leases.get(item_id) != conn_id:
+                return  # lease was lost (and re-issued) meanwhile
+            del self._leases[item_id]
+            cell_id = self._items[item_id]["cell_id"]
+            if error is not None:
+                self.errors.setdefault(cell_id, error)
+            else:
+                self.results[item_id] = record
+            self._remaining[cell_id] -= 1
+            if self._remaining[cell_id] == 0:
+                self.settled.put(cell_id)
+
+    def release(self, conn_id: int) -> None:
+        with self._lock:
+            lost = sorted(i for i, c in self._leases.items() if c == conn_id)
+            for item_id in reversed(lost):
+                del self._leases[item_id]
+                self._pending.appendleft(item_id)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        work: _WorkQueue = self.server.work  # type: ignore[attr-defined]
+        conn_id = id(self)
+        try:
+            while True:
+                try:
+                    msg = _recv(self.rfile)
+                except ValueError as e:
+                    _send(self.wfile, {"op": "error", "error": f"Malformed message: {e}"})
+                    continue
+                if msg is None:
+                    return
+                error = _message_error(msg)
+                if error is not None:
+                    _send(self.wfile, {"op": "error", "error": error})
+                elif msg["op"] == "get":
+                    _send(self.wfile, work.lease(conn_id))
+                else:
+                    record = None
+                    if msg["op"] == "result":
+                        try:
+                            record = run_record_from_dict(msg["record"])
+                        except (KeyError, TypeError, ValueError) as e:
+                            _send(self.wfile, {"op": "error", "error": f"Malformed record: {type(e).__name__}: {e}"})
+                            continue
+                    work.settle(conn_id, msg["item_id"], record, msg.get("error"))
+                    _send(self.wfile, {"op": "ack"})
+        except OSError:
+            return
+        finally:
+            work.release(conn_id)
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SweepCoordinator:
+    """
+    Distributes the runs of a sweep over TCP.
+
+    Planning happens here: each cell's manifest and SP-0 baseline are
+    written under <out_dir>/cells/<cell_id>/ and its runs become work items
+    (cell, run index, seed). Workers (run_worker, on any host) fetch items,
+    execute them and send back the RunRecords, which are merged into the
+    standard report layout; sweep_index.json is written at the end.
+
+    Seeds derive from each cell's manifest only, so reports are identical
+    to a single-node run_sweep however the items were distributed.
+    """
+    def __init__(
+        self,
+        *,
+        out_dir: str,
+        cells: List[SweepCell],
+        execution_environment: Dict[str, Any],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        baseline_cache_dir: Optional[str] = None,
+        clock: Optional[str] = None,
+        resume: bool = False,
+    ):
+        self.out_dir = out_dir
+        self.cells = cells
+        self._cells_by_id = {c.cell_id: c for c in cells}
+        self.cache_dir = baseline_cache_dir or str(Path(out_dir) / "baseline_cache")
+
+        baselines = _prepare_baselines(cells, execution_environment, self.cache_dir, clock)
+        self._costs = {c.cell_id: _estimated_cost(c, baselines) for c in cells}
+        self._plans: Dict[str, _BenchmarkPlan] = {}
+        items: List[Dict[str, Any]] = []
+        # Longest cells first, as in run_sweep
+        for cell in sorted(cells, key=lambda c: self._costs[c.cell_id], reverse=True):
+            plan = _plan_benchmark(
+                out_dir=str(Path(out_dir) / _cell_path(cell)),
+                workload_id=cell.workload_id,
+                workload_version=cell.workload_version,
+                stress_profile_id=cell.stress_profile_id,
+                stress_parameters=cell.stress_parameters,
+                execution_environment=execution_environment,
+                master_seed=cell.master_seed,
+                n_runs=cell.n_runs,
+                gds_levels=cell.gds_levels,
+                isolation_duration_declared=cell.isolation_duration_declared,
+                C_total=cell.C_total,
+                clock=clock,
+                stream_events=False,
+                resume=resume,
+                baseline_cache_dir=self.cache_dir,
+            )
+            self._plans[cell.cell_id] = plan
+            ctx = _context_to_dict(plan.ctx)
+            for i in plan.todo:
+                items.append({
+                    "item_id": len(items),
+                    "cell_id": cell.cell_id,
+                    "run_index": i,
+                    "seed": _run_seed(plan.ctx, i),
+                    "run_key": plan.run_keys[i],
+                    "ctx": ctx,
+                })
+        self._items = items
+
+        self._work = _WorkQueue(items)
+        self._server = _Server((host, port), _Handler)
+        self._server.work = self._work  # type: ignore[attr-defined]
+        # Workers may connect as soon as the coordinator exists
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    def run(self, timeout: Optional[float] = None) -> List[CellOutcome]:
+        """
+        Serve work items until every cell is settled, then write the index.
+        Cells are finalized as soon as all of their runs are in.
+        """
+        t0 = time.time()
+        outcomes: Dict[str, CellOutcome] = {}
+        try:
+            # Cells with nothing left to execute (resume) are settled up front
+            for cell_id, plan in self._plans.items():
+                if not plan.todo:
+                    self._work.settled.put(cell_id)
+            while len(outcomes) < len(self._plans):
+                remaining = None if timeout is None else max(timeout - (time.time() - t0), 0.0)
+                try:
+                    cell_id = self._work.settled.get(timeout=remaining)
+                except queue.Empty:
+                    raise TimeoutError(f"Sweep not finished after {timeout}s")
+                outcomes[cell_id] = self._finish_cell(cell_id, time.time() - t0)
+        finally:
+            self._server.shutdown()
+            self._server.server_close()
+        return _write_index(self.out_dir, self.cells, outcomes, self.cache_dir)
+
+    def _finish_cell(self, cell_id: str, elapsed_s: float) -> CellOutcome:
+        plan = self._plans[cell_id]
+        outcome = dict(
+            cell_id=cell_id,
+            path=_cell_path(self._cells_by_id[cell_id]),
+            duration_s=elapsed_s,
+            estimated_cost=self._costs[cell_id],
+        )
+        if cell_id in self._work.errors:
+            return CellOutcome(status="failed", error=self._work.errors[cell_id], **outcome)
+        by_index = {
+            item["run_index"]: self._work.results[item["item_id"]]
+            for item in self._items
+            if item["cell_id"] == cell_id
+        }
+        _finish_benchmark(plan, (by_index[i] for i in plan.todo))
+        summary = json.loads((Path(plan.ctx.out_dir) / "aggregate_summary.json").read_text())
+        return CellOutcome(status="ok", ori_mean=summary["ori"]["mean"], **outcome)
+
+
+def _execute_item(item: Dict[str, Any], scratch_dir: str) -> Dict[str, Any]:
+    # Workload state goes to this worker's scratch space; the record itself
+    # is written by the coordinator.
+    ctx = _context_from_dict(item["ctx"])
+    ctx = replace(ctx, out_dir=str(Path(scratch_dir) / item["cell_id"]))
+    if _run_seed(ctx, item["run_index"]) != item["seed"]:
+        raise ValueError(f"Seed mismatch for {item['cell_id']} run {item['run_index']}")
+    return to_dict(_execute_run(ctx, item["run_index"], item["run_key"]))
+
+
+def run_worker(
+    host: str,
+    port: int,
+    *,
+    retry_s: float = 0.2,
+    give_up_s: float = 30.0,
+) -> int:
+    """
+    Execute work items from a SweepCoordinator until it reports the sweep
+    done. A dropped connection is re-established (the coordinator re-queues
+    whatever this worker held); the worker gives up once the coordinator has
+    been unreachable for give_up_s. Returns the number of items executed.
+    """
+    executed = 0
+    last_contact = time.time()
+    with tempfile.TemporaryDirectory(prefix="ocrb-worker-") as scratch:
+        while True:
+            try:
+                with socket.create_connection((host, port), timeout=give_up_s) as sock:
+                    sock.settimeout(None)
+                    f = sock.makefile("rwb")
+                    while True:
+                        _send(f, {"op": "get"})
+                        msg = _recv(f)
+                        if msg is None:
+                            raise ConnectionError("coordinator closed the connection")
+                        last_contact = time.time()
+                        if msg["op"] == "done":
+                            return executed
+                        if msg["op"] == "wait":
+                            time.sleep(retry_s)
+                            continue
+                        item = msg["item"]
+                        try:
+                            reply = {"op": "result", "item_id": item["item_id"],
+                                     "record": _execute_item(item, scratch)}
+                        except Exception as e:
+                            reply = {"op": "failed", "item_id": item["item_id"],
+                                     "error": f"{type(e).__name__}: {e}"}
+                        _send(f, reply)
+                        ack = _recv(f)
+                        if ack is None:
+                            raise ConnectionError("coordinator closed the connection")
+                        if ack["op"] == "error":
+                            raise RuntimeError(f"Coordinator rejected item {item['item_id']}: {ack['error']}")
+                        executed += 1
+            except OSError:
+                if time.time() - last_contact > give_up_s:
+                    return executed
+                time.sleep(retry_s)
+
+
+if __name__ == "__main__":
+    # python -m OCRB.distributed HOST PORT
+    run_worker(sys.argv[1], int(sys.argv[2]))
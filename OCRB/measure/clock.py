@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class Clock:
+    """
+    Time source shared by event logs, workloads and the runner.
+    Workloads MUST take both timestamps and waits from the same clock so that
+    event times stay coherent under either implementation.
+    """
+    def now(self) -> float:
+        raise NotImplementedError
+
+    def sleep(self, seconds: float) -> None:
+        raise NotImplementedError
+
+    async def sleep_async(self, seconds: float) -> None:
+        """
+        sleep() for coroutines: yields to the event loop while waiting.
+        """
+        raise NotImplementedError
+
+
+class SystemClock(Clock):
+    """
+    Wall-clock time (time.time / time.sleep).
+    """
+    def now(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+    async def sleep_async(self, seconds: float) -> None:
+        await asyncio.sleep(max(seconds, 0.0))
+
+
+class SimulatedClock(Clock):
+    """
+    Discrete-event clock: sleep() advances simulated time instantly.
+    Starts at a fixed epoch so timestamps are deterministic across runs.
+    """
+    def __init__(self, start: float = 1000.0):
+        self._t = float(start)
+
+    def now(self) -> float:
+        return self._t
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self._t += float(seconds)
+
+    async def sleep_async(self, seconds: float) -> None:
+        # Advance instantly, but still give other coroutines a turn.
+        self.sleep(seconds)
+        await asyncio.sleep(0)
+
+
+CLOCKS = {
+    "system": SystemClock,
+    "simulated": SimulatedClock,
+}
+
+
+def make_clock(kind: str) -> Clock:
+    """
+    Build a fresh clock by name ("system" or "simulated").
+    """
+    try:
+        return CLOCKS[kind]()
+    except KeyError:
+        raise ValueError(f"Unknown clock: {kind!r} (expected one of {sorted(CLOCKS)})")
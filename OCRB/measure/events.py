@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import asdict, dataclass, field, fields
 from enum import Enum
-from typing import Any, Dict, List, Optional
-import time
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence
+
+from OCRB.measure.clock import Clock, SystemClock
+from OCRB.measure.resources import ResourceUsage
 
 
 class EventType(str, Enum):
@@ -23,6 +26,8 @@ class EventType(str, Enum):
 
     COMPONENT_AFFECTED = "component_affected"  # for CFR evidence
 
+    FAULT_INJECTED = "fault_injected"  # stressor evidence (e.g. an SR-1 bit flip); not read by metrics
+
 
 class FailureClass(str, Enum):
     AUTONOMOUSLY_RECOVERED = "autonomously_recovered"
@@ -30,11 +35,40 @@ class FailureClass(str, Enum):
     IRREVERSIBLE = "irreversible"
 
 
-@dataclass(frozen=True)
+class _EmptyMeta(Mapping[str, Any]):
+    """
+    Read-only empty meta shared by every event emitted without any (unlike
+    a MappingProxyType, it pickles, as the shared instance).
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+    def __repr__(self) -> str:
+        return "{}"
+
+    def __reduce__(self) -> str:
+        return "_NO_META"
+
+
+_NO_META = _EmptyMeta()
+
+
+@dataclass(frozen=True, slots=True)
 class Event:
     """
     Canonical observational record.
     Metrics MUST be computed from these events only (plus manifest + stress levels).
+
+    Slotted (Python >= 3.10): no per-instance __dict__, and meta is only
+    allocated when given.
     """
     t_utc: float
     type: EventType
@@ -55,40 +89,113 @@ class Event:
     # Resources / work evidence (REC support)
     work_done: Optional[float] = None
     resources_used: Optional[float] = None
+    resources: Optional[ResourceUsage] = None  # metered usage behind work_done (see OCRB.measure.resources)
 
     # Free-form for implementation details (MUST NOT be required by metrics)
-    meta: Dict[str, Any] = field(default_factory=dict)
+    meta: Mapping[str, Any] = field(default_factory=lambda: _NO_META)
+
+
+_EVENT_FIELDS = tuple(f.name for f in fields(Event))
+
+
+def event_to_dict(e: Event) -> Dict[str, Any]:
+    d = {name: getattr(e, name) for name in _EVENT_FIELDS}
+    d["resources"] = asdict(e.resources) if e.resources is not None else None
+    d["meta"] = dict(e.meta)
+    return d
+
+
+class EventView(Sequence[Event]):
+    """
+    Read-only, zero-copy view over an EventLog's events.
+    Reflects events emitted after the view was taken.
+    """
+    __slots__ = ("_events",)
+
+    def __init__(self, events: List[Event]):
+        self._events = events
+
+    def __getitem__(self, i):
+        return self._events[i]
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._events)
+
+    def __reduce__(self):
+        # Pickles as a plain list (e.g. when shipped to worker processes).
+        return (list, (self._events,))
 
 
 class EventLog:
     """
-    In-memory log. Later we can persist to JSONL.
+    In-memory log by default. Given a sink (e.g. OCRB.measure.sink.JsonlEventSink),
+    events are streamed to it instead of being kept, so memory stays constant;
+    `events` then replays them from the sink.
+    Events without an explicit t_utc are stamped from the log's clock.
+    Subscribers (see subscribe) are called with every emitted event.
     """
-    def __init__(self, run_id: str, workload_id: str):
+    def __init__(
+        self,
+        run_id: str,
+        workload_id: str,
+        clock: Optional[Clock] = None,
+        sink: Optional[Any] = None,
+    ):
         self.run_id = run_id
         self.workload_id = workload_id
+        self.clock = clock if clock is not None else SystemClock()
+        self.sink = sink
         self._events: List[Event] = []
+        self.first: Optional[Event] = None
+        self.last: Optional[Event] = None
+        self._subscribers: List[Callable[[Event], None]] = []
+
+    def subscribe(self, callback: Callable[[Event], None]) -> None:
+        """
+        Call `callback(event)` for every event emitted from now on
+        (e.g. OCRB.metrics.online.ProxyAccumulator.add).
+        """
+        self._subscribers.append(callback)
 
     def emit(self, type: EventType, **kwargs: Any) -> Event:
+        t_utc = kwargs.pop("t_utc", None)
+        component_id = kwargs.pop("component_id", None)
+        if kwargs.get("meta") is None:
+            kwargs.pop("meta", None)
         ev = Event(
-            t_utc=kwargs.pop("t_utc", time.time()),
+            t_utc=self.clock.now() if t_utc is None else t_utc,
             type=type,
             run_id=self.run_id,
             workload_id=kwargs.pop("workload_id", self.workload_id),
+            # component ids repeat heavily across events; share one string per id
+            component_id=sys.intern(component_id) if isinstance(component_id, str) else component_id,
             **kwargs,
         )
-        self._events.append(ev)
+        if self.sink is not None:
+            self.sink.write(ev)
+        else:
+            self._events.append(ev)
+        if self.first is None:
+            self.first = ev
+        self.last = ev
+        for callback in self._subscribers:
+            callback(ev)
         return ev
 
     @property
-    def events(self) -> List[Event]:
-        return list(self._events)
+    def events(self) -> Sequence[Event]:
+        if self.sink is not None:
+            return self.sink.replay()
+        return EventView(self._events)
 
     def to_dicts(self) -> List[Dict[str, Any]]:
-        return [asdict(e) for e in self._events]
+        return [event_to_dict(e) for e in self.events]
 
 
-def validate_event_log(events: List[Event]) -> None:
+def validate_event_log(events: Sequence[Event]) -> None:
     """
     Lightweight structural validation so we don't compute metrics from nonsense.
     Raises ValueError on obvious violations.
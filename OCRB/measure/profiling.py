@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import cProfile
+import pstats
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+PROFILERS = ("cprofile", "tracemalloc")
+
+# Frames kept per traced allocation (innermost first)
+_TRACEMALLOC_FRAMES = 1
+
+
+def check_profilers(profilers: Sequence[str]) -> Tuple[str, ...]:
+    unknown = [p for p in profilers if p not in PROFILERS]
+    if unknown:
+        raise ValueError(f"Unknown profilers: {unknown} (expected any of {PROFILERS})")
+    return tuple(p for p in PROFILERS if p in profilers)
+
+
+class RunProfiler:
+    """
+    Profiles the code run between entering and leaving it; the profile (a
+    JSON-ready dict) is in `.profile` afterwards.
+
+      "cprofile"    - function timings of the calling thread (other threads
+                      and processes are not profiled)
+      "tracemalloc" - Python allocations of every thread of the process,
+                      as the memory still held at the end of the window by
+                      allocation site, and the peak traced memory. Memory
+                      allocated before entering is not counted.
+
+    Only the top_n hot functions (by own time) and allocation sites (by
+    size) are kept. The profile also records its own cost: the wall time
+    of the window and of capturing the profile, and the memory tracemalloc
+    used for its traces.
+    """
+    def __init__(self, profilers: Sequence[str], top_n: int = 20):
+        if top_n < 1:
+            raise ValueError("top_n must be >= 1")
+        self.profilers = check_profilers(profilers)
+        self.top_n = top_n
+        self.profile: Optional[Dict[str, Any]] = None
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._started_tracemalloc = False
+        self._before: Optional[tracemalloc.Snapshot] = None
+        self._t0 = 0.0
+
+    def __enter__(self) -> RunProfiler:
+        self.profile = None
+        if "tracemalloc" in self.profilers:
+            self._started_tracemalloc = not tracemalloc.is_tracing()
+            if self._started_tracemalloc:
+                tracemalloc.start(_TRACEMALLOC_FRAMES)
+            self._before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+        self._t0 = time.perf_counter()
+        if "cprofile" in self.profilers:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        wall = time.perf_counter() - self._t0
+        profile: Dict[str, Any] = {"profilers": list(self.profilers), "top_n": self.top_n}
+        overhead: Dict[str, Any] = {"wall_s": wall}
+        if self._cprofile is not None:
+            profile["hot_functions"] = _hot_functions(self._cprofile, self.top_n)
+            self._cprofile = None
+        if self._before is not None:
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            overhead["tracemalloc_bytes"] = tracemalloc.get_tracemalloc_memory()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+            profile["peak_traced_bytes"] = peak
+            profile["allocation_sites"] = _allocation_sites(self._before, after, self.top_n)
+            self._before = None
+        overhead["capture_s"] = time.perf_counter() - self._t0 - wall
+        profile["overhead"] = overhead
+        self.profile = profile
+
+
+def _hot_functions(profile: cProfile.Profile, top_n: int) -> List[Dict[str, Any]]:
+    stats = pstats.Stats(profile).stats  # (file, line, name) -> (cc, ncalls, tottime, cumtime, callers)
+    ranked = sorted(stats.items(), key=lambda kv: kv[1][2], reverse=True)[:top_n]
+    return [
+        {
+            "function": name,
+            "file": file,
+            "line": line,
+            "calls": ncalls,
+            "primitive_calls": cc,
+            "own_s": tottime,
+            "cumulative_s": cumtime,
+        }
+        for (file, line, name), (cc, ncalls, tottime, cumtime, _) in ranked
+    ]
+
+
+def _allocation_sites(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, top_n: int
+) -> List[Dict[str, Any]]:
+    # The profilers' own bookkeeping is not part of the profiled code
+    own = [tracemalloc.Filter(False, m.__file__) for m in (tracemalloc, cProfile, sys.modules[__name__])]
+    diff = after.filter_traces(own).compare_to(before.filter_traces(own), "lineno")
+    grown = sorted((s for s in diff if s.size_diff > 0), key=lambda s: s.size_diff, reverse=True)[:top_n]
+    return [
+        {
+            "file": s.traceback[0].filename,
+            "line": s.traceback[0].lineno,
+            "size_bytes": s.size_diff,
+            "blocks": s.count_diff,
+        }
+        for s in grown
+    ]
+
+
+def _calibration_workload() -> int:
+    # Many small calls and allocations: where profilers cost the most
+    def step(k: int) -> Tuple[int, str]:
+        return k * k, str(k)
+
+    table = {}
+    for k in range(20000):
+        table[k] = step(k)
+    return len(table)
+
+
+def calibrate_overhead(profilers: Sequence[str], repeat: int = 3) -> Dict[str, float]:
+    """
+    Slowdown of a fixed call- and allocation-heavy loop under the profilers
+    (best of `repeat` timings each way): a machine-specific estimate of the
+    worst slowdown profiled runs see, since little of a run is spent in
+    such tight Python loops.
+    """
+    def best(profiled: bool) -> float:
+        times = []
+        for _ in range(repeat):
+            if profiled:
+                with RunProfiler(profilers, top_n=1) as p:
+                    _calibration_workload()
+                times.append(p.profile["overhead"]["wall_s"])
+            else:
+                t0 = time.perf_counter()
+                _calibration_workload()
+                times.append(time.perf_counter() - t0)
+        return min(times)
+
+    plain, profiled = best(False), best(True)
+    return {"plain_s": plain, "profiled_s": profiled, "slowdown": profiled / plain if plain > 0 else 1.0}
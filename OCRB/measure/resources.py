@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import sys
+import time
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # not on Windows: only wall time can be metered
+    resource = None
+
+# What REC may normalize work by (see ResourceUsage.value)
+RESOURCE_DIMENSIONS = (
+    "wall_s",
+    "cpu_s",
+    "cpu_user_s",
+    "cpu_sys_s",
+    "max_rss_bytes",
+    "io_bytes",
+    "read_bytes",
+    "write_bytes",
+    "ctx_switches",
+)
+
+METER_SCOPES = ("process", "thread")
+
+# ru_maxrss is in KiB on Linux, bytes on macOS
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+@dataclass(frozen=True)
+class ResourceUsage:
+    """
+    Resources consumed over a metered window (all values are floats so that
+    per-work-unit figures fit the same type):
+      wall_s                  - monotonic wall time
+      cpu_user_s, cpu_sys_s   - getrusage user / system CPU time
+      max_rss_bytes           - peak resident set size of the process (a
+                                high-water mark, not a difference)
+      read_bytes, write_bytes - storage I/O from /proc/<self>/io (0 where
+                                unavailable)
+      voluntary_ctx_switches, involuntary_ctx_switches
+    """
+    wall_s: float = 0.0
+    cpu_user_s: float = 0.0
+    cpu_sys_s: float = 0.0
+    max_rss_bytes: float = 0.0
+    read_bytes: float = 0.0
+    write_bytes: float = 0.0
+    voluntary_ctx_switches: float = 0.0
+    involuntary_ctx_switches: float = 0.0
+
+    @property
+    def cpu_s(self) -> float:
+        return self.cpu_user_s + self.cpu_sys_s
+
+    @property
+    def io_bytes(self) -> float:
+        return self.read_bytes + self.write_bytes
+
+    @property
+    def ctx_switches(self) -> float:
+        return self.voluntary_ctx_switches + self.involuntary_ctx_switches
+
+    def value(self, dimension: str) -> float:
+        check_resource_dimension(dimension)
+        return float(getattr(self, dimension))
+
+    def __add__(self, other: ResourceUsage) -> ResourceUsage:
+        # Usage of two windows; the peak RSS is the larger peak
+        out = {f.name: getattr(self, f.name) + getattr(other, f.name) for f in fields(self)}
+        out["max_rss_bytes"] = max(self.max_rss_bytes, other.max_rss_bytes)
+        return ResourceUsage(**out)
+
+    def per_unit(self, units: float) -> Optional[ResourceUsage]:
+        """
+        Usage per unit of work (the peak RSS is not divided); None for no work.
+        """
+        if units <= 0:
+            return None
+        return ResourceUsage(**{
+            f.name: getattr(self, f.name) if f.name == "max_rss_bytes" else getattr(self, f.name) / units
+            for f in fields(self)
+        })
+
+    @classmethod
+    def from_dict(cls, d: Optional[Dict[str, Any]]) -> Optional[ResourceUsage]:
+        return cls(**d) if d else None
+
+
+def check_resource_dimension(dimension: Optional[str]) -> None:
+    """
+    None selects the workload's own resources_used evidence. Dimensions
+    other than wall_s need the POSIX resource module.
+    """
+    if dimension is not None and dimension not in RESOURCE_DIMENSIONS:
+        raise ValueError(f"Unknown resource dimension: {dimension!r} (expected one of {RESOURCE_DIMENSIONS})")
+    if dimension not in (None, "wall_s") and resource is None:
+        raise ValueError(
+            f"Resource dimension {dimension!r} is not available on {sys.platform} (no resource module); use 'wall_s'"
+        )
+
+
+def _read_io(path: str) -> Tuple[float, float]:
+    try:
+        with open(path, "rb") as f:
+            counters = dict(line.split(b":", 1) for line in f.read().splitlines() if b":" in line)
+    except OSError:
+        return 0.0, 0.0
+    return float(counters.get(b"read_bytes", 0)), float(counters.get(b"write_bytes", 0))
+
+
+def _peak_rss_bytes() -> float:
+    # VmHWM follows a reset through clear_refs; ru_maxrss never goes down
+    try:
+        with open("/proc/self/status", "rb") as f:
+            for line in f:
+                if line.startswith(b"VmHWM:"):
+                    return float(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return 0.0
+    return float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT)
+
+
+def reset_peak_rss() -> None:
+    """
+    Reset the process's peak RSS (Linux; a no-op elsewhere). The peak is
+    process-wide, so this also resets it for every other meter of the
+    process: call it only while nothing else in the process is metered.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+class ResourceMeter:
+    """
+    Meters the resources used between entering the meter and leaving it
+    (usage) or any point in between (elapsed()).
+
+    scope:
+      "process" - CPU time, context switches and I/O of the whole process
+                  (children are not included)
+      "thread"  - of the calling thread only (RUSAGE_THREAD and
+                  /proc/thread-self/io), so work on other threads of the
+                  process is excluded; "process" where unsupported
+
+    Without the resource module (Windows) only wall_s is metered; the other
+    values are 0.
+
+    max_rss_bytes is always the process-wide peak since the last
+    reset_peak_rss() (or since the process started), whatever the scope.
+
+    reset_peak:
+      Call reset_peak_rss() on entry, so max_rss_bytes is the peak within
+      the window. "process" scope only: a thread-scope meter resetting the
+      peak would corrupt the peak of meters on other threads.
+    """
+    def __init__(self, scope: str = "process", *, reset_peak: bool = False):
+        if scope not in METER_SCOPES:
+            raise ValueError(f"Unknown meter scope: {scope!r} (expected one of {METER_SCOPES})")
+        if reset_peak and scope != "process":
+            raise ValueError("reset_peak needs scope 'process' (the peak RSS is process-wide)")
+        if scope == "thread" and not hasattr(resource, "RUSAGE_THREAD"):
+            scope = "process"
+        self.scope = scope
+        self.reset_peak = reset_peak
+        self.usage: Optional[ResourceUsage] = None
+        self._start: Optional[Tuple[float, ...]] = None
+
+    def _sample(self) -> Tuple[float, ...]:
+        if resource is None:
+            return (time.monotonic(), 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        if self.scope == "thread":
+            ru = resource.getrusage(resource.RUSAGE_THREAD)
+            io = _read_io("/proc/thread-self/io")
+        else:
+            ru = resource.getrusage(resource.RUSAGE_SELF)
+            io = _read_io("/proc/self/io")
+        return (time.monotonic(), ru.ru_utime, ru.ru_stime, *io, float(ru.ru_nvcsw), float(ru.ru_nivcsw))
+
+    def start(self) -> ResourceMeter:
+        if self.reset_peak:
+            reset_peak_rss()
+        self.usage = None
+        self._start = self._sample()
+        return self
+
+    def elapsed(self) -> ResourceUsage:
+        """
+        Usage since the meter was started.
+        """
+        if self._start is None:
+            raise RuntimeError("resource meter was not started")
+        wall, user, sys_, read, write, vol, invol = (b - a for a, b in zip(self._start, self._sample()))
+        return ResourceUsage(
+            wall_s=wall,
+            cpu_user_s=user,
+            cpu_sys_s=sys_,
+            max_rss_bytes=_peak_rss_bytes(),
+            read_bytes=read,
+            write_bytes=write,
+            voluntary_ctx_switches=vol,
+            involuntary_ctx_switches=invol,
+        )
+
+    def stop(self) -> ResourceUsage:
+        self.usage = self.elapsed()
+        return self.usage
+
+    def __enter__(self) -> ResourceMeter:
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from OCRB.measure.events import Event, EventType, FailureClass, event_to_dict
+from OCRB.measure.resources import ResourceUsage
+
+
+def _encode(e: Event) -> str:
+    d = event_to_dict(e)
+    d["type"] = e.type.value
+    d["failure_class"] = e.failure_class.value if e.failure_class is not None else None
+    return json.dumps(d, sort_keys=True)
+
+
+def _decode(line: str) -> Event:
+    d: Dict[str, Any] = json.loads(line)
+    d["type"] = EventType(d["type"])
+    if d.get("failure_class") is not None:
+        d["failure_class"] = FailureClass(d["failure_class"])
+    if not d.get("meta"):
+        d.pop("meta", None)  # share the empty default
+    d["resources"] = ResourceUsage.from_dict(d.get("resources"))
+    return Event(**d)
+
+
+def read_events_jsonl(path: str) -> Iterator[Event]:
+    """
+    Stream events back from a JSONL event file, one line at a time.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield _decode(line)
+
+
+class JsonlEventReader(Sequence[Event]):
+    """
+    Re-iterable, read-only view over a JSONL event file. Each iteration
+    re-reads the file, so memory use does not grow with the number of events.
+    Indexing is supported but scans the file (O(n)).
+    """
+    def __init__(self, path: str, count: int):
+        self.path = path
+        self._count = count
+
+    def __iter__(self) -> Iterator[Event]:
+        return read_events_jsonl(self.path)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self)[i]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        for k, e in enumerate(self):
+            if k == i:
+                return e
+        raise IndexError(i)
+
+
+class JsonlEventSink:
+    """
+    Append-only JSONL event file written through a buffered writer.
+    An EventLog given a sink streams events here instead of keeping them.
+    """
+    def __init__(self, path: str, buffer_size: int = 1 << 16):
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._f: Optional[Any] = open(self.path, "w", encoding="utf-8", buffering=buffer_size)
+        self.count = 0
+
+    def write(self, e: Event) -> None:
+        if self._f is None:
+            raise ValueError(f"Event sink is closed: {self.path}")
+        self._f.write(_encode(e))
+        self._f.write("\n")
+        self.count += 1
+
+    def flush(self) -> None:
+        if self._f is not None:
+            self._f.flush()
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def replay(self) -> JsonlEventReader:
+        """
+        Flush buffered events and return a reader over everything written so far.
+        """
+        self.flush()
+        return JsonlEventReader(self.path, self.count)
+
+    def __enter__(self) -> "JsonlEventSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from OCRB.measure.events import Event, EventType, FailureClass
 
@@ -14,7 +14,7 @@ class ARRResult:
     na_reason: Optional[str] = None
 
 
-def compute_arr(events: List[Event]) -> ARRResult:
+def compute_arr(events: Sequence[Event]) -> ARRResult:
     """
     BP-2 — Autonomous Recovery Rate (ARR)
     ARR = Fa / Fr
@@ -39,6 +39,13 @@ def compute_arr(events: List[Event]) -> ARRResult:
                 if e.failure_class == FailureClass.AUTONOMOUSLY_RECOVERED:
                     Fa += 1
 
+    return arr_from_counts(Fr, Fa)
+
+
+def arr_from_counts(Fr: int, Fa: int) -> ARRResult:
+    """
+    Finalize ARR from failure counts (shared by batch and fused evaluation).
+    """
     if Fr == 0:
         return ARRResult(arr=None, Fr=0, Fa=0, na_reason="Fr=0 (no recoverable failures observed)")
 
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from OCRB.report.schema import RunRecord, to_dict
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - depends on environment
+        raise ImportError("Batch scoring needs NumPy, an optional dependency: pip install numpy") from None
+    return np
+
+
+@dataclass(frozen=True)
+class RunEvidenceArrays:
+    """
+    Struct-of-arrays view of per-run proxy evidence (one row per run).
+    Missing scalar evidence is NaN; stress_levels / completion_rates are
+    padded with NaN up to the longest run.
+    """
+    run_ids: List[str]
+    stress_levels: Any       # (n, L) float
+    completion_rates: Any    # (n, L) float
+    Fr: Any                  # (n,) float
+    Fa: Any                  # (n,) float
+    isolation_duration: Any  # (n,) float
+    survival_time: Any       # (n,) float
+    E_base: Any              # (n,) float
+    E_stress: Any            # (n,) float
+    C_total: Any             # (n,) float
+    C_local: Any             # (n,) float
+
+    def __len__(self) -> int:
+        return len(self.run_ids)
+
+
+@dataclass(frozen=True)
+class BatchScores:
+    """
+    Proxy and ORI values for every run; NaN marks N/A.
+    """
+    run_ids: List[str]
+    gds: Any
+    arr: Any
+    ist: Any
+    rec: Any
+    cfr: Any
+    ori: Any
+
+    def proxy(self, name: str) -> List[Optional[float]]:
+        """
+        One proxy as a list with None for N/A (input format of stats.aggregate.summarize).
+        """
+        np = _require_numpy()
+        values = getattr(self, name)
+        return [None if np.isnan(v) else float(v) for v in values]
+
+
+def load_run_evidence(records: Iterable[Any]) -> RunEvidenceArrays:
+    """
+    Load evidence from RunRecords or their JSON dicts (as written to runs/run_NN.json).
+    """
+    np = _require_numpy()
+    rows = [to_dict(r) if isinstance(r, RunRecord) else r for r in records]
+    n = len(rows)
+    width = max((len(r["evidence"].get("stress_levels") or []) for r in rows), default=0)
+
+    levels = np.full((n, width), np.nan)
+    rates = np.full((n, width), np.nan)
+    for k, r in enumerate(rows):
+        ev = r["evidence"]
+        s = ev.get("stress_levels") or []
+        c = ev.get("completion_rates") or []
+        levels[k, :len(s)] = s
+        rates[k, :len(c)] = c
+
+    def column(key: str) -> Any:
+        return np.array(
+            [np.nan if r["evidence"].get(key) is None else float(r["evidence"][key]) for r in rows],
+            dtype=float,
+        )
+
+    return RunEvidenceArrays(
+        run_ids=[r["run_id"] for r in rows],
+        stress_levels=levels,
+        completion_rates=rates,
+        Fr=column("Fr"),
+        Fa=column("Fa"),
+        isolation_duration=column("isolation_duration"),
+        survival_time=column("survival_time"),
+        E_base=column("E_base"),
+        E_stress=column("E_stress"),
+        C_total=column("C_total"),
+        C_local=column("C_local"),
+    )
+
+
+def load_run_dir(out_dir: str) -> RunEvidenceArrays:
+    """
+    Load every runs/run_NN.json of a report directory.
+    """
+    paths = sorted((Path(out_dir) / "runs").glob("run_*.json"))
+    return load_run_evidence(json.loads(p.read_text()) for p in paths)
+
+
+def score_runs(
+    ev: RunEvidenceArrays,
+    *,
+    expected_levels: Optional[List[float]] = None,
+    weights: Optional[Dict[str, float]] = None,
+) -> BatchScores:
+    """
+    Vectorized proxies + ORI for all runs, from recorded evidence.
+
+    Same definitions and N/A rules as compute_gds/arr/ist/rec/cfr and
+    compute_ori; every N/A case becomes NaN, and ORI is NaN wherever any
+    weighted proxy is NaN.
+    """
+    np = _require_numpy()
+    if weights is None:
+        weights = {"gds": 0.2, "arr": 0.2, "ist": 0.2, "rec": 0.2, "cfr": 0.2}
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # BP-1 GDS: mean completion rate; N/A without evidence, with an
+        # out-of-bounds rate, or with a declared level missing.
+        present = ~np.isnan(ev.completion_rates)
+        n_levels = present.sum(axis=1)
+        rates = np.where(present, ev.completion_rates, 0.0)
+        gds = np.clip(rates.sum(axis=1) / n_levels, 0.0, 1.0)
+        out_of_bounds = (present & ((ev.completion_rates < 0.0) | (ev.completion_rates > 1.0))).any(axis=1)
+        gds_na = (n_levels == 0) | out_of_bounds
+        for level in expected_levels or []:
+            gds_na |= ~(ev.stress_levels == float(level)).any(axis=1)
+        gds = np.where(gds_na, np.nan, gds)
+
+        # BP-2 ARR = Fa / Fr; N/A when Fr == 0
+        arr = np.where(ev.Fr > 0, ev.Fa / ev.Fr, np.nan)
+
+        # BP-3 IST = clamp(survival / declared); N/A without a declared duration or a window
+        ist = np.clip(ev.survival_time / ev.isolation_duration, 0.0, 1.0)
+        ist = np.where(ev.isolation_duration > 0, ist, np.nan)
+
+        # BP-4 REC = min(E_stress / E_base, 1); N/A without a positive baseline efficiency
+        rec = np.clip(ev.E_stress / ev.E_base, 0.0, 1.0)
+        rec = np.where(ev.E_base > 0, rec, np.nan)
+
+        # BP-5 CFR = 1 - C_local / C_total; N/A for C_total <= 1, no affected
+        # components, or C_local > C_total
+        cfr = np.clip(1.0 - ev.C_local / ev.C_total, 0.0, 1.0)
+        cfr_ok = (ev.C_total > 1) & (ev.C_local > 0) & (ev.C_local <= ev.C_total)
+        cfr = np.where(cfr_ok, cfr, np.nan)
+
+    proxies = {"gds": gds, "arr": arr, "ist": ist, "rec": rec, "cfr": cfr}
+    missing = [k for k in weights if k not in proxies]
+    if missing:
+        ori = np.full(len(ev), np.nan)
+    else:
+        ori = np.zeros(len(ev))
+        for k, w in weights.items():
+            ori = ori + proxies[k] * float(w)
+        # NaN propagates through the sum: any N/A proxy makes ORI N/A
+        ori = np.clip(ori, 0.0, 1.0)
+
+    return BatchScores(run_ids=list(ev.run_ids), gds=gds, arr=arr, ist=ist, rec=rec, cfr=cfr, ori=ori)
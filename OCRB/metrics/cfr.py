@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Set
+from typing import List, Optional, Sequence, Set
 
 from OCRB.measure.events import Event, EventType
 
@@ -15,7 +15,7 @@ class CFRResult:
 
 
 def compute_cfr(
-    events: List[Event],
+    events: Sequence[Event],
     *,
     C_total: Optional[int],
 ) -> CFRResult:
@@ -31,6 +31,23 @@ def compute_cfr(
       - Affected components are recorded via COMPONENT_AFFECTED events.
       - If FAILURE events include component_id, we include those too (as affected).
     """
+    affected: Set[str] = set()
+
+    for e in events:
+        if e.type == EventType.COMPONENT_AFFECTED and e.component_id:
+            affected.add(str(e.component_id))
+        # include explicit component failures as affected evidence
+        if e.type == EventType.FAILURE and e.component_id:
+            affected.add(str(e.component_id))
+
+    return cfr_from_affected(affected, C_total=C_total)
+
+
+def cfr_from_affected(affected: Set[str], *, C_total: Optional[int]) -> CFRResult:
+    """
+    Finalize CFR from the set of affected component ids (shared by batch and
+    fused evaluation).
+    """
     if C_total is None:
         return CFRResult(cfr=None, C_total=None, C_local=None, na_reason="C_total not declared.")
     if C_total <= 1:
@@ -41,15 +58,6 @@ def compute_cfr(
             na_reason="C_total <= 1 (single-component workload); CFR not applicable.",
         )
 
-    affected: Set[str] = set()
-
-    for e in events:
-        if e.type == EventType.COMPONENT_AFFECTED and e.component_id:
-            affected.add(str(e.component_id))
-        # include explicit component failures as affected evidence
-        if e.type == EventType.FAILURE and e.component_id:
-            affected.add(str(e.component_id))
-
     if not affected:
         return CFRResult(
             cfr=None,
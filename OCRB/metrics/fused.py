@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+
+from OCRB.measure.events import Event, EventType, FailureClass
+from OCRB.metrics.arr import ARRResult, arr_from_counts
+from OCRB.metrics.cfr import CFRResult, cfr_from_affected
+from OCRB.metrics.gds import GDSResult, gds_from_evidence
+from OCRB.metrics.ist import ISTResult, ist_from_window, is_isolation_terminator
+from OCRB.metrics.ori import ORIResult, compute_ori
+from OCRB.measure.resources import check_resource_dimension
+from OCRB.metrics.rec import RECResult, _sum_work_and_resources, event_resources, rec_from_totals
+
+
+@dataclass(frozen=True)
+class BaselineTotals:
+    """
+    Summed SP-0 work/resources evidence. Computed once per benchmark and
+    reused for every run's REC.
+    """
+    work: float
+    resources: float
+
+
+def measure_baseline(baseline_events: Iterable[Event], resource_dimension: Optional[str] = None) -> BaselineTotals:
+    """
+    SP-0 totals, with resources counted in `resource_dimension` (see compute_rec).
+    """
+    check_resource_dimension(resource_dimension)
+    work, resources = _sum_work_and_resources(baseline_events, resource_dimension)
+    return BaselineTotals(work=work, resources=resources)
+
+
+@dataclass(frozen=True)
+class ProxyResults:
+    gds: GDSResult
+    arr: ARRResult
+    ist: ISTResult
+    rec: RECResult
+    cfr: CFRResult
+    ori: ORIResult
+
+    def proxies(self) -> Dict[str, Optional[float]]:
+        return {
+            "gds": self.gds.gds,
+            "arr": self.arr.arr,
+            "ist": self.ist.ist,
+            "rec": self.rec.rec,
+            "cfr": self.cfr.cfr,
+        }
+
+    def na_reasons(self) -> Dict[str, str]:
+        out: Dict[str, str] = {}
+        for key in ("gds", "arr", "ist", "rec", "cfr", "ori"):
+            reason = getattr(self, key).na_reason
+            if reason:
+                out[key] = reason
+        return out
+
+
+def compute_proxies(
+    events: Iterable[Event],
+    *,
+    baseline: BaselineTotals,
+    expected_levels: Optional[List[float]] = None,
+    isolation_duration_declared: Optional[float] = None,
+    C_total: Optional[int] = None,
+    baseline_min_work: float = 0.0,
+    weights: Optional[Dict[str, float]] = None,
+    resource_dimension: Optional[str] = None,
+) -> ProxyResults:
+    """
+    Fused evaluator: GDS, ARR, IST, REC, CFR and ORI in a single pass over
+    the events. Results (values, evidence and na_reasons) are identical to
+    calling compute_gds/arr/ist/rec/cfr and compute_ori separately.
+    """
+    check_resource_dimension(resource_dimension)
+    # GDS
+    levels: List[float] = []
+    rates: List[float] = []
+    # ARR
+    Fr = 0
+    Fa = 0
+    # IST: terminators seen before isolation_start may still qualify by timestamp
+    iso_start: Optional[float] = None
+    early_terminators: List[float] = []
+    iso_end_time: Optional[float] = None
+    t_max: Optional[float] = None
+    # REC
+    work_s = 0.0
+    res_s = 0.0
+    # CFR
+    affected: Set[str] = set()
+
+    for e in events:
+        t = e.type
+
+        if e.stress_level is not None and e.completion_rate is not None:
+            levels.append(float(e.stress_level))
+            rates.append(float(e.completion_rate))
+
+        if t == EventType.FAILURE:
+            fc = e.failure_class
+            if fc == FailureClass.AUTONOMOUSLY_RECOVERED:
+                Fr += 1
+                Fa += 1
+            elif fc == FailureClass.RECOVERABLE_NOT_RECOVERED:
+                Fr += 1
+            if e.component_id:
+                affected.add(str(e.component_id))
+        elif t == EventType.COMPONENT_AFFECTED and e.component_id:
+            affected.add(str(e.component_id))
+
+        if e.work_done is not None:
+            work_s += float(e.work_done)
+        used = event_resources(e, resource_dimension)
+        if used is not None:
+            res_s += float(used)
+
+        if t_max is None or e.t_utc > t_max:
+            t_max = e.t_utc
+        if iso_start is None:
+            if t == EventType.ISOLATION_START:
+                iso_start = e.t_utc
+                iso_end_time = next((x for x in early_terminators if x >= iso_start), None)
+            elif is_isolation_terminator(e):
+                early_terminators.append(e.t_utc)
+        elif iso_end_time is None and e.t_utc >= iso_start and is_isolation_terminator(e):
+            iso_end_time = e.t_utc
+
+    if iso_start is not None and iso_end_time is None:
+        # No terminating event observed; assume survived until last event timestamp
+        iso_end_time = t_max
+
+    gds = gds_from_evidence(levels, rates, expected_levels=expected_levels)
+    arr = arr_from_counts(Fr, Fa)
+    ist = ist_from_window(iso_start, iso_end_time, isolation_duration_declared)
+    rec = rec_from_totals(baseline.work, baseline.resources, work_s, res_s, baseline_min_work=baseline_min_work)
+    cfr = cfr_from_affected(affected, C_total=C_total)
+
+    ori = compute_ori(
+        {"gds": gds.gds, "arr": arr.arr, "ist": ist.ist, "rec": rec.rec, "cfr": cfr.cfr},
+        weights,
+    )
+    return ProxyResults(gds=gds, arr=arr, ist=ist, rec=rec, cfr=cfr, ori=ori)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from OCRB.measure.events import Event, EventType
 
@@ -16,7 +16,7 @@ class GDSResult:
 
 
 def compute_gds(
-    events: List[Event],
+    events: Sequence[Event],
     expected_levels: Optional[List[float]] = None,
 ) -> GDSResult:
     """
@@ -46,6 +46,18 @@ def compute_gds(
             levels.append(float(e.stress_level))
             rates.append(float(e.completion_rate))
 
+    return gds_from_evidence(levels, rates, expected_levels=expected_levels)
+
+
+def gds_from_evidence(
+    levels: List[float],
+    rates: List[float],
+    expected_levels: Optional[List[float]] = None,
+) -> GDSResult:
+    """
+    Finalize GDS from (stress_level, completion_rate) evidence in event order
+    (shared by batch and fused evaluation).
+    """
     if not levels:
         return GDSResult(
             gds=None,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from OCRB.measure.events import Event, EventType, FailureClass
 
@@ -15,7 +15,7 @@ class ISTResult:
 
 
 def compute_ist(
-    events: List[Event],
+    events: Sequence[Event],
     isolation_duration_declared: Optional[float],
 ) -> ISTResult:
     """
@@ -36,12 +36,7 @@ def compute_ist(
       - If no isolation_start event exists -> IST is N/A (not applicable).
     """
     if isolation_duration_declared is None or isolation_duration_declared <= 0:
-        return ISTResult(
-            ist=None,
-            isolation_duration_declared=isolation_duration_declared,
-            survival_time_observed=None,
-            na_reason="Missing or invalid declared isolation duration.",
-        )
+        return ist_from_window(None, None, isolation_duration_declared)
 
     # Find isolation start
     iso_start: Optional[float] = None
@@ -51,33 +46,13 @@ def compute_ist(
             break
 
     if iso_start is None:
-        return ISTResult(
-            ist=None,
-            isolation_duration_declared=isolation_duration_declared,
-            survival_time_observed=None,
-            na_reason="No isolation_start event observed (IST not applicable).",
-        )
-
-    # Track whether we're currently isolated
-    isolated = True
+        return ist_from_window(None, None, isolation_duration_declared)
 
     # Find first terminating event after iso_start
     iso_end_time: Optional[float] = None
 
     for e in events:
-        if e.t_utc < iso_start:
-            continue
-
-        if isolated and e.type == EventType.ISOLATION_END:
-            iso_end_time = e.t_utc
-            isolated = False
-            break
-
-        if isolated and e.type == EventType.FAILURE and e.failure_class == FailureClass.IRREVERSIBLE:
-            iso_end_time = e.t_utc
-            break
-
-        if isolated and e.type == EventType.RUN_END:
+        if e.t_utc >= iso_start and is_isolation_terminator(e):
             iso_end_time = e.t_utc
             break
 
@@ -85,6 +60,45 @@ def compute_ist(
         # No terminating event observed; assume survived until last event timestamp
         iso_end_time = max(e.t_utc for e in events)
 
+    return ist_from_window(iso_start, iso_end_time, isolation_duration_declared)
+
+
+def is_isolation_terminator(e: Event) -> bool:
+    """
+    Events that end an isolation window (see compute_ist).
+    """
+    return (
+        e.type == EventType.ISOLATION_END
+        or e.type == EventType.RUN_END
+        or (e.type == EventType.FAILURE and e.failure_class == FailureClass.IRREVERSIBLE)
+    )
+
+
+def ist_from_window(
+    iso_start: Optional[float],
+    iso_end_time: Optional[float],
+    isolation_duration_declared: Optional[float],
+) -> ISTResult:
+    """
+    Finalize IST from an observed isolation window (shared by batch and fused
+    evaluation). iso_start is None if no isolation_start was observed.
+    """
+    if isolation_duration_declared is None or isolation_duration_declared <= 0:
+        return ISTResult(
+            ist=None,
+            isolation_duration_declared=isolation_duration_declared,
+            survival_time_observed=None,
+            na_reason="Missing or invalid declared isolation duration.",
+        )
+
+    if iso_start is None or iso_end_time is None:
+        return ISTResult(
+            ist=None,
+            isolation_duration_declared=isolation_duration_declared,
+            survival_time_observed=None,
+            na_reason="No isolation_start event observed (IST not applicable).",
+        )
+
     survival_time = max(0.0, iso_end_time - iso_start)
     ist = survival_time / float(isolation_duration_declared)
     ist = max(0.0, min(1.0, ist))
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set
+
+from OCRB.measure.events import Event, EventType, FailureClass
+from OCRB.metrics.arr import ARRResult, arr_from_counts
+from OCRB.metrics.cfr import CFRResult, cfr_from_affected
+from OCRB.metrics.fused import BaselineTotals, ProxyResults
+from OCRB.metrics.gds import GDSResult, gds_from_evidence
+from OCRB.metrics.ist import ISTResult, ist_from_window, is_isolation_terminator
+from OCRB.metrics.ori import compute_ori
+from OCRB.measure.resources import ResourceUsage, check_resource_dimension
+from OCRB.metrics.rec import RECResult, event_resources, rec_from_totals
+
+
+class GDSAccumulator:
+    def __init__(self, expected_levels: Optional[List[float]] = None):
+        self.expected_levels = expected_levels
+        self.levels: List[float] = []
+        self.rates: List[float] = []
+
+    def add(self, e: Event) -> None:
+        if e.stress_level is not None and e.completion_rate is not None:
+            self.levels.append(float(e.stress_level))
+            self.rates.append(float(e.completion_rate))
+
+    def result(self) -> GDSResult:
+        return gds_from_evidence(list(self.levels), list(self.rates), expected_levels=self.expected_levels)
+
+
+class ARRAccumulator:
+    def __init__(self) -> None:
+        self.Fr = 0
+        self.Fa = 0
+
+    def add(self, e: Event) -> None:
+        if e.type == EventType.FAILURE:
+            if e.failure_class == FailureClass.AUTONOMOUSLY_RECOVERED:
+                self.Fr += 1
+                self.Fa += 1
+            elif e.failure_class == FailureClass.RECOVERABLE_NOT_RECOVERED:
+                self.Fr += 1
+
+    def result(self) -> ARRResult:
+        return arr_from_counts(self.Fr, self.Fa)
+
+
+class ISTAccumulator:
+    """
+    Tracks the first isolation window. While it is still open, the snapshot
+    treats the latest event time as the end (as compute_ist does for a log
+    with no terminating event).
+    """
+    def __init__(self, isolation_duration_declared: Optional[float]):
+        self.isolation_duration_declared = isolation_duration_declared
+        self.iso_start: Optional[float] = None
+        self.iso_end_time: Optional[float] = None
+        self.t_max: Optional[float] = None
+        # terminators logged before isolation_start may still qualify by timestamp
+        self._early_terminators: List[float] = []
+
+    def add(self, e: Event) -> None:
+        if self.t_max is None or e.t_utc > self.t_max:
+            self.t_max = e.t_utc
+        if self.iso_start is None:
+            if e.type == EventType.ISOLATION_START:
+                self.iso_start = e.t_utc
+                self.iso_end_time = next((x for x in self._early_terminators if x >= e.t_utc), None)
+                self._early_terminators = []
+            elif is_isolation_terminator(e):
+                self._early_terminators.append(e.t_utc)
+        elif self.iso_end_time is None and e.t_utc >= self.iso_start and is_isolation_terminator(e):
+            self.iso_end_time = e.t_utc
+
+    def result(self) -> ISTResult:
+        end = self.iso_end_time if self.iso_end_time is not None else self.t_max
+        return ist_from_window(self.iso_start, end, self.isolation_duration_declared)
+
+
+class RECAccumulator:
+    """
+    Also totals the metered resources of the run (usage), whichever
+    resource dimension REC is normalized by.
+    """
+    def __init__(
+        self, baseline: BaselineTotals, baseline_min_work: float = 0.0, resource_dimension: Optional[str] = None
+    ):
+        check_resource_dimension(resource_dimension)
+        self.baseline = baseline
+        self.baseline_min_work = baseline_min_work
+        self.resource_dimension = resource_dimension
+        self.work = 0.0
+        self.resources = 0.0
+        self.usage: Optional[ResourceUsage] = None
+
+    def add(self, e: Event) -> None:
+        if e.work_done is not None:
+            self.work += float(e.work_done)
+        used = event_resources(e, self.resource_dimension)
+        if used is not None:
+            self.resources += float(used)
+        if e.resources is not None:
+            self.usage = e.resources if self.usage is None else self.usage + e.resources
+
+    def result(self) -> RECResult:
+        return rec_from_totals(
+            self.baseline.work, self.baseline.resources, self.work, self.resources,
+            baseline_min_work=self.baseline_min_work,
+        )
+
+
+class CFRAccumulator:
+    def __init__(self, C_total: Optional[int]):
+        self.C_total = C_total
+        self.affected: Set[str] = set()
+
+    def add(self, e: Event) -> None:
+        if e.component_id and e.type in (EventType.COMPONENT_AFFECTED, EventType.FAILURE):
+            self.affected.add(str(e.component_id))
+
+    def result(self) -> CFRResult:
+        return cfr_from_affected(set(self.affected), C_total=self.C_total)
+
+
+class ProxyAccumulator:
+    """
+    Online evaluation of all five proxies + ORI.
+
+    Subscribe `add` to an EventLog (log.subscribe(acc.add)); each event is
+    folded in O(1). snapshot() returns the current values at any time, and
+    after the last event equals compute_proxies over the full log.
+    """
+    def __init__(
+        self,
+        *,
+        baseline: BaselineTotals,
+        expected_levels: Optional[List[float]] = None,
+        isolation_duration_declared: Optional[float] = None,
+        C_total: Optional[int] = None,
+        baseline_min_work: float = 0.0,
+        weights: Optional[Dict[str, float]] = None,
+        resource_dimension: Optional[str] = None,
+    ):
+        self.gds = GDSAccumulator(expected_levels)
+        self.arr = ARRAccumulator()
+        self.ist = ISTAccumulator(isolation_duration_declared)
+        self.rec = RECAccumulator(baseline, baseline_min_work, resource_dimension)
+        self.cfr = CFRAccumulator(C_total)
+        self.weights = weights
+        self.n_events = 0
+
+    def add(self, e: Event) -> None:
+        self.gds.add(e)
+        self.arr.add(e)
+        self.ist.add(e)
+        self.rec.add(e)
+        self.cfr.add(e)
+        self.n_events += 1
+
+    def snapshot(self) -> ProxyResults:
+        gds = self.gds.result()
+        arr = self.arr.result()
+        ist = self.ist.result()
+        rec = self.rec.result()
+        cfr = self.cfr.result()
+        ori = compute_ori(
+            {"gds": gds.gds, "arr": arr.arr, "ist": ist.ist, "rec": rec.rec, "cfr": cfr.cfr},
+            self.weights,
+        )
+        return ProxyResults(gds=gds, arr=arr, ist=ist, rec=rec, cfr=cfr, ori=ori)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from OCRB.measure.events import Event
+from OCRB.measure.resources import check_resource_dimension
 
 
 @dataclass(frozen=True)
@@ -14,22 +15,36 @@ class RECResult:
     na_reason: Optional[str] = None
 
 
-def _sum_work_and_resources(events: List[Event]) -> Tuple[float, float]:
+def event_resources(e: Event, resource_dimension: Optional[str] = None) -> Optional[float]:
+    """
+    Resources an event accounts for: its resources_used evidence, or with a
+    resource dimension selected, that dimension of its metered usage.
+    """
+    if resource_dimension is None:
+        return e.resources_used
+    return e.resources.value(resource_dimension) if e.resources is not None else None
+
+
+def _sum_work_and_resources(
+    events: Sequence[Event], resource_dimension: Optional[str] = None
+) -> Tuple[float, float]:
     work = 0.0
     resources = 0.0
     for e in events:
         if e.work_done is not None:
             work += float(e.work_done)
-        if e.resources_used is not None:
-            resources += float(e.resources_used)
+        used = event_resources(e, resource_dimension)
+        if used is not None:
+            resources += float(used)
     return work, resources
 
 
 def compute_rec(
-    baseline_events: List[Event],
-    stressed_events: List[Event],
+    baseline_events: Sequence[Event],
+    stressed_events: Sequence[Event],
     *,
     baseline_min_work: float = 0.0,
+    resource_dimension: Optional[str] = None,
 ) -> RECResult:
     """
     BP-4 — Resource Efficiency Under Constraint (REC)
@@ -43,10 +58,31 @@ def compute_rec(
       - If E_base is undefined (resources=0 or work too low), REC is N/A.
       - If stressed produces no work but baseline does, REC = 0.0 (valid).
       - This function is purely observational: it only reads event evidence.
+
+    resource_dimension:
+      None normalizes by resources_used. A dimension of
+      OCRB.measure.resources.RESOURCE_DIMENSIONS (e.g. "cpu_s") normalizes
+      by that dimension of the events' metered resources instead.
     """
-    work_b, res_b = _sum_work_and_resources(baseline_events)
-    work_s, res_s = _sum_work_and_resources(stressed_events)
+    check_resource_dimension(resource_dimension)
+    work_b, res_b = _sum_work_and_resources(baseline_events, resource_dimension)
+    work_s, res_s = _sum_work_and_resources(stressed_events, resource_dimension)
+
+    return rec_from_totals(work_b, res_b, work_s, res_s, baseline_min_work=baseline_min_work)
 
+
+def rec_from_totals(
+    work_b: float,
+    res_b: float,
+    work_s: float,
+    res_s: float,
+    *,
+    baseline_min_work: float = 0.0,
+) -> RECResult:
+    """
+    Finalize REC from summed work/resources of the baseline and stressed runs
+    (shared by batch and fused evaluation).
+    """
     # Baseline validity gate (optional but useful)
     if work_b < baseline_min_work:
         return RECResult(
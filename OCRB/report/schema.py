@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass, asdict, field
 from typing import Any, Dict, List, Optional
 
+from OCRB.measure.resources import ResourceUsage
+
 
 @dataclass(frozen=True)
 class ProxyEvidence:
@@ -22,6 +24,9 @@ class ProxyEvidence:
     E_base: Optional[float] = None
     E_stress: Optional[float] = None
     baseline_completion_ok: Optional[bool] = None
+    resource_dimension: Optional[str] = None                  # None = resources_used evidence
+    resource_usage: Optional[ResourceUsage] = None            # metered over the run
+    resource_usage_per_unit: Optional[ResourceUsage] = None   # the same per unit of work done
 
     # BP-5 (CFR)
     C_total: Optional[int] = None
@@ -57,6 +62,13 @@ class RunRecord:
     # Raw observational record (events)
     events: List[Dict[str, Any]] = field(default_factory=list)
 
+    # Set instead of `events` when events were streamed to a JSONL file
+    # (path relative to the report directory)
+    events_path: Optional[str] = None
+
+    # Content address of the run's inputs (see runner resume mode)
+    run_key: Optional[str] = None
+
 
 @dataclass(frozen=True)
 class AggregateStats:
@@ -81,3 +93,16 @@ class AggregateSummary:
 
 def to_dict(obj: Any) -> Dict[str, Any]:
     return asdict(obj)
+
+
+def run_record_from_dict(d: Dict[str, Any]) -> RunRecord:
+    """
+    Inverse of to_dict for a RunRecord (e.g. a runs/run_NN.json payload).
+    """
+    d = dict(d)
+    d["proxies"] = ProxyValues(**d["proxies"])
+    evidence = dict(d["evidence"])
+    for key in ("resource_usage", "resource_usage_per_unit"):
+        evidence[key] = ResourceUsage.from_dict(evidence.get(key))
+    d["evidence"] = ProxyEvidence(**evidence)
+    return RunRecord(**d)
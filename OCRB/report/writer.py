@@ -50,6 +50,16 @@ def write_run_record(out_dir: str, idx: int, record: RunRecord) -> Path:
     return path
 
 
+def write_run_profile(out_dir: str, idx: int, profile: Dict[str, Any]) -> Path:
+    """
+    Profile of run idx (see OCRB.measure.profiling), next to its record.
+    """
+    out = Path(out_dir)
+    path = out / "runs" / f"run_{idx:02d}.profile.json"
+    _write_json(path, profile)
+    return path
+
+
 def write_aggregate_summary(out_dir: str, summary: AggregateSummary) -> Path:
     out = Path(out_dir)
     path = out / "aggregate_summary.json"
@@ -63,3 +73,10 @@ def write_disclosure(out_dir: str, disclosure_text: str) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(disclosure_text.strip() + "\n")
     return path
+
+
+def write_sweep_index(out_dir: str, index: Dict[str, Any]) -> Path:
+    out = Path(out_dir)
+    path = out / "sweep_index.json"
+    _write_json(path, index)
+    return path
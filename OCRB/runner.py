@@ -1,19 +1,40 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import json
+import math
+import os
+import tempfile
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field, replace
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from OCRB.config import create_manifest
+from OCRB.baseline import (
+    baseline_key,
+    baseline_key_material,
+    baseline_wall_s,
+    cached_baseline_path,
+    load_baseline,
+    store_baseline,
+)
+from OCRB.config import StressSeeds, create_manifest
+from OCRB.measure.clock import Clock, make_clock
 from OCRB.measure.events import EventLog, EventType, FailureClass
-from OCRB.workloads.w1_stateless import run_w1a
-from OCRB.workloads.w2_stateful_pipeline import run_w2a, W2AConfig
+from OCRB.measure.profiling import RunProfiler, calibrate_overhead, check_profilers
+from OCRB.measure.resources import ResourceMeter, ResourceUsage, check_resource_dimension, reset_peak_rss
+from OCRB.measure.sink import JsonlEventSink
+from OCRB.workloads.checkpoint import CHECKPOINT_BACKENDS, CheckpointStore, open_checkpoint_store
+from OCRB.workloads.state import PipelineState
+from OCRB.workloads.w1_stateless import run_w1a, W1AConfig, W1AResult
+from OCRB.workloads.w2_stateful_pipeline import run_w2a, run_w2a_async, W2AConfig, W2AResult
+from OCRB.workloads.w3_leader_election import run_w3a, W3AConfig, W3AResult
 from pathlib import Path
-from OCRB.metrics.arr import compute_arr
-from OCRB.metrics.cfr import compute_cfr
-from OCRB.metrics.gds import compute_gds
-from OCRB.metrics.ist import compute_ist
-from OCRB.metrics.rec import compute_rec
-from OCRB.metrics.ori import compute_ori
+from OCRB.metrics.fused import BaselineTotals, measure_baseline
+from OCRB.metrics.online import ProxyAccumulator
 
 from OCRB.report.schema import (
     RunRecord,
@@ -23,12 +44,19 @@ from OCRB.report.schema import (
     AggregateSummary,
 )
 from OCRB.report.writer import (
+    _jsonify,
     write_manifest,
+    write_run_profile,
     write_run_record,
     write_aggregate_summary,
     write_disclosure,
 )
 from OCRB.stats.aggregate import summarize
+from OCRB.stress.base import CRASH, StressTimeline, compile_timeline, scale_stress
+from OCRB.stress.bitflip import check_bit_flips, emit_bit_flips, inject_bit_flips
+from OCRB.stress.network import MessageBus, NetworkProfile
+from OCRB.stress.power import START_METHODS, SupervisedRun, power_cuts, supervise
+from OCRB.stress.thermal import ThermalCycle, phase_evidence
 
 
 def run_benchmark(
@@ -45,15 +73,177 @@ def run_benchmark(
     gds_levels: Optional[List[float]] = None,
     isolation_duration_declared: Optional[float] = None,
     C_total: Optional[int] = None,
+    # execution options
+    workers: Optional[int] = None,
+    clock: Optional[str] = None,
+    stream_events: bool = False,
+    resume: bool = False,
+    baseline_cache_dir: Optional[str] = None,
+    async_runs: bool = False,
+    checkpoint_backend: Optional[str] = None,
+    w2a_config: Optional[Dict[str, Any]] = None,
+    w3a_config: Optional[Dict[str, Any]] = None,
+    supervised: Optional[str] = None,
+    resource_dimension: Optional[str] = None,
+    profile: Optional[List[str]] = None,
+    profile_runs: Optional[List[int]] = None,
+    profile_top_n: int = 20,
+    gds_level_runs: bool = True,
 ) -> None:
     """
-    Reference runner: generates manifest, executes N runs (placeholder workload),
+    Reference runner: generates manifest, executes N runs of the workload,
     computes proxies from events/evidence, writes per-run + aggregate reports.
 
-    NOTE: Workload execution is a stub right now. This runner is meant to be
-    integrated with actual workloads later. The point is the reporting + math pipeline.
+    W1-A, W2-A and W3-A execute the real workloads (OCRB.workloads); other
+    workload ids fall back to fixed placeholder evidence.
+
+    workers: run in a process pool of this size (records match the serial path).
+    clock: None (fixed timestamps), "system" or "simulated" (OCRB.measure.clock).
+    stream_events: stream events to events/run_NN.jsonl instead of the record.
+    resume: skip runs whose runs/run_NN.json carries a matching run_key.
+    baseline_cache_dir: cache of measured SP-0 baselines, reused across invocations.
+    async_runs: run all runs as coroutines on one event loop (not with workers > 1).
+    checkpoint_backend: W2-A checkpoint storage, see OCRB.workloads.checkpoint.
+    w2a_config: W2AConfig overrides; part of the run key and the baseline key.
+    w3a_config: W3AConfig overrides, handled like w2a_config.
+    supervised: W2-A in a child process of OCRB.stress.power ("forkserver" or "spawn").
+    resource_dimension: metered resource REC normalizes by (None: workload evidence).
+    profile: profilers to wrap runs with, see OCRB.measure.profiling.
+    profile_runs: run indices to profile (default: every run executed).
+    profile_top_n: hot functions and allocation sites kept per profile.
+    gds_levels: stress levels each run is also executed at (1 + len(gds_levels) runs).
+    gds_level_runs: False reports GDS from each run's declared stress alone.
     """
 
+    if async_runs and workers is not None and workers > 1:
+        raise ValueError("async_runs and workers > 1 are mutually exclusive")
+    if async_runs and supervised:
+        raise ValueError("async_runs and supervised are mutually exclusive")
+    if async_runs and profile:
+        raise ValueError("async_runs and profile are mutually exclusive")
+
+    plan = _plan_benchmark(
+        out_dir=out_dir,
+        workload_id=workload_id,
+        workload_version=workload_version,
+        stress_profile_id=stress_profile_id,
+        stress_parameters=stress_parameters,
+        execution_environment=execution_environment,
+        master_seed=master_seed,
+        n_runs=n_runs,
+        gds_levels=gds_levels,
+        isolation_duration_declared=isolation_duration_declared,
+        C_total=C_total,
+        clock=clock,
+        stream_events=stream_events,
+        resume=resume,
+        baseline_cache_dir=baseline_cache_dir,
+        checkpoint_backend=checkpoint_backend,
+        w2a_config=w2a_config,
+        w3a_config=w3a_config,
+        supervised=supervised,
+        resource_dimension=resource_dimension,
+        profile=profile,
+        profile_runs=profile_runs,
+        profile_top_n=profile_top_n,
+        gds_level_runs=gds_level_runs,
+    )
+    ctx = plan.ctx
+    todo = plan.todo
+
+    # Runs depend only on (manifest seeds, run index), so they may execute in any
+    # process; results are consumed in run-index order either way.
+    with ExitStack() as stack:
+        parallel = workers is not None and workers > 1 and len(todo) > 1
+        if todo and not parallel and _has_level_runs(ctx):
+            # GDS level runs of this invocation; shut down with it
+            ctx = replace(ctx, level_pool=stack.enter_context(
+                _gds_level_pool(ctx, concurrent_runs=len(todo) if async_runs else 1)
+            ))
+        if async_runs:
+            records: Iterable[RunRecord] = _execute_runs_async(ctx, todo, plan.run_keys)
+        elif parallel:
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=min(workers, len(todo))))
+            records = pool.map(
+                _execute_run, repeat(ctx), todo, [plan.run_keys[i] for i in todo]
+            )
+        else:
+            records = (_execute_run(ctx, i, plan.run_keys[i]) for i in todo)
+        _finish_benchmark(plan, records)
+
+
+@dataclass(frozen=True)
+class _BenchmarkPlan:
+    """
+    A benchmark with its manifest and baseline written and its runs keyed:
+    `todo` lists the run indices still to execute, `cached` the proxies of
+    runs reused from an earlier invocation (resume).
+    """
+    ctx: "_RunContext"
+    n_runs: int
+    run_keys: Dict[int, str]
+    cached: Dict[int, ProxyValues]
+    todo: List[int]
+
+
+def _plan_benchmark(
+    *,
+    out_dir: str,
+    workload_id: str,
+    workload_version: str,
+    stress_profile_id: str,
+    stress_parameters: Dict[str, Any],
+    execution_environment: Dict[str, Any],
+    master_seed: int,
+    n_runs: int,
+    gds_levels: Optional[List[float]],
+    isolation_duration_declared: Optional[float],
+    C_total: Optional[int],
+    clock: Optional[str],
+    stream_events: bool,
+    resume: bool,
+    baseline_cache_dir: Optional[str],
+    checkpoint_backend: Optional[str] = None,
+    w2a_config: Optional[Dict[str, Any]] = None,
+    w3a_config: Optional[Dict[str, Any]] = None,
+    supervised: Optional[str] = None,
+    resource_dimension: Optional[str] = None,
+    profile: Optional[List[str]] = None,
+    profile_runs: Optional[List[int]] = None,
+    profile_top_n: int = 20,
+    gds_level_runs: bool = True,
+) -> _BenchmarkPlan:
+    check_resource_dimension(resource_dimension)
+    profilers = check_profilers(profile or ())
+    if profile_runs is not None and not all(1 <= i <= n_runs for i in profile_runs):
+        raise ValueError(f"profile_runs must be run indices in 1..{n_runs}, got {profile_runs}")
+    if profile_top_n < 1:
+        raise ValueError("profile_top_n must be >= 1")
+    unknown = sorted(set(w2a_config or {}) - set(W2AConfig.__dataclass_fields__))
+    if unknown:
+        raise ValueError(f"Unknown W2AConfig fields: {unknown}")
+    unknown = sorted(set(w3a_config or {}) - set(W3AConfig.__dataclass_fields__))
+    if unknown:
+        raise ValueError(f"Unknown W3AConfig fields: {unknown}")
+    if workload_id != "W3-A":
+        w3a_config = None
+    if workload_id == "W2-A":
+        checkpoint_backend = (
+            checkpoint_backend
+            or (w2a_config or {}).get("checkpoint_backend")
+            or W2AConfig().checkpoint_backend
+        )
+        if checkpoint_backend not in CHECKPOINT_BACKENDS:
+            raise ValueError(
+                f"Unknown checkpoint backend: {checkpoint_backend!r} (expected one of {CHECKPOINT_BACKENDS})"
+            )
+        check_bit_flips(stress_parameters.get("SR-1"))
+    else:
+        checkpoint_backend = None
+        w2a_config = None
+    if supervised:
+        _check_supervised(supervised, workload_id, stress_parameters, checkpoint_backend, clock)
+
     manifest = create_manifest(
         workload_id=workload_id,
         workload_version=workload_version,
@@ -61,10 +251,80 @@ def run_benchmark(
         stress_parameters=stress_parameters,
         execution_environment=execution_environment,
         master_seed=master_seed,
+        checkpoint_backend=checkpoint_backend,
+    )
+    manifest_dict = _manifest_identity(manifest)
+    if not (resume and _existing_manifest_identity(out_dir) == manifest_dict):
+        write_manifest(out_dir, manifest)
+
+    ctx = _RunContext(
+        out_dir=out_dir,
+        workload_id=workload_id,
+        stress_parameters=stress_parameters,
+        seeds=manifest.seeds,
+        gds_levels=gds_levels,
+        isolation_duration_declared=isolation_duration_declared,
+        C_total=C_total,
+        baseline=BaselineTotals(work=0.0, resources=0.0),  # resolved below, using this context
+        clock=clock,
+        stream_events=stream_events,
+        checkpoint_backend=checkpoint_backend,
+        w2a_config=w2a_config,
+        w3a_config=w3a_config,
+        supervised=supervised,
+        resource_dimension=resource_dimension,
+        profilers=profilers,
+        profile_runs=sorted(set(profile_runs)) if profile_runs is not None else None,
+        profile_top_n=profile_top_n,
+        gds_level_runs=gds_level_runs,
+    )
+    baseline, _ = _resolve_baseline(
+        ctx,
+        workload_version=workload_version,
+        execution_environment=execution_environment,
+        cache_dir=baseline_cache_dir,
+        resume=resume,
     )
-    write_manifest(out_dir, manifest)
+    ctx = replace(ctx, baseline=baseline)
+
+    run_indices = range(1, n_runs + 1)
+    run_keys = {i: _run_key(manifest_dict, ctx, i) for i in run_indices}
+    cached: Dict[int, ProxyValues] = {}
+    if resume:
+        for i in run_indices:
+            proxies = _cached_run_proxies(out_dir, i, run_keys[i])
+            if proxies is not None:
+                cached[i] = proxies
+    todo = [i for i in run_indices if i not in cached]
+    return _BenchmarkPlan(ctx=ctx, n_runs=n_runs, run_keys=run_keys, cached=cached, todo=todo)
+
+
+def _check_supervised(
+    supervised: str,
+    workload_id: str,
+    stress_parameters: Dict[str, Any],
+    checkpoint_backend: Optional[str],
+    clock: Optional[str],
+) -> None:
+    if supervised not in START_METHODS:
+        raise ValueError(f"Unknown start method: {supervised!r} (expected one of {START_METHODS})")
+    if workload_id != "W2-A":
+        raise ValueError(f"supervised runs are implemented for W2-A only, not {workload_id!r}")
+    if checkpoint_backend == "memory":
+        raise ValueError("supervised runs need a durable checkpoint backend, not 'memory'")
+    if clock == "simulated":
+        raise ValueError("supervised runs execute in real time; use clock='system' or None")
+    sr4 = set(stress_parameters.get("SR-4") or {}) - {"loss"}
+    if sr4 or "bit_flip_rate" in (stress_parameters.get("SR-1") or {}):
+        raise ValueError("supervised runs support neither SR-4 network profiles nor SR-1 bit flips")
+
 
-    run_records: List[RunRecord] = []
+def _finish_benchmark(plan: _BenchmarkPlan, records: Iterable[RunRecord]) -> None:
+    """
+    Write the records of plan.todo (given in that order) and the aggregate
+    summary and disclosure.
+    """
+    out_dir = plan.ctx.out_dir
 
     # Proxy series for aggregation
     gds_series: List[Optional[float]] = []
@@ -74,181 +334,1119 @@ def run_benchmark(
     cfr_series: List[Optional[float]] = []
     ori_series: List[Optional[float]] = []
 
-    # For REC, we need a baseline record. For now we generate a stub baseline.
-    # Later: baseline runs should be actual SP-0 executions.
-    baseline_log = _stub_baseline_events(workload_id)
+    executed = iter(records)
 
-    # External dependency switch (runner-owned; stress layer will control this later)
-    external_available = True
+    # Records are written and dropped one at a time; only proxy series are kept.
+    for i in range(1, plan.n_runs + 1):
+        if i in plan.cached:
+            proxies = plan.cached[i]
+        else:
+            record = next(executed)
+            write_run_record(out_dir, i, record)
+            proxies = record.proxies
 
-    def external_call():
-        if not external_available:
-            raise RuntimeError("isolated")
+        # Series
+        gds_series.append(proxies.gds)
+        arr_series.append(proxies.arr)
+        ist_series.append(proxies.ist)
+        rec_series.append(proxies.rec)
+        cfr_series.append(proxies.cfr)
+        ori_series.append(proxies.ori)
+
+    # Aggregate summaries
+    def _agg(vals: List[Optional[float]]) -> AggregateStats:
+        s = summarize(vals)
+        return AggregateStats(
+            mean=s.mean, std=s.std,
+            ci95_low=s.ci95_low, ci95_high=s.ci95_high,
+            n_included=s.n_included, n_na=s.n_na
+        )
+
+    summary = AggregateSummary(
+        gds=_agg(gds_series),
+        arr=_agg(arr_series),
+        ist=_agg(ist_series),
+        rec=_agg(rec_series),
+        cfr=_agg(cfr_series),
+        ori=_agg(ori_series),
+    )
+    write_aggregate_summary(out_dir, summary)
+
+    write_disclosure(out_dir, _default_disclosure_text(plan.ctx))
+
+    if plan.ctx.profilers:
+        _record_profiling(plan)
+
+
+def _record_profiling(plan: _BenchmarkPlan) -> None:
+    """
+    Record the profilers and their overhead in manifest.json: the capture
+    cost of each run profiled by this invocation (from its profile) and the
+    profilers' slowdown on the calibration loop.
+    """
+    ctx = plan.ctx
+    out = Path(ctx.out_dir)
+    runs = {
+        f"run_{i:02d}": json.loads((out / "runs" / f"run_{i:02d}.profile.json").read_text())["overhead"]
+        for i in plan.todo
+        if _profiled(ctx, i)
+    }
+    manifest = json.loads((out / "manifest.json").read_text())
+    manifest["profiling"] = {
+        "profilers": list(ctx.profilers),
+        "top_n": ctx.profile_top_n,
+        "runs": runs,
+        "calibration": calibrate_overhead(ctx.profilers),
+    }
+    write_manifest(ctx.out_dir, manifest)
+
+
+@dataclass(frozen=True)
+class _RunContext:
+    """
+    Per-benchmark inputs shared by every run. Picklable so that runs can be
+    executed in worker processes.
+    """
+    out_dir: str
+    workload_id: str
+    stress_parameters: Dict[str, Any]
+    seeds: StressSeeds
+    gds_levels: Optional[List[float]]
+    isolation_duration_declared: Optional[float]
+    C_total: Optional[int]
+    baseline: BaselineTotals
+    clock: Optional[str] = None
+    stream_events: bool = False
+    reference_crashes: bool = True       # W2-A reference crash points (off for the SP-0 baseline)
+    checkpoint_backend: Optional[str] = None  # W2-A; None = W2AConfig default
+    w2a_config: Optional[Dict[str, Any]] = None  # W2AConfig overrides
+    w3a_config: Optional[Dict[str, Any]] = None  # W3AConfig overrides
+    supervised: Optional[str] = None     # W2-A in a supervised child process (start method)
+    resource_dimension: Optional[str] = None  # REC normalization; None = resources_used evidence
+    profilers: Tuple[str, ...] = ()      # OCRB.measure.profiling; () = no run is profiled
+    profile_runs: Optional[List[int]] = None  # profiled run indices; None = every run
+    profile_top_n: int = 20
+    gds_level_runs: bool = True          # False: GDS from the main run at its declared stress only
+    level_pool: Optional[Executor] = None  # GDS level runs; owned by the invoking process
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The level pool stays behind when the context is sent to a worker
+        state = dict(self.__dict__)
+        state.pop("level_pool", None)
+        return state
+
+
+def _workload_config(ctx: _RunContext) -> Dict[str, Any]:
+    """
+    Workload parameters used by the reference runner (part of the run key).
+    """
+    if ctx.workload_id == "W1-A":
+        return asdict(W1AConfig())
+    if ctx.workload_id == "W2-A":
+        config = asdict(_w2a_config(ctx))
+        if ctx.supervised:
+            config["supervised"] = ctx.supervised
+        return config
+    if ctx.workload_id == "W3-A":
+        return asdict(_w3a_config(ctx))
+    return {}
+
+
+def _w2a_config(ctx: _RunContext) -> W2AConfig:
+    overrides = dict(ctx.w2a_config or {})
+    if ctx.checkpoint_backend:
+        overrides["checkpoint_backend"] = ctx.checkpoint_backend
+    return W2AConfig(**overrides)
+
+
+def _w3a_config(ctx: _RunContext) -> W3AConfig:
+    return W3AConfig(**(ctx.w3a_config or {}))
+
+
+def _run_seed(ctx: _RunContext, i: int) -> Optional[int]:
+    """
+    Workload seed for run i, derived from the manifest seeds.
+    """
+    if ctx.workload_id == "W1-A":
+        return ctx.seeds.sr1 + i
+    if ctx.workload_id == "W2-A":
+        return ctx.seeds.sr2 + i
+    if ctx.workload_id == "W3-A":
+        return ctx.seeds.sr3 + i
+    return None
+
+
+def _manifest_identity(manifest: Any) -> Dict[str, Any]:
+    d = _jsonify(manifest)
+    d.pop("timestamp_utc", None)
+    d.pop("profiling", None)
+    return d
+
+
+def _existing_manifest_identity(out_dir: str) -> Optional[Dict[str, Any]]:
+    path = Path(out_dir) / "manifest.json"
+    try:
+        return _manifest_identity(json.loads(path.read_text()))
+    except (OSError, ValueError):
         return None
 
-    def should_crash(seed: int, stage: int) -> bool:
-        crash_stages = {(seed % 37) % 50, (seed % 53) % 50}
-        return stage in crash_stages
 
-    for i in range(1, n_runs + 1):
-        # Use real W1-A workload when requested, otherwise fall back to stub
-        if workload_id == "W1-A":
-            run_seed = manifest.seeds.sr1 + i
-            log = EventLog(run_id=f"run-{i:02d}", workload_id=workload_id)
-            log.emit(EventType.RUN_START, t_utc=1000.0)
+def _run_key(manifest_identity: Dict[str, Any], ctx: _RunContext, i: int) -> str:
+    """
+    Content address of run i: everything that determines its record apart
+    from timestamps and durations.
+    """
+    payload = {
+        "manifest": manifest_identity,
+        "workload_config": _workload_config(ctx),
+        "run_index": i,
+        "run_seed": _run_seed(ctx, i),
+        "gds_levels": ctx.gds_levels,
+        # Levels are executed at scaled stress, not reported from the main run
+        "gds_level_stress": (
+            [scale_stress(ctx.stress_parameters, s) for s in ctx.gds_levels] if _has_level_runs(ctx) else None
+        ),
+        "isolation_duration_declared": ctx.isolation_duration_declared,
+        "C_total": ctx.C_total,
+        "baseline": asdict(ctx.baseline),
+        "clock": ctx.clock,
+        "stream_events": ctx.stream_events,
+        "resource_dimension": ctx.resource_dimension,
+    }
+    blob = json.dumps(_jsonify(payload), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
 
-            # Real execution
-            res = run_w1a(tasks=100, work_units_per_task=2000, seed=run_seed)
-            completion_rate = res.tasks_completed / res.tasks_total if res.tasks_total else 0.0
 
-            # For GDS: emit one completion observation per stress level
-            if gds_levels:
-                for s in gds_levels:
-                    log.emit(EventType.WORK_UNIT_END, stress_level=s, completion_rate=completion_rate)
+def _cached_run_proxies(out_dir: str, i: int, run_key: str) -> Optional[ProxyValues]:
+    """
+    Proxies of an existing runs/run_NN.json if it was produced under run_key.
+    """
+    path = Path(out_dir) / "runs" / f"run_{i:02d}.json"
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("run_key") != run_key:
+        return None
+    return ProxyValues(**data["proxies"])
 
-            # For REC: log work and resources (resources_used is a placeholder)
-            log.emit(EventType.WORK_UNIT_END, work_done=res.work_done, resources_used=res.duration_s)
 
-            # Note: do not emit ARR/IST/CFR evidence here for W1-A —
-            # these proxies are not meaningfully exercised by SP-0 W1-A.
+def prepare_baseline(
+    *,
+    workload_id: str,
+    workload_version: str,
+    execution_environment: Dict[str, Any],
+    cache_dir: str,
+    clock: Optional[str] = None,
+) -> BaselineTotals:
+    """
+    Measure (or load) the SP-0 baseline run_benchmark would use for this
+    workload and store it in cache_dir, so later benchmarks sharing the
+    cache skip the measurement.
+    """
+    return _prepare_baseline(
+        workload_id=workload_id,
+        workload_version=workload_version,
+        execution_environment=execution_environment,
+        cache_dir=cache_dir,
+        clock=clock,
+    )[0]
 
-            log.emit(EventType.RUN_END, t_utc=1080.0)
-        elif workload_id == "W2-A":
-            run_index = i
-            run_seed = manifest.seeds.sr2 + i
-            log = EventLog(run_id=f"run-{i:02d}", workload_id=workload_id)
-            log.emit(EventType.RUN_START, t_utc=1000.0)
 
-            run_dir = str(Path(out_dir) / "w2_state" / f"run_{run_index:02d}")
+def _prepare_baseline(
+    *,
+    workload_id: str,
+    workload_version: str,
+    execution_environment: Dict[str, Any],
+    cache_dir: str,
+    clock: Optional[str] = None,
+) -> Tuple[BaselineTotals, float]:
+    """
+    prepare_baseline, also returning the real wall time the SP-0 execution
+    took (measured or cached).
+    """
+    ctx = _RunContext(
+        out_dir=cache_dir,
+        workload_id=workload_id,
+        stress_parameters={},
+        seeds=StressSeeds(sr1=0, sr2=0, sr3=0, sr4=0, sr5=0),
+        gds_levels=None,
+        isolation_duration_declared=None,
+        C_total=None,
+        baseline=BaselineTotals(work=0.0, resources=0.0),
+        clock=clock,
+    )
+    totals, wall_s = _resolve_baseline(
+        ctx,
+        workload_version=workload_version,
+        execution_environment=execution_environment,
+        cache_dir=cache_dir,
+        resume=False,
+        write_report=False,
+    )
+    assert wall_s is not None  # the cache only serves records with a wall time
+    return totals, wall_s
 
-            iso_start = 1010.0
-            iso_end = iso_start + float(isolation_duration_declared) if isolation_duration_declared else iso_start
 
-            if "SR-5" in stress_parameters:
-                log.emit(EventType.ISOLATION_START, t_utc=iso_start)
-                external_available = False
+def _resolve_baseline(
+    ctx: _RunContext,
+    *,
+    workload_version: str,
+    execution_environment: Dict[str, Any],
+    cache_dir: Optional[str],
+    resume: bool,
+    write_report: bool = True,
+) -> Tuple[BaselineTotals, Optional[float]]:
+    """
+    SP-0 baseline totals for REC: reused from the report (resume) or the
+    cache when the key matches, otherwise measured. Recorded in
+    <out_dir>/baseline.json unless write_report is False. Also returns the
+    real wall time of the SP-0 execution (None for a reused report that
+    predates its recording).
+    """
+    material = baseline_key_material(
+        workload_id=ctx.workload_id,
+        workload_version=workload_version,
+        workload_config=_workload_config(ctx),
+        execution_environment=execution_environment,
+        clock=ctx.clock,
+        resource_dimension=ctx.resource_dimension,
+    )
+    key = baseline_key(material)
+    report_path = Path(ctx.out_dir) / "baseline.json"
+
+    totals: Optional[BaselineTotals] = None
+    wall_s: Optional[float] = None
+    source = "measured"
+    if resume:
+        totals = load_baseline(report_path, key)
+        wall_s = baseline_wall_s(report_path, key)
+        source = "report"
+    if totals is None and cache_dir:
+        path = cached_baseline_path(cache_dir, key)
+        wall_s = baseline_wall_s(path, key)
+        # Records without a wall time predate it and are measured again
+        totals = load_baseline(path, key) if wall_s is not None else None
+        source = "cache"
+    if totals is None:
+        t0 = time.perf_counter()
+        totals = _measure_sp0_baseline(ctx)
+        wall_s = time.perf_counter() - t0
+        source = "measured"
+        if cache_dir:
+            store_baseline(cached_baseline_path(cache_dir, key), key, material, totals, source, wall_s)
+
+    if write_report:
+        store_baseline(report_path, key, material, totals, source, wall_s)
+    return totals, wall_s
+
+
+def _measure_sp0_baseline(ctx: _RunContext) -> BaselineTotals:
+    """
+    Execute the workload once under SP-0 (no stressors or injected crashes,
+    fixed zero seeds) and sum its work/resources evidence. Workloads without a real implementation
+    fall back to the stub baseline.
+    """
+    if ctx.workload_id not in ("W1-A", "W2-A", "W3-A"):
+        return measure_baseline(_stub_baseline_events(ctx.workload_id).events, ctx.resource_dimension)
+
+    with tempfile.TemporaryDirectory(prefix="ocrb-baseline-") as tmp:
+        sp0 = replace(
+            ctx,
+            out_dir=tmp,
+            stress_parameters={},
+            seeds=StressSeeds(sr1=0, sr2=0, sr3=0, sr4=0, sr5=0),
+            gds_levels=None,
+            stream_events=False,
+            reference_crashes=False,
+        )
+        # Same clock kind as the runs, so E_base and E_stress share a time base.
+        clock = make_clock(ctx.clock) if ctx.clock else None
+        log = EventLog(run_id="baseline", workload_id=ctx.workload_id, clock=clock)
+        _reset_peak(ctx)
+        _run_workload(sp0, 0, log, clock)
+        return measure_baseline(log.events, ctx.resource_dimension)
+
+
+def _run_workload(ctx: _RunContext, i: int, log: EventLog, clock: Optional[Clock]) -> None:
+    """
+    Execute the workload for run i and emit its evidence into log.
+    """
+    # Use real W1-A workload when requested, otherwise fall back to stub
+    if ctx.workload_id == "W1-A":
+        run_seed = _run_seed(ctx, i)
+        log.emit(EventType.RUN_START, t_utc=None if clock else 1000.0)
+
+        # Real execution (one stress tick per task)
+        w1_cfg = W1AConfig()
+        timeline = compile_timeline(ctx.stress_parameters, ctx.seeds, horizon=w1_cfg.tasks, run_index=i)
+        thermal = ThermalCycle.from_sr2(ctx.stress_parameters.get("SR-2"), seed=ctx.seeds.sr2 + i)
+        levels = _submit_gds_levels(ctx, i)
+        with _meter(ctx) as meter:
+            res = run_w1a(
+                tasks=w1_cfg.tasks,
+                work_units_per_task=w1_cfg.work_units_per_task,
+                seed=run_seed,
+                timeline=timeline,
+                thermal=thermal,
+            )
+        if levels or _main_run_gds(ctx):
+            # For GDS: the completion rate measured at each declared level
+            for s, rate in _gds_evidence(ctx, [f.result() for f in levels], _w1a_rate(res)):
+                log.emit(EventType.WORK_UNIT_END, stress_level=s, completion_rate=rate)
+        elif thermal is not None:
+            # For GDS: throughput in each phase of the SR-2 cycle, at that
+            # phase's throttling level
+            for k, level, rate in phase_evidence(thermal, res.phase_stats):
+                log.emit(
+                    EventType.WORK_UNIT_END,
+                    stress_level=level,
+                    completion_rate=rate,
+                    meta={"phase": k, "units": res.phase_stats.units[k], "wall_s": res.phase_stats.wall_s[k]},
+                )
+
+        # For REC: log work, wall time and the metered resources
+        log.emit(
+            EventType.WORK_UNIT_END,
+            work_done=res.work_done,
+            resources_used=res.duration_s,
+            resources=_metered(ctx, meter.usage),
+        )
+
+        # Note: do not emit ARR/IST/CFR evidence here for W1-A —
+        # these proxies are not meaningfully exercised by SP-0 W1-A.
+
+        log.emit(EventType.RUN_END, t_utc=None if clock else 1080.0)
+    elif ctx.workload_id == "W2-A":
+        w2 = _w2a_prepare(ctx, i, log, clock)
+        sup: Optional[SupervisedRun] = None
+        with _meter(ctx) as meter:
+            if ctx.supervised:
+                res, sup = _w2a_supervised(ctx, i, w2)
             else:
-                external_available = True
+                res = run_w2a(
+                    run_dir=w2.run_dir,
+                    seed=w2.run_seed,
+                    cfg=w2.cfg,
+                    external_call=w2.external.call if w2.external else _external_call,
+                    clock=clock,
+                    timeline=w2.timeline,
+                    checkpoint_store=w2.store,
+                    state_faults=w2.state_faults,
+                    initial_state=w2.initial_state,
+                )
+            if w2.isolated and clock and not res.failed:
+                # Survived: wait out the remainder of the isolation window.
+                clock.sleep(w2.iso_end - clock.now())
+        usage = meter.usage
+        if sup is not None and sup.resources is not None:
+            # The supervisor mostly waits; the work happens in its children
+            usage = replace(usage + sup.resources, wall_s=usage.wall_s)
+        _w2a_report(ctx, log, clock, w2, res, [f.result() for f in w2.gds_levels], usage, sup)
 
-            cfg = W2AConfig()
+    elif ctx.workload_id == "W3-A":
+        run_seed = _run_seed(ctx, i)
+        log.emit(EventType.RUN_START, t_utc=None if clock else 1000.0)
+        isolated = "SR-5" in ctx.stress_parameters
+        iso_start, iso_end = _isolation_bounds(ctx, clock)
+        if isolated:
+            log.emit(EventType.ISOLATION_START, t_utc=iso_start)
 
-            res = run_w2a(
-                run_dir=run_dir,
+        cfg = _w3a_config(ctx)
+        levels = _submit_gds_levels(ctx, i)
+        with _meter(ctx) as meter:
+            res = run_w3a(
                 seed=run_seed,
                 cfg=cfg,
-                external_call=external_call,
-                should_crash=should_crash,
+                timeline=_w3a_timeline(ctx, i, cfg),
+                network=NetworkProfile.from_sr4(ctx.stress_parameters.get("SR-4"), base=cfg.network),
+                network_seed=_network_seed(ctx, i),
             )
+        if isolated and clock and not res.failed:
+            clock.sleep(iso_end - clock.now())
+        _w3a_report(ctx, log, clock, res, isolated, iso_end, [f.result() for f in levels], meter.usage)
+
+    else:
+        _stub_workload_events(log)
 
-            if "SR-5" in stress_parameters:
-                external_available = True
-                log.emit(EventType.ISOLATION_END, t_utc=iso_end)
 
-            completion_rate = res.stages_completed / res.stages_total if res.stages_total else 0.0
-            if gds_levels:
-                for s in gds_levels:
-                    log.emit(EventType.WORK_UNIT_END, stress_level=s, completion_rate=completion_rate)
+@dataclass(frozen=True)
+class _W2ARun:
+    run_dir: str
+    run_seed: int
+    cfg: W2AConfig
+    timeline: StressTimeline
+    isolated: bool
+    iso_end: float
+    store: CheckpointStore
+    external: Optional["_ExternalLink"] = None    # SR-4 route to the external dependency
+    state_faults: Optional[Callable[[int, bytearray], List[int]]] = None  # SR-1 bit flips in the state payload
+    initial_state: Optional[bytes] = None          # shared by the run and its GDS level runs
+    gds_levels: List[Future] = field(default_factory=list)  # completion rate per declared level
 
-            for j in range(res.restarts):
-                log.emit(EventType.FAILURE, failure_id=f"crash_{j}", failure_class=FailureClass.AUTONOMOUSLY_RECOVERED)
 
-            if res.failed:
-                log.emit(EventType.FAILURE, failure_id="terminal", failure_class=FailureClass.RECOVERABLE_NOT_RECOVERED)
+def _w2a_prepare(ctx: _RunContext, i: int, log: EventLog, clock: Optional[Clock]) -> _W2ARun:
+    """
+    W2-A run setup: clean state directory, isolation window and stress
+    timeline. Emits RUN_START (and ISOLATION_START under SR-5).
+    """
+    run_seed = _run_seed(ctx, i)
+    log.emit(EventType.RUN_START, t_utc=None if clock else 1000.0)
 
-            log.emit(EventType.WORK_UNIT_END, work_done=res.stages_completed, resources_used=res.duration_s)
+    cfg = _w2a_config(ctx)
+    run_dir, slot_file = _w2a_store_paths(ctx, i)
+    store = open_checkpoint_store(
+        cfg.checkpoint_backend,
+        run_dir,
+        fsync=cfg.checkpoint_fsync,
+        fsync_batch=cfg.checkpoint_fsync_batch,
+        compact_every=cfg.checkpoint_compact_every,
+        slot_file=slot_file,
+        slot=i,
+    )
+    # A (re)executed run starts from clean state: a checkpoint left by an
+    # interrupted attempt would otherwise resume it mid-pipeline.
+    store.clear()
 
-        else:
-            log = _stub_workload_events(run_id=f"run-{i:02d}", workload_id=workload_id)
-
-        # Compute proxies
-        gds = compute_gds(log.events, expected_levels=gds_levels) if gds_levels else compute_gds(log.events)
-        arr = compute_arr(log.events)
-        ist = compute_ist(log.events, isolation_duration_declared=isolation_duration_declared)
-        rec = compute_rec(baseline_log.events, log.events)
-        cfr = compute_cfr(log.events, C_total=C_total)
-
-        proxies = {
-            "gds": gds.gds,
-            "arr": arr.arr,
-            "ist": ist.ist,
-            "rec": rec.rec,
-            "cfr": cfr.cfr,
-        }
-        ori = compute_ori(proxies)
-
-        # Collect N/A reasons
-        na_reasons: Dict[str, str] = {}
-        if gds.na_reason: na_reasons["gds"] = gds.na_reason
-        if arr.na_reason: na_reasons["arr"] = arr.na_reason
-        if ist.na_reason: na_reasons["ist"] = ist.na_reason
-        if rec.na_reason: na_reasons["rec"] = rec.na_reason
-        if cfr.na_reason: na_reasons["cfr"] = cfr.na_reason
-        if ori.na_reason: na_reasons["ori"] = ori.na_reason
-
-        record = RunRecord(
-            run_id=log.run_id,
-            workload_id=workload_id,
-            seeds=asdict(manifest.seeds),
-            start_utc=log.events[0].t_utc,
-            end_utc=log.events[-1].t_utc,
-            proxies=ProxyValues(
-                gds=gds.gds,
-                arr=arr.arr,
-                ist=ist.ist,
-                rec=rec.rec,
-                cfr=cfr.cfr,
-                ori=ori.ori,
-            ),
-            evidence=ProxyEvidence(
-                stress_levels=gds.stress_levels,
-                completion_rates=gds.completion_rates,
-                Fr=arr.Fr,
-                Fa=arr.Fa,
-                isolation_duration=isolation_duration_declared,
-                survival_time=ist.survival_time_observed,
-                E_base=rec.E_base,
-                E_stress=rec.E_stress,
-                baseline_completion_ok=None,
-                C_total=C_total,
-                C_local=cfr.C_local,
+    isolated = "SR-5" in ctx.stress_parameters
+    iso_start, iso_end = _isolation_bounds(ctx, clock)
+    if isolated:
+        log.emit(EventType.ISOLATION_START, t_utc=iso_start)
+
+    initial_state = None
+    if cfg.has_state and _has_level_runs(ctx):
+        initial_state = bytes(PipelineState(run_seed, initial_bytes=cfg.state_initial_bytes).data)
+    return _W2ARun(
+        run_dir=run_dir, run_seed=run_seed, cfg=cfg, timeline=_w2a_timeline(ctx, i, cfg), isolated=isolated,
+        iso_end=iso_end, store=store, external=_external_link(ctx, i, clock),
+        state_faults=_w2a_state_faults(ctx, i, cfg, log), initial_state=initial_state,
+        gds_levels=_submit_gds_levels(ctx, i, initial_state),
+    )
+
+
+def _w2a_timeline(ctx: _RunContext, i: int, cfg: W2AConfig) -> StressTimeline:
+    # One stress tick per stage. The reference crash points are part of the
+    # W2-A declaration and apply under every profile.
+    return compile_timeline(
+        ctx.stress_parameters,
+        ctx.seeds,
+        horizon=cfg.stages,
+        tick_s=cfg.stage_work_s,
+        run_index=i,
+        crash_points=_w2a_reference_crash_points(_run_seed(ctx, i), cfg) if ctx.reference_crashes else (),
+    )
+
+
+def _w3a_timeline(ctx: _RunContext, i: int, cfg: W3AConfig) -> StressTimeline:
+    # One stress tick per heartbeat interval
+    horizon = math.ceil(cfg.duration_s / cfg.heartbeat_s)
+    return compile_timeline(
+        ctx.stress_parameters,
+        ctx.seeds,
+        horizon=horizon,
+        tick_s=cfg.heartbeat_s,
+        run_index=i,
+        crash_points=_w3a_reference_crash_points(_run_seed(ctx, i), horizon) if ctx.reference_crashes else (),
+    )
+
+
+_LEVEL_WORKLOADS = ("W1-A", "W2-A", "W3-A")
+
+
+def _has_level_runs(ctx: _RunContext) -> bool:
+    return bool(ctx.gds_levels) and ctx.gds_level_runs and ctx.workload_id in _LEVEL_WORKLOADS
+
+
+def _main_run_gds(ctx: _RunContext) -> bool:
+    # GDS levels declared, but level runs disabled
+    return bool(ctx.gds_levels) and not ctx.gds_level_runs and ctx.workload_id in _LEVEL_WORKLOADS
+
+
+def _gds_evidence(ctx: _RunContext, level_rates: List[float], main_rate: float) -> List[Tuple[float, float]]:
+    """
+    (stress level, completion rate) GDS evidence of a run: the rate measured
+    at each declared level or, with level runs disabled, the main run's rate
+    at its declared stress (level 1.0).
+    """
+    if _main_run_gds(ctx):
+        return [(1.0, main_rate)]
+    return list(zip(ctx.gds_levels or (), level_rates))
+
+
+def _gds_level_pool(ctx: _RunContext, concurrent_runs: int) -> Executor:
+    """
+    Pool for the GDS level runs of `concurrent_runs` runs at a time: worker
+    processes for CPU-bound W1-A and W3-A (a simulation), one thread per
+    level run for W2-A (which mostly waits).
+    """
+    jobs = len(ctx.gds_levels) * concurrent_runs
+    if ctx.workload_id in ("W1-A", "W3-A"):
+        return ProcessPoolExecutor(max_workers=min(jobs, os.cpu_count() or 1))
+    return ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="ocrb-gds")
+
+
+def _submit_gds_levels(ctx: _RunContext, i: int, initial_state: Optional[bytes] = None) -> List[Future]:
+    """
+    Start run i at every declared GDS level on the level pool: one future
+    per level, resolving to the completion rate there.
+    """
+    if not _has_level_runs(ctx):
+        return []
+    if ctx.workload_id == "W1-A":
+        return [ctx.level_pool.submit(_w1a_level_rate, ctx, i, s) for s in ctx.gds_levels]
+    if ctx.workload_id == "W3-A":
+        return [ctx.level_pool.submit(_w3a_level_rate, ctx, i, s) for s in ctx.gds_levels]
+    return [ctx.level_pool.submit(_w2a_level_rate, ctx, i, s, initial_state) for s in ctx.gds_levels]
+
+
+def _w1a_level_rate(ctx: _RunContext, i: int, level: float) -> float:
+    """
+    W1-A completion rate of run i with its stress scaled to `level`, run as
+    the main run is. Under an SR-2 cycle the rate is discounted by the share
+    of time the run was throttled.
+    """
+    stress = scale_stress(ctx.stress_parameters, level)
+    cfg = W1AConfig()
+    res = run_w1a(
+        tasks=cfg.tasks,
+        work_units_per_task=cfg.work_units_per_task,
+        seed=_run_seed(ctx, i),
+        timeline=compile_timeline(stress, ctx.seeds, horizon=cfg.tasks, run_index=i),
+        thermal=ThermalCycle.from_sr2(stress.get("SR-2"), seed=ctx.seeds.sr2 + i),
+    )
+    return _w1a_rate(res)
+
+
+def _w1a_rate(res: W1AResult) -> float:
+    rate = res.tasks_completed / res.tasks_total if res.tasks_total else 0.0
+    return rate * res.phase_stats.busy_share() if res.phase_stats is not None else rate
+
+
+def _w2a_rate(res: W2AResult) -> float:
+    return res.stages_completed / res.stages_total if res.stages_total else 0.0
+
+
+def _w2a_level_rate(ctx: _RunContext, i: int, level: float, initial_state: Optional[bytes]) -> float:
+    """
+    W2-A completion rate of run i with its stress scaled to `level`: same
+    seed and crash points, SR-1 bit flips and SR-4 network as the main run,
+    checkpoints kept in memory, no evidence emitted.
+    """
+    scaled = replace(ctx, stress_parameters=scale_stress(ctx.stress_parameters, level))
+    cfg = replace(_w2a_config(ctx), checkpoint_backend="memory")
+    clock = make_clock(ctx.clock) if ctx.clock else None
+    link = _external_link(scaled, i, clock)
+    res = run_w2a(
+        run_dir="",
+        seed=_run_seed(ctx, i),
+        cfg=cfg,
+        external_call=link.call if link else _external_call,
+        clock=clock,
+        timeline=_w2a_timeline(scaled, i, cfg),
+        state_faults=_w2a_state_faults(scaled, i, cfg, None),
+        initial_state=initial_state,
+    )
+    return _w2a_rate(res)
+
+
+def _w3a_level_rate(ctx: _RunContext, i: int, level: float) -> float:
+    """
+    W3-A leader availability of run i with its stress scaled to `level`:
+    same seed, reference crash points and network seed as the main run.
+    """
+    scaled = replace(ctx, stress_parameters=scale_stress(ctx.stress_parameters, level))
+    cfg = _w3a_config(ctx)
+    res = run_w3a(
+        seed=_run_seed(ctx, i),
+        cfg=cfg,
+        timeline=_w3a_timeline(scaled, i, cfg),
+        network=NetworkProfile.from_sr4(scaled.stress_parameters.get("SR-4"), base=cfg.network),
+        network_seed=_network_seed(ctx, i),
+    )
+    return res.leader_availability
+
+
+def _w2a_store_paths(ctx: _RunContext, i: int) -> Tuple[str, str]:
+    # (run directory, shared mmap slot file) of run i's checkpoint
+    state_dir = Path(ctx.out_dir) / "w2_state"
+    return str(state_dir / f"run_{i:02d}"), str(state_dir / "checkpoints.slots")
+
+
+def _w2a_supervised(ctx: _RunContext, i: int, w2: _W2ARun) -> Tuple[W2AResult, SupervisedRun]:
+    """
+    Run i in a supervised child process with its crash ticks delivered as
+    signals. Checkpoint I/O is summed over every process of the run, and
+    the duration includes each cold restart.
+    """
+    w2.store.close()
+    run_dir, slot_file = _w2a_store_paths(ctx, i)
+    sup = supervise(
+        "OCRB.workloads.w2_stateful_pipeline:run_w2a_in_child",
+        dict(
+            run_dir=run_dir, seed=w2.run_seed, cfg=w2.cfg, timeline=w2.timeline.without(CRASH),
+            slot_file=slot_file, slot=i,
+        ),
+        power_cuts(w2.timeline, ctx.stress_parameters.get("SR-3")),
+        max_restarts=w2.cfg.max_restarts,
+        start_method=ctx.supervised,
+    )
+    io = list(sup.killed_info)
+    final: Optional[W2AResult] = sup.result
+    res = W2AResult(
+        stages_total=w2.cfg.stages,
+        stages_completed=final.stages_completed if final else sup.failed_stage,
+        restarts=len(sup.restarts),
+        duration_s=sup.duration_s,
+        failed=final.failed if final else True,
+        checkpoint_writes=sum(x.writes for x in io) + (final.checkpoint_writes if final else 0),
+        checkpoint_bytes=sum(x.bytes for x in io) + (final.checkpoint_bytes if final else 0),
+        checkpoint_write_s=sum(x.write_s for x in io) + (final.checkpoint_write_s if final else 0.0),
+        checkpoint_restores=sum(x.restores for x in io) + (final.checkpoint_restores if final else 0),
+        checkpoint_restore_s=sum(x.restore_s for x in io) + (final.checkpoint_restore_s if final else 0.0),
+        state_bytes=final.state_bytes if final else 0,
+        state_crc32=final.state_crc32 if final else 0,
+        checkpoint_size_bytes=final.checkpoint_size_bytes if final else 0,
+    )
+    return res, sup
+
+
+def _w2a_state_faults(
+    ctx: _RunContext, i: int, cfg: W2AConfig, log: Optional[EventLog]
+) -> Optional[Callable[[int, bytearray], List[int]]]:
+    """
+    SR-1 bit flips in the W2-A state payload, if SR-1 declares bit_flip_rate
+    (per bit per second): after each stage the payload has been exposed for
+    stage_work_s. Flips are seeded per (run, stage) and each one is emitted
+    as FAULT_INJECTED evidence into log, if given.
+    """
+    rate = float((ctx.stress_parameters.get("SR-1") or {}).get("bit_flip_rate", 0.0))
+    if rate <= 0.0 or not cfg.has_state:
+        return None
+    p = min(rate * cfg.stage_work_s, 1.0)
+    base_seed = (ctx.seeds.sr1 + i) * 1_000_003
+
+    def inject(stage: int, data: bytearray) -> List[int]:
+        flips = inject_bit_flips(data, p, base_seed + stage)
+        if log is not None:
+            emit_bit_flips(log, flips, component_id="w2a-state", meta={"stage": stage})
+        return flips.byte_offsets.tolist()
+
+    return inject
+
+
+def _w2a_report(
+    ctx: _RunContext,
+    log: EventLog,
+    clock: Optional[Clock],
+    w2: _W2ARun,
+    res: W2AResult,
+    gds_rates: List[float],
+    usage: ResourceUsage,
+    sup: Optional[SupervisedRun] = None,
+) -> None:
+    """
+    Emit the evidence of a finished W2-A run, with the completion rate
+    measured at each declared GDS level. A surviving isolated run has
+    already waited out its isolation window. A supervised run also reports
+    its cold (re)start latencies and SIGSTOP windows.
+    """
+    if w2.isolated and not (clock and res.failed):
+        iso_end = clock.now() if clock else w2.iso_end
+        log.emit(EventType.ISOLATION_END, t_utc=iso_end)
+
+    for s, rate in _gds_evidence(ctx, gds_rates, _w2a_rate(res)):
+        log.emit(EventType.WORK_UNIT_END, stress_level=s, completion_rate=rate)
+
+    for j in range(res.restarts):
+        log.emit(
+            EventType.FAILURE,
+            failure_id=f"crash_{j}",
+            failure_class=FailureClass.AUTONOMOUSLY_RECOVERED,
+            meta={"signal": "SIGKILL", **asdict(sup.restarts[j])} if sup else None,
+        )
+
+    if res.failed:
+        log.emit(EventType.FAILURE, failure_id="terminal", failure_class=FailureClass.RECOVERABLE_NOT_RECOVERED)
+
+    # REC evidence; checkpoint I/O is the main resource overhead of W2-A
+    log.emit(
+        EventType.WORK_UNIT_END,
+        work_done=res.stages_completed,
+        resources_used=res.duration_s,
+        resources=_metered(ctx, usage),
+        meta={
+            "checkpoint_backend": w2.cfg.checkpoint_backend,
+            "checkpoint_writes": res.checkpoint_writes,
+            "checkpoint_bytes": res.checkpoint_bytes,
+            "checkpoint_write_s": res.checkpoint_write_s,
+            "checkpoint_strategy": w2.cfg.checkpoint_strategy if w2.cfg.has_state else None,
+            "checkpoint_restores": res.checkpoint_restores,
+            "checkpoint_restore_s": res.checkpoint_restore_s,
+            "checkpoint_size_bytes": res.checkpoint_size_bytes,
+            "state_bytes": res.state_bytes,
+            "state_crc32": res.state_crc32,
+            **(_supervised_meta(sup) if sup else {}),
+        },
+    )
+
+    if clock:
+        # A workload that failed while isolated ends the run (and its survival time) here.
+        log.emit(EventType.RUN_END)
+
+
+def _supervised_meta(sup: SupervisedRun) -> Dict[str, Any]:
+    return {
+        "start_method": sup.start_method,
+        "cold_start_s": sup.start.total_s,
+        "cold_restart_s": [r.total_s for r in sup.restarts],
+        "restart_spawn_s": [r.spawn_s for r in sup.restarts],
+        "restart_import_s": [r.import_s for r in sup.restarts],
+        "restart_restore_s": [r.restore_s for r in sup.restarts],
+        "sigstop_s": [s.stopped_s for s in sup.stops],
+    }
+
+
+def _w3a_report(
+    ctx: _RunContext,
+    log: EventLog,
+    clock: Optional[Clock],
+    res: W3AResult,
+    isolated: bool,
+    iso_end: float,
+    gds_rates: List[float],
+    usage: ResourceUsage,
+) -> None:
+    """
+    Emit the evidence of a finished W3-A run: the leader availability
+    measured at each declared GDS level, one FAILURE per crashed node
+    (recovered if a leader was back within the liveness bound), every
+    affected node for CFR, and acknowledged heartbeat rounds per
+    node-second of uptime for REC.
+    """
+    if isolated and not (clock and res.failed):
+        log.emit(EventType.ISOLATION_END, t_utc=clock.now() if clock else iso_end)
+
+    for s, rate in _gds_evidence(ctx, gds_rates, res.leader_availability):
+        log.emit(EventType.WORK_UNIT_END, stress_level=s, completion_rate=rate)
+
+    for j, crash in enumerate(res.crashes):
+        log.emit(
+            EventType.FAILURE,
+            failure_id=f"crash_{j}",
+            component_id=f"node-{crash.node}",
+            failure_class=(
+                FailureClass.AUTONOMOUSLY_RECOVERED if crash.recovered else FailureClass.RECOVERABLE_NOT_RECOVERED
             ),
-            na_reasons=na_reasons,
-            events=log.to_dicts(),
+            meta={"was_leader": crash.was_leader, "t_down": crash.t_down, "t_up": crash.t_up},
         )
-        run_records.append(record)
-        write_run_record(out_dir, i, record)
+    for node in res.affected_nodes:
+        log.emit(EventType.COMPONENT_AFFECTED, component_id=f"node-{node}")
 
-        # Series
-        gds_series.append(gds.gds)
-        arr_series.append(arr.arr)
-        ist_series.append(ist.ist)
-        rec_series.append(rec.rec)
-        cfr_series.append(cfr.cfr)
-        ori_series.append(ori.ori)
+    if res.failed:
+        log.emit(
+            EventType.FAILURE,
+            failure_id="terminal",
+            failure_class=FailureClass.RECOVERABLE_NOT_RECOVERED,
+            meta={"safety_violations": res.safety_violations, "liveness_violations": res.liveness_violations},
+        )
 
-    # Aggregate summaries
-    def _agg(vals: List[Optional[float]]) -> AggregateStats:
-        s = summarize(vals)
-        return AggregateStats(
-            mean=s.mean, std=s.std,
-            ci95_low=s.ci95_low, ci95_high=s.ci95_high,
-            n_included=s.n_included, n_na=s.n_na
+    latencies = res.election_latencies_s
+    log.emit(
+        EventType.WORK_UNIT_END,
+        work_done=res.heartbeat_rounds,
+        resources_used=res.node_seconds,
+        resources=_metered(ctx, usage),
+        meta={
+            "nodes": res.nodes,
+            "sim_time_s": res.sim_time_s,
+            "leader_elections": res.leader_elections,
+            "leader_changes": res.leader_changes,
+            "final_term": res.final_term,
+            "election_latency_mean_s": sum(latencies) / len(latencies) if latencies else None,
+            "election_latency_max_s": max(latencies) if latencies else None,
+            "election_latencies_s": list(latencies),
+            "messages_sent": res.messages_sent,
+            "messages_dropped": res.messages_dropped,
+            "safety_violations": res.safety_violations,
+            "liveness_violations": res.liveness_violations,
+        },
+    )
+
+    if clock:
+        log.emit(EventType.RUN_END)
+
+
+async def _run_workload_async(ctx: _RunContext, i: int, log: EventLog, clock: Optional[Clock]) -> None:
+    """
+    _run_workload as a coroutine. W2-A awaits its external calls, stage waits
+    and checkpoint I/O; other workloads run synchronously on the loop.
+    """
+    if ctx.workload_id != "W2-A":
+        _run_workload(ctx, i, log, clock)
+        return
+    w2 = _w2a_prepare(ctx, i, log, clock)
+    # Runs interleave on the loop and checkpoint I/O runs on helper threads
+    with _meter(ctx, "process") as meter:
+        res = await run_w2a_async(
+            run_dir=w2.run_dir,
+            seed=w2.run_seed,
+            cfg=w2.cfg,
+            external_call=w2.external.call_async if w2.external else _external_call_async,
+            clock=clock,
+            timeline=w2.timeline,
+            checkpoint_store=w2.store,
+            state_faults=w2.state_faults,
+            initial_state=w2.initial_state,
         )
+        if w2.isolated and clock and not res.failed:
+            await clock.sleep_async(w2.iso_end - clock.now())
+        gds_rates = await asyncio.gather(*(asyncio.wrap_future(f) for f in w2.gds_levels))
+    _w2a_report(ctx, log, clock, w2, res, list(gds_rates), meter.usage)
 
-    summary = AggregateSummary(
-        gds=_agg(gds_series),
-        arr=_agg(arr_series),
-        ist=_agg(ist_series),
-        rec=_agg(rec_series),
-        cfr=_agg(cfr_series),
-        ori=_agg(ori_series),
+
+def _execute_run(ctx: _RunContext, i: int, run_key: Optional[str] = None) -> RunRecord:
+    """
+    Execute run i (1-based), compute its proxies and return the run record.
+    Depends only on ctx and i.
+    """
+    with ExitStack() as stack:
+        if ctx.level_pool is None and _has_level_runs(ctx):
+            # In a run worker process: this run's levels get threads of their own
+            pool = ThreadPoolExecutor(max_workers=len(ctx.gds_levels), thread_name_prefix="ocrb-gds")
+            ctx = replace(ctx, level_pool=stack.enter_context(pool))
+        run = _open_run(ctx, i)
+        _reset_peak(ctx)
+        if _profiled(ctx, i):
+            with RunProfiler(ctx.profilers, ctx.profile_top_n) as profiler:
+                _run_workload(ctx, i, run.log, run.clock)
+            write_run_profile(ctx.out_dir, i, profiler.profile)
+        else:
+            _run_workload(ctx, i, run.log, run.clock)
+        return _close_run(ctx, run, run_key)
+
+
+def _profiled(ctx: _RunContext, i: int) -> bool:
+    return bool(ctx.profilers) and (ctx.profile_runs is None or i in ctx.profile_runs)
+
+
+async def _execute_run_async(ctx: _RunContext, i: int, run_key: Optional[str] = None) -> RunRecord:
+    run = _open_run(ctx, i)
+    await _run_workload_async(ctx, i, run.log, run.clock)
+    return _close_run(ctx, run, run_key)
+
+
+def _execute_runs_async(ctx: _RunContext, todo: List[int], run_keys: Dict[int, str]) -> List[RunRecord]:
+    """
+    Execute all runs concurrently as coroutines on one event loop; records
+    are returned in todo order. The runs share one peak RSS, that of the
+    whole batch so far.
+    """
+    _reset_peak(ctx)
+
+    async def main() -> List[RunRecord]:
+        return await asyncio.gather(*(_execute_run_async(ctx, i, run_keys[i]) for i in todo))
+
+    return asyncio.run(main())
+
+
+@dataclass
+class _OpenRun:
+    clock: Optional[Clock]
+    log: EventLog
+    acc: ProxyAccumulator
+    sink: Optional[JsonlEventSink]
+    events_path: Optional[str]
+
+
+def _open_run(ctx: _RunContext, i: int) -> _OpenRun:
+    # Per-run clock; None keeps the fixed reference timestamps.
+    clock = make_clock(ctx.clock) if ctx.clock else None
+
+    events_path = f"events/run_{i:02d}.jsonl" if ctx.stream_events else None
+    sink = JsonlEventSink(str(Path(ctx.out_dir) / events_path)) if events_path else None
+
+    log = EventLog(run_id=f"run-{i:02d}", workload_id=ctx.workload_id, clock=clock, sink=sink)
+
+    # Proxies are folded in as events are emitted; no post-run scan (or JSONL replay).
+    acc = ProxyAccumulator(
+        baseline=ctx.baseline,
+        expected_levels=[1.0] if _main_run_gds(ctx) else ctx.gds_levels or None,
+        isolation_duration_declared=ctx.isolation_duration_declared,
+        C_total=ctx.C_total,
+        resource_dimension=ctx.resource_dimension,
     )
-    write_aggregate_summary(out_dir, summary)
+    log.subscribe(acc.add)
+    return _OpenRun(clock=clock, log=log, acc=acc, sink=sink, events_path=events_path)
+
+
+def _close_run(ctx: _RunContext, run: _OpenRun, run_key: Optional[str]) -> RunRecord:
+    log, sink = run.log, run.sink
+    results = run.acc.snapshot()
+    gds, arr, ist, rec, cfr, ori = results.gds, results.arr, results.ist, results.rec, results.cfr, results.ori
+    na_reasons = results.na_reasons()
+
+    record = RunRecord(
+        run_id=log.run_id,
+        workload_id=ctx.workload_id,
+        seeds=asdict(ctx.seeds),
+        start_utc=log.first.t_utc,
+        end_utc=log.last.t_utc,
+        proxies=ProxyValues(
+            gds=gds.gds,
+            arr=arr.arr,
+            ist=ist.ist,
+            rec=rec.rec,
+            cfr=cfr.cfr,
+            ori=ori.ori,
+        ),
+        evidence=ProxyEvidence(
+            stress_levels=gds.stress_levels,
+            completion_rates=gds.completion_rates,
+            Fr=arr.Fr,
+            Fa=arr.Fa,
+            isolation_duration=ctx.isolation_duration_declared,
+            survival_time=ist.survival_time_observed,
+            E_base=rec.E_base,
+            E_stress=rec.E_stress,
+            baseline_completion_ok=None,
+            resource_dimension=ctx.resource_dimension,
+            resource_usage=run.acc.rec.usage,
+            resource_usage_per_unit=run.acc.rec.usage.per_unit(run.acc.rec.work) if run.acc.rec.usage else None,
+            C_total=ctx.C_total,
+            C_local=cfr.C_local,
+        ),
+        na_reasons=na_reasons,
+        events=[] if sink else log.to_dicts(),
+        events_path=run.events_path,
+        run_key=run_key,
+    )
+    if sink:
+        sink.close()
+    return record
+
+
+def _meter(ctx: _RunContext, scope: str = "thread") -> ResourceMeter:
+    # Meters leave the process-wide peak RSS alone; see _reset_peak
+    return ResourceMeter(scope)
+
+
+def _reset_peak(ctx: _RunContext) -> None:
+    # Called where one run (or the async batch) owns the process, so a
+    # run's max_rss_bytes is the process's peak since that run started.
+    if ctx.resource_dimension is not None:
+        reset_peak_rss()
 
-    write_disclosure(out_dir, _default_disclosure_text())
 
+def _metered(ctx: _RunContext, usage: Optional[ResourceUsage]) -> Optional[ResourceUsage]:
+    # Metered usage is evidence only when REC is normalized by it
+    return usage if ctx.resource_dimension is not None else None
 
-def _default_disclosure_text() -> str:
+
+def _external_call() -> None:
+    """
+    The W2-A external dependency. Its reachability is decided by the stress
+    timeline (SR-4 loss, SR-5 isolation), not by the call itself; with SR-4
+    declared, calls also cross a simulated network (see _ExternalLink).
+    """
+    return None
+
+
+async def _external_call_async() -> None:
+    return None
+
+
+class _ExternalLink:
+    """
+    The W2-A external dependency reached over the run's SR-4 message bus:
+    each call is a request/response round trip taking its round-trip time on
+    the run clock. If either message is lost or partitioned, the call fails
+    after a timeout of twice the latency bound. Without a run clock, network
+    time advances by these waits only.
+    """
+    def __init__(self, bus: MessageBus, clock: Optional[Clock]):
+        self.bus = bus
+        self.clock = clock
+        self.t0 = clock.now() if clock else 0.0
+        self.timeout_s = 2.0 * bus.profile.latency_bound_s
+
+    def _exchange(self) -> Tuple[float, bool]:
+        # Time spent on the call, and whether it got an answer
+        if self.clock:
+            self.bus.advance_to(self.clock.now() - self.t0)
+        rtt = self.bus.round_trip("workload", "external")
+        waited = self.timeout_s if rtt is None else rtt
+        if not self.clock:
+            self.bus.advance_to(self.bus.now + waited)
+        return waited, rtt is not None
+
+    def call(self) -> None:
+        waited, answered = self._exchange()
+        if self.clock:
+            self.clock.sleep(waited)
+        if not answered:
+            raise RuntimeError("external_unavailable")
+
+    async def call_async(self) -> None:
+        waited, answered = self._exchange()
+        if self.clock:
+            await self.clock.sleep_async(waited)
+        if not answered:
+            raise RuntimeError("external_unavailable")
+
+
+def _external_link(ctx: _RunContext, i: int, clock: Optional[Clock]) -> Optional[_ExternalLink]:
+    """
+    Route run i's external calls through a simulated SR-4 network when SR-4
+    is declared; partitions are relative to the start of the workload.
+    """
+    sr4 = ctx.stress_parameters.get("SR-4")
+    if sr4 is None:
+        return None
+    return _ExternalLink(MessageBus(NetworkProfile.from_sr4(sr4), _network_seed(ctx, i)), clock)
+
+
+def _network_seed(ctx: _RunContext, i: int) -> int:
+    # Distinct from the SR-4 timeline stream (seeds.sr4 + i)
+    return ctx.seeds.sr4 * 1_000_003 + i
+
+
+def _w2a_reference_crash_points(run_seed: int, cfg: W2AConfig) -> List[int]:
+    return sorted({(run_seed % 37) % cfg.stages, (run_seed % 53) % cfg.stages})
+
+
+def _w3a_reference_crash_points(run_seed: int, horizon: int) -> List[int]:
+    # Two declared leader failures within the middle half of the run
+    q = horizon // 4
+    span = max(2 * q, 1)
+    return sorted({q + (run_seed % 37) % span, q + (run_seed % 53) % span})
+
+
+def _isolation_bounds(ctx: _RunContext, clock: Optional[Clock]) -> Tuple[float, float]:
+    """
+    (start, end) of the SR-5 isolation window: from now for the declared
+    window on a run clock, fixed reference timestamps otherwise.
+    """
+    if clock:
+        # Isolation starts with the workload and is held for the declared window.
+        iso_start = clock.now()
+        return iso_start, iso_start + _isolation_window_s(ctx)
+    iso_start = 1010.0
+    iso_end = iso_start + float(ctx.isolation_duration_declared) if ctx.isolation_duration_declared else iso_start
+    return iso_start, iso_end
+
+
+def _isolation_window_s(ctx: _RunContext) -> float:
+    """
+    Declared SR-5 isolation window: SR-5 duration_s if given, else the
+    declared isolation duration used for IST.
+    """
+    sr5 = ctx.stress_parameters.get("SR-5") or {}
+    if "duration_s" in sr5:
+        return float(sr5["duration_s"])
+    return float(ctx.isolation_duration_declared or 0.0)
+
+
+def _default_disclosure_text(ctx: _RunContext) -> str:
     return """# OCRB v0 Disclosure
 
 This report was generated by the OCRB reference runner.
@@ -260,9 +1458,31 @@ This report was generated by the OCRB reference runner.
 - No adaptive behavior was used to alter execution in response to stress or proxy values.
 
 ## Notes
-- Workload execution is currently stubbed in this runner.
-- Replace stub workload generation with real W1/W2/W3 workload implementations before publishing results as OCRB runs.
-"""
+""" + _workload_disclosure(ctx) + _gds_disclosure(ctx)
+
+
+def _workload_disclosure(ctx: _RunContext) -> str:
+    if ctx.workload_id in _LEVEL_WORKLOADS:
+        return f"- Workload {ctx.workload_id} was executed by its reference implementation (OCRB.workloads).\n"
+    return (
+        f"- Workload {ctx.workload_id} has no implementation in this runner; its runs report fixed placeholder "
+        "evidence and must not be published as OCRB results.\n"
+    )
+
+
+def _gds_disclosure(ctx: _RunContext) -> str:
+    if _has_level_runs(ctx):
+        n = len(ctx.gds_levels)
+        return (
+            f"- GDS: each run was also executed once at each of the {n} declared stress levels (declared stress "
+            f"scaled by the level), i.e. {n + 1} workload executions per run.\n"
+        )
+    if _main_run_gds(ctx):
+        return (
+            "- GDS: level runs were disabled; GDS is each run's completion rate at its declared stress alone "
+            "(one level, 1.0), not a degradation curve.\n"
+        )
+    return ""
 
 
 def _stub_baseline_events(workload_id: str) -> EventLog:
@@ -277,14 +1497,13 @@ def _stub_baseline_events(workload_id: str) -> EventLog:
     return log
 
 
-def _stub_workload_events(run_id: str, workload_id: str) -> EventLog:
+def _stub_workload_events(log: EventLog) -> EventLog:
     """
     Placeholder stressed run:
     Includes evidence for GDS levels, failures for ARR, isolation window for IST,
     resource evidence for REC, and component evidence for CFR.
     Replace with real workload execution + instrumentation.
     """
-    log = EventLog(run_id=run_id, workload_id=workload_id)
     log.emit(EventType.RUN_START, t_utc=1000.0)
 
     # GDS evidence across levels (example)
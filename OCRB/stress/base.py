@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from OCRB.config import StressSeeds
+
+
+# Per-tick flag bits
+FAULT = 0x01        # SR-1 transient fault (probability modulated by SR-2)
+POWER_LOSS = 0x02   # SR-3 interruption window
+CRASH = 0x04        # first tick of an interruption (or a declared crash point)
+NET_LOSS = 0x08     # SR-4 external message lost / dependency unavailable
+ISOLATED = 0x10     # SR-5 isolation window
+
+
+@dataclass(frozen=True)
+class StressTimeline:
+    """
+    Precompiled stress schedule for one run.
+
+    One flag byte per tick (a stage for W2-A, a task for W1-A); every lookup
+    is a single index into `flags`. Ticks beyond the horizon are unstressed.
+    """
+    horizon: int
+    tick_s: float
+    flags: bytes
+
+    def at(self, tick: int) -> int:
+        if 0 <= tick < self.horizon:
+            return self.flags[tick]
+        return 0
+
+    def fault_at(self, tick: int) -> bool:
+        return bool(self.at(tick) & FAULT)
+
+    def crash_at(self, tick: int) -> bool:
+        return bool(self.at(tick) & CRASH)
+
+    def power_lost_at(self, tick: int) -> bool:
+        return bool(self.at(tick) & POWER_LOSS)
+
+    def external_available_at(self, tick: int) -> bool:
+        return not (self.at(tick) & (ISOLATED | NET_LOSS))
+
+    def net_lost_at(self, tick: int) -> bool:
+        return bool(self.at(tick) & NET_LOSS)
+
+    def isolated_at(self, tick: int) -> bool:
+        return bool(self.at(tick) & ISOLATED)
+
+    def without(self, flag: int) -> StressTimeline:
+        """
+        This timeline with `flag` cleared on every tick.
+        """
+        return StressTimeline(
+            horizon=self.horizon, tick_s=self.tick_s, flags=bytes(f & ~flag for f in self.flags)
+        )
+
+    def windows(self, flag: int) -> List[Tuple[int, int]]:
+        """
+        Maximal [start, end) tick ranges in which `flag` is set.
+        """
+        out: List[Tuple[int, int]] = []
+        start: Optional[int] = None
+        for t, f in enumerate(self.flags):
+            if f & flag:
+                if start is None:
+                    start = t
+            elif start is not None:
+                out.append((start, t))
+                start = None
+        if start is not None:
+            out.append((start, self.horizon))
+        return out
+
+
+def _ticks(seconds: float, tick_s: float, horizon: int) -> int:
+    # Durations are declared in seconds; a zero tick length means "whole horizon".
+    if tick_s <= 0:
+        return horizon
+    return int(math.ceil(float(seconds) / tick_s))
+
+
+def _mark(flags: bytearray, start: int, end: int, flag: int) -> None:
+    for t in range(max(0, start), min(len(flags), end)):
+        flags[t] |= flag
+
+
+def sr2_level(phase: float, waveform: str = "sine") -> float:
+    """
+    SR-2 intensity in [0, 1] at `phase` in [0, 1) of its period: a raised
+    cosine (0 at phase 0, 1 at phase 0.5), or 0/1 halves for "square".
+    """
+    if waveform == "square":
+        return 1.0 if phase >= 0.5 else 0.0
+    return 0.5 - 0.5 * math.cos(2.0 * math.pi * phase)
+
+
+def _sr1_faults(flags: bytearray, sr1: Dict[str, Any], sr2: Optional[Dict[str, Any]], seed: int, tick_s: float) -> None:
+    """
+    SR-1: independent per-tick fault probability `rate`.
+    SR-2 (if declared) modulates it with a periodic factor between 1.0 and
+    `amplitude` over `period_s` (sinusoidal, or "square" via `waveform`).
+    """
+    rate = float(sr1.get("rate", 0.0))
+    if rate <= 0.0:
+        return
+
+    period = float(sr2.get("period_s", 0.0)) if sr2 else 0.0
+    amplitude = float(sr2.get("amplitude", 1.0)) if sr2 else 1.0
+    waveform = str(sr2.get("waveform", "sine")) if sr2 else "sine"
+
+    rng = random.Random(seed)
+    for t in range(len(flags)):
+        p = rate
+        if period > 0.0 and amplitude != 1.0:
+            level = sr2_level(((t * tick_s) % period) / period, waveform)
+            p = rate * (1.0 + (amplitude - 1.0) * level)
+        if rng.random() < p:
+            flags[t] |= FAULT
+
+
+def _sr3_interruptions(flags: bytearray, sr3: Dict[str, Any], seed: int, tick_s: float) -> None:
+    """
+    SR-3: interruptions of `interruption_s` covering (1 - availability) of
+    the horizon, placed "periodic"ally or "stochastic"ally (seeded, default).
+    """
+    horizon = len(flags)
+    availability = float(sr3.get("availability", 1.0))
+    if availability >= 1.0 or horizon == 0:
+        return
+
+    length = max(1, _ticks(sr3.get("interruption_s", tick_s), tick_s, horizon))
+    n = max(1, int(round(horizon * (1.0 - availability) / length)))
+    schedule = str(sr3.get("schedule", "stochastic"))
+
+    if schedule == "periodic":
+        spacing = horizon / n
+        starts = [int(k * spacing + (spacing - length) / 2) for k in range(n)]
+    elif schedule == "stochastic":
+        rng = random.Random(seed)
+        starts = sorted(rng.randrange(horizon) for _ in range(n))
+    else:
+        raise ValueError(f"Unknown SR-3 schedule: {schedule!r} (expected 'periodic' or 'stochastic')")
+
+    for s in starts:
+        s = max(0, s)
+        _mark(flags, s, s + length, POWER_LOSS)
+        if s < horizon:
+            flags[s] |= CRASH
+
+
+def _sr4_loss(flags: bytearray, sr4: Dict[str, Any], seed: int) -> None:
+    """
+    SR-4: per-tick probability `loss` that the external dependency is unreachable.
+    """
+    loss = float(sr4.get("loss", 0.0))
+    if loss <= 0.0:
+        return
+    rng = random.Random(seed)
+    for t in range(len(flags)):
+        if rng.random() < loss:
+            flags[t] |= NET_LOSS
+
+
+def _sr5_isolation(flags: bytearray, sr5: Dict[str, Any], tick_s: float) -> None:
+    """
+    SR-5: one time-based isolation window starting at `start_s` (default 0)
+    and lasting `duration_s`.
+    """
+    horizon = len(flags)
+    start = _ticks(sr5.get("start_s", 0.0), tick_s, horizon) if sr5.get("start_s") else 0
+    if "duration_s" in sr5:
+        length = _ticks(sr5["duration_s"], tick_s, horizon)
+    else:
+        length = horizon
+    _mark(flags, start, start + length, ISOLATED)
+
+
+def scale_stress(stress_parameters: Dict[str, Any], level: float) -> Dict[str, Any]:
+    """
+    The declared profile with every stress intensity scaled by `level`
+    (0 = unstressed, 1 = as declared): SR-1 fault and bit-flip rates, the
+    SR-2 fault amplitude and CPU throttling, SR-3 unavailability, SR-4 loss,
+    latency and partition lengths, and the SR-5 isolation window (an
+    isolation without duration_s keeps covering the whole run). Schedules,
+    periods and waveforms are unchanged. Level 0 declares no stress at all.
+    """
+    level = float(level)
+    if level <= 0.0:
+        return {}
+    out: Dict[str, Any] = {}
+    for sr, params in stress_parameters.items():
+        p = dict(params or {})
+        if sr == "SR-1":
+            for key in ("rate", "bit_flip_rate"):
+                if key in p:
+                    p[key] = float(p[key]) * level
+        elif sr == "SR-2":
+            if "amplitude" in p:
+                p["amplitude"] = 1.0 + (float(p["amplitude"]) - 1.0) * level
+            if "min_availability" in p:
+                p["min_availability"] = 1.0 - (1.0 - float(p["min_availability"])) * level
+        elif sr == "SR-3":
+            if "availability" in p:
+                p["availability"] = 1.0 - (1.0 - float(p["availability"])) * level
+        elif sr == "SR-4":
+            for key in ("loss", "packet_loss", "latency_ms", "jitter_ms", "max_latency_ms"):
+                if key in p:
+                    p[key] = float(p[key]) * level
+            if "partitions" in p:
+                p["partitions"] = [{**q, "duration_s": float(q["duration_s"]) * level} for q in p["partitions"]]
+        elif sr == "SR-5":
+            if "duration_s" in p:
+                p["duration_s"] = float(p["duration_s"]) * level
+        out[sr] = p
+    return out
+
+
+def compile_timeline(
+    stress_parameters: Dict[str, Any],
+    seeds: StressSeeds,
+    *,
+    horizon: int,
+    tick_s: float = 1.0,
+    run_index: int = 0,
+    crash_points: Iterable[int] = (),
+) -> StressTimeline:
+    """
+    Compile a declared stress profile into a per-tick timeline.
+
+    Each stochastic stressor draws from its own manifest seed offset by the
+    run index, so schedules are reproducible per run and independent of one
+    another. `crash_points` adds workload-declared deterministic crash ticks.
+    Stressors absent from `stress_parameters` are disabled (SP-0).
+    """
+    flags = bytearray(horizon)
+
+    if "SR-1" in stress_parameters:
+        _sr1_faults(flags, stress_parameters["SR-1"], stress_parameters.get("SR-2"), seeds.sr1 + run_index, tick_s)
+    if "SR-3" in stress_parameters:
+        _sr3_interruptions(flags, stress_parameters["SR-3"], seeds.sr3 + run_index, tick_s)
+    if "SR-4" in stress_parameters:
+        _sr4_loss(flags, stress_parameters["SR-4"], seeds.sr4 + run_index)
+    if "SR-5" in stress_parameters:
+        _sr5_isolation(flags, stress_parameters["SR-5"] or {}, tick_s)
+
+    for t in crash_points:
+        if 0 <= t < horizon:
+            flags[t] |= CRASH
+
+    return StressTimeline(horizon=horizon, tick_s=float(tick_s), flags=bytes(flags))
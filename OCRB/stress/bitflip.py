@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from OCRB.measure.events import EventLog, EventType
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - depends on environment
+        raise ImportError(
+            "SR-1 bit flips (bit_flip_rate) need NumPy, an optional dependency: pip install numpy"
+        ) from None
+    return np
+
+
+def check_bit_flips(sr1: Optional[Dict[str, Any]]) -> None:
+    """
+    Fail before any run starts if SR-1 declares bit flips and NumPy is
+    missing.
+    """
+    if sr1 and sr1.get("bit_flip_rate"):
+        _require_numpy()
+
+
+@dataclass(frozen=True)
+class BitFlips:
+    """
+    Bit flips applied to one buffer. `positions` is a sorted numpy array of
+    distinct bit offsets (bit k of byte b is offset 8 * b + k, LSB first).
+    """
+    nbits: int
+    positions: Any
+
+    @property
+    def count(self) -> int:
+        return int(self.positions.size)
+
+    @property
+    def byte_offsets(self) -> Any:
+        return self.positions >> 3
+
+
+def _byte_view(buf: Any) -> Any:
+    # Writable uint8 view of buf's memory; never a copy.
+    np = _require_numpy()
+    mv = memoryview(buf)
+    if mv.readonly:
+        raise ValueError("bit flips are applied in place; buffer is read-only")
+    if not mv.c_contiguous:
+        raise ValueError("bit flips need a C-contiguous buffer")
+    return np.frombuffer(mv.cast("B"), dtype=np.uint8)
+
+
+def flip_positions(nbits: int, rate: float, seed: int) -> Any:
+    """
+    Seeded bit offsets in [0, nbits) hit by SR-1 when each bit flips with
+    probability `rate`: a binomial count of uniformly drawn offsets, sorted,
+    duplicates dropped (an O(flips) draw, independent of nbits).
+    """
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError("SR-1 bit-flip rate must be in [0, 1]")
+    np = _require_numpy()
+    rng = np.random.default_rng(seed)
+    if nbits <= 0 or rate == 0.0:
+        return np.empty(0, dtype=np.uint64)
+    k = int(rng.binomial(nbits, rate))
+    positions = rng.integers(0, nbits, size=k, dtype=np.uint64)
+    # Sort + adjacent-duplicate mask: much faster than np.unique at this size
+    positions.sort()
+    if k > 1:
+        positions = positions[np.concatenate(([True], positions[1:] != positions[:-1]))]
+    return positions
+
+
+def apply_bit_flips(buf: Any, positions: Any) -> None:
+    """
+    XOR the given sorted, distinct bit offsets into buf in place.
+    """
+    np = _require_numpy()
+    data = _byte_view(buf)
+    if positions.size == 0:
+        return
+    if int(positions[-1]) >= data.size * 8:
+        raise ValueError("bit offset beyond the end of the buffer")
+    index = (positions >> 3).astype(np.intp)
+    masks = np.left_shift(1, (positions & 7).astype(np.uint8)).astype(np.uint8)
+    # Flips sharing a byte are combined first, so each byte is written once.
+    starts = np.flatnonzero(np.concatenate(([True], index[1:] != index[:-1])))
+    data[index[starts]] ^= np.bitwise_or.reduceat(masks, starts)
+
+
+def inject_bit_flips(buf: Any, rate: float, seed: int) -> BitFlips:
+    """
+    SR-1 against memory: flip each bit of buf (any writable, contiguous
+    buffer-protocol object: bytearray, mmap, numpy array, ...) with
+    probability `rate`, in place and without copying it. Reproducible for a
+    given (buffer size, rate, seed).
+    """
+    nbits = memoryview(buf).nbytes * 8
+    positions = flip_positions(nbits, rate, seed)
+    apply_bit_flips(buf, positions)
+    return BitFlips(nbits=nbits, positions=positions)
+
+
+def emit_bit_flips(log: EventLog, flips: BitFlips, *, component_id: str, meta: Optional[dict] = None) -> None:
+    """
+    One FAULT_INJECTED event per flip, carrying its byte and bit offset.
+    """
+    for pos in flips.positions.tolist():
+        log.emit(
+            EventType.FAULT_INJECTED,
+            component_id=component_id,
+            meta={**(meta or {}), "byte": pos >> 3, "bit": pos & 7},
+        )
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import heapq
+import math
+import random
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+LATENCY_DISTRIBUTIONS = ("uniform", "normal", "exponential")
+
+
+@dataclass(frozen=True)
+class Partition:
+    """
+    Window [start_s, end_s) during which `nodes` are cut off from everyone
+    else (None: every link is down).
+    """
+    start_s: float
+    end_s: float
+    nodes: Optional[FrozenSet[Any]] = None
+
+    def cuts(self, t: float, src: Any, dst: Any) -> bool:
+        if not self.start_s <= t < self.end_s:
+            return False
+        return self.nodes is None or ((src in self.nodes) != (dst in self.nodes))
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    """
+    SR-4 network model.
+
+    One-way latency is latency_s plus a seeded sample of scale jitter_s:
+      "uniform"     - uniform in [0, jitter_s)
+      "normal"      - normal with standard deviation jitter_s (may go below latency_s)
+      "exponential" - exponential with mean jitter_s
+    always bounded to [0, max_latency_s] (default latency_s + jitter_s for
+    uniform, latency_s + 4 * jitter_s otherwise). Each message is lost
+    independently with probability packet_loss and never crosses a
+    partition. Payloads are delivered unmodified.
+    """
+    latency_s: float = 0.0
+    jitter_s: float = 0.0
+    distribution: str = "uniform"
+    max_latency_s: Optional[float] = None
+    packet_loss: float = 0.0
+    partitions: Tuple[Partition, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown SR-4 latency distribution: {self.distribution!r} (expected one of {LATENCY_DISTRIBUTIONS})"
+            )
+        if self.latency_s < 0 or self.jitter_s < 0:
+            raise ValueError("SR-4 latency and jitter must be >= 0")
+        if not 0.0 <= self.packet_loss <= 1.0:
+            raise ValueError("SR-4 packet_loss must be in [0, 1]")
+        if self.max_latency_s is not None and self.max_latency_s < 0:
+            raise ValueError("SR-4 max_latency must be >= 0")
+
+    @property
+    def latency_bound_s(self) -> float:
+        if self.max_latency_s is not None:
+            return self.max_latency_s
+        if self.distribution == "uniform":
+            return self.latency_s + self.jitter_s
+        return self.latency_s + 4.0 * self.jitter_s
+
+    def with_outages(self, windows: Iterable[Tuple[float, float]]) -> NetworkProfile:
+        """
+        This profile plus full outages over the given (start_s, end_s) windows.
+        """
+        return replace(self, partitions=self.partitions + tuple(Partition(s, e) for s, e in windows))
+
+    @classmethod
+    def from_sr4(cls, sr4: Optional[Dict[str, Any]], *, base: Optional[NetworkProfile] = None) -> NetworkProfile:
+        """
+        Profile from declared SR-4 parameters; undeclared ones keep `base`
+        (the workload's unstressed network). Recognized keys:
+
+          latency_ms, jitter_ms, max_latency_ms, distribution, packet_loss,
+          partitions: [{"start_s": ..., "duration_s": ..., "nodes": [...]}]
+
+        The per-tick disconnection probability "loss" is compiled into the
+        stress timeline instead (see OCRB.stress.base).
+        """
+        profile = base or cls()
+        sr4 = sr4 or {}
+        changes: Dict[str, Any] = {}
+        if "latency_ms" in sr4:
+            changes["latency_s"] = float(sr4["latency_ms"]) / 1000.0
+        if "jitter_ms" in sr4:
+            changes["jitter_s"] = float(sr4["jitter_ms"]) / 1000.0
+        if "max_latency_ms" in sr4:
+            changes["max_latency_s"] = float(sr4["max_latency_ms"]) / 1000.0
+        if "distribution" in sr4:
+            changes["distribution"] = str(sr4["distribution"])
+        if "packet_loss" in sr4:
+            changes["packet_loss"] = float(sr4["packet_loss"])
+        if "partitions" in sr4:
+            changes["partitions"] = profile.partitions + tuple(
+                Partition(
+                    start_s=float(p.get("start_s", 0.0)),
+                    end_s=float(p.get("start_s", 0.0)) + float(p["duration_s"]),
+                    nodes=frozenset(p["nodes"]) if p.get("nodes") is not None else None,
+                )
+                for p in sr4["partitions"]
+            )
+        return replace(profile, **changes)
+
+
+class MessageBus:
+    """
+    Simulated message transport on a heap-scheduled event queue.
+
+    send() draws a message's fate (partition, loss, latency) from the
+    profile and a seeded RNG and queues its delivery; schedule() queues a
+    local timer, which is never lost. pop() returns the next due entry and
+    advances the bus clock to it, so simulated time only moves forward and
+    nothing ever sleeps. Entries due at the same time pop in send order.
+    Results depend only on (profile, seed) and the order of calls.
+    """
+    def __init__(self, profile: NetworkProfile, seed: int, *, start: float = 0.0):
+        self.profile = profile
+        self.now = float(start)
+        self.sent = 0
+        self.dropped = 0
+        self.latency_total_s = 0.0
+        self._rng = random.Random(seed)
+        self._queue: List[Tuple[float, int, Any, Any]] = []
+        self._seq = 0
+        self._loss = profile.packet_loss
+        self._partitions = profile.partitions
+        self._latency = self._sampler()
+
+    def _sampler(self) -> Callable[[], float]:
+        p = self.profile
+        base, jitter, bound = p.latency_s, p.jitter_s, p.latency_bound_s
+        rnd = self._rng.random
+        if jitter == 0.0:
+            constant = min(base, bound)
+            return lambda: constant
+        if p.distribution == "uniform":
+            if base + jitter <= bound:
+                return lambda: base + jitter * rnd()
+            return lambda: min(base + jitter * rnd(), bound)
+        if p.distribution == "normal":
+            gauss = self._rng.gauss
+            return lambda: min(max(gauss(base, jitter), 0.0), bound)
+        expovariate = self._rng.expovariate
+        rate = 1.0 / jitter
+        return lambda: min(base + expovariate(rate), bound)
+
+    def _transit(self, src: Any, dst: Any, t: float) -> Optional[float]:
+        # One-way latency of a message sent at t, or None if it is lost.
+        self.sent += 1
+        if self._partitions and any(p.cuts(t, src, dst) for p in self._partitions):
+            self.dropped += 1
+            return None
+        if self._loss and self._rng.random() < self._loss:
+            self.dropped += 1
+            return None
+        latency = self._latency()
+        self.latency_total_s += latency
+        return latency
+
+    def send(self, src: Any, dst: Any, payload: Any) -> bool:
+        """
+        Queue payload for delivery to dst; False if the message was lost.
+        """
+        # Hot path: _transit inlined
+        self.sent += 1
+        if (self._partitions and any(p.cuts(self.now, src, dst) for p in self._partitions)) or (
+            self._loss and self._rng.random() < self._loss
+        ):
+            self.dropped += 1
+            return False
+        latency = self._latency()
+        self.latency_total_s += latency
+        self._seq += 1
+        heapq.heappush(self._queue, (self.now + latency, self._seq, dst, payload))
+        return True
+
+    def broadcast(self, src: Any, dsts: Iterable[Any], payload: Any) -> int:
+        """
+        send() to every dst other than src; returns the number queued.
+        """
+        now, queue, sample, push = self.now, self._queue, self._latency, heapq.heappush
+        partitions, loss, rnd = self._partitions, self._loss, self._rng.random
+        seq = self._seq
+        sent = dropped = 0
+        total = 0.0
+        for dst in dsts:
+            if dst == src:
+                continue
+            sent += 1
+            if (partitions and any(p.cuts(now, src, dst) for p in partitions)) or (loss and rnd() < loss):
+                dropped += 1
+                continue
+            latency = sample()
+            total += latency
+            seq += 1
+            push(queue, (now + latency, seq, dst, payload))
+        self._seq = seq
+        self.sent += sent
+        self.dropped += dropped
+        self.latency_total_s += total
+        return sent - dropped
+
+    def schedule(self, delay: float, dst: Any, payload: Any) -> None:
+        """
+        Queue a local event for dst after `delay` (no network involved).
+        """
+        self._seq += 1
+        heapq.heappush(self._queue, (self.now + max(delay, 0.0), self._seq, dst, payload))
+
+    def next_time(self) -> float:
+        return self._queue[0][0] if self._queue else math.inf
+
+    def pop(self) -> Tuple[float, Any, Any]:
+        """
+        Remove the next due entry and advance the clock to it: (t, dst, payload).
+        """
+        t, _, dst, payload = heapq.heappop(self._queue)
+        self.now = t
+        return t, dst, payload
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def advance_to(self, t: float) -> None:
+        self.now = max(self.now, t)
+
+    def round_trip(self, src: Any, dst: Any) -> Optional[float]:
+        """
+        Request/response exchange starting now, outside the queue (e.g. a
+        blocking call to an external service): the round-trip time, or None
+        if either message was lost. Does not advance the clock.
+        """
+        there = self._transit(src, dst, self.now)
+        if there is None:
+            return None
+        back = self._transit(dst, src, self.now + there)
+        if back is None:
+            return None
+        return there + back
@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import pickle
+import signal
+import socket
+import subprocess
+import sys
+import time
+from multiprocessing.connection import Connection
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from OCRB.measure.resources import ResourceMeter, ResourceUsage
+from OCRB.stress.base import CRASH, POWER_LOSS, StressTimeline
+
+POWER_SIGNALS = ("kill", "stop")
+START_METHODS = ("forkserver", "spawn")
+
+# Bootstraps a fresh interpreter into _serve (fork server) or _spawned (one child)
+_BOOT = "import sys; from OCRB.stress import power; power.{}(*sys.argv[1:])"
+
+
+@dataclass(frozen=True)
+class PowerCut:
+    """
+    Interruption delivered to a supervised workload process as it reaches
+    `stage`: "kill" (SIGKILL, cold restart from its checkpoint) or "stop"
+    (SIGSTOP, SIGCONT after hold_s).
+    """
+    stage: int
+    signal: str
+    hold_s: float = 0.0
+
+
+def power_cuts(timeline: StressTimeline, sr3: Optional[Dict[str, Any]]) -> Dict[int, PowerCut]:
+    """
+    Signal schedule for a timeline's CRASH ticks. A tick that opens an SR-3
+    interruption window gets SR-3's `signal` ("kill" by default; "stop"
+    freezes the process for the window); other crash ticks (declared crash
+    points) are always kills. Like a simulated crash, a cut fires each time
+    its stage is reached.
+    """
+    kind = str((sr3 or {}).get("signal", "kill"))
+    if kind not in POWER_SIGNALS:
+        raise ValueError(f"Unknown SR-3 signal: {kind!r} (expected one of {POWER_SIGNALS})")
+    window_end = {t: end for start, end in timeline.windows(POWER_LOSS) for t in range(start, end)}
+    cuts: Dict[int, PowerCut] = {}
+    for t, f in enumerate(timeline.flags):
+        if not f & CRASH:
+            continue
+        if kind == "stop" and t in window_end:
+            cuts[t] = PowerCut(stage=t, signal="stop", hold_s=(window_end[t] - t) * timeline.tick_s)
+        else:
+            cuts[t] = PowerCut(stage=t, signal="kill")
+    return cuts
+
+
+@dataclass(frozen=True)
+class ColdStart:
+    """
+    Latency of one (re)start of the workload process, on the monotonic
+    clock: from the spawn request (first start) or the SIGKILL (restart)
+    until the first stage begins.
+      spawn_s   - until the child runs (process creation)
+      import_s  - importing the workload module
+      restore_s - opening and restoring its checkpoint
+    """
+    stage: int
+    total_s: float
+    spawn_s: float
+    import_s: float
+    restore_s: float
+
+
+@dataclass(frozen=True)
+class PowerStop:
+    stage: int
+    stopped_s: float
+
+
+@dataclass(frozen=True)
+class SupervisedRun:
+    """
+    Outcome of supervise(). `result` is the target's return value, or None
+    if the last kill exceeded max_restarts (`failed_stage` is then the stage
+    it fired at). `killed_info` holds the last gate info reported by each
+    killed process, in order. `server_start_s` is the fork server's own
+    start-up (0 for "spawn"), paid once per run and not part of any start.
+    `resources` is the usage metered inside the workload processes, summed
+    over all of them (a killed one up to its last gate).
+    """
+    result: Any
+    duration_s: float
+    server_start_s: float
+    start: ColdStart
+    restarts: Tuple[ColdStart, ...]
+    stops: Tuple[PowerStop, ...]
+    killed_info: Tuple[Any, ...]
+    start_method: str
+    failed_stage: Optional[int] = None
+    resources: Optional[ResourceUsage] = None
+
+
+class ChildLink:
+    """
+    The supervised process's end of its socket. gate() reports that a stage
+    is about to begin, with the process's resource usage so far, and blocks
+    until the supervisor lets it proceed; a cut is delivered while the
+    process waits here.
+    """
+    def __init__(self, conn: Connection, meter: ResourceMeter):
+        self._conn = conn
+        self._meter = meter
+
+    def gate(self, stage: int, info: Any = None) -> None:
+        self._conn.send(("gate", stage, info, time.monotonic(), self._meter.elapsed()))
+        self._conn.recv()
+
+
+def _child_main(fd: int, target: str) -> None:
+    # Body of a supervised process; never returns.
+    t_start = time.monotonic()
+    meter = ResourceMeter("process").start()
+    conn = Connection(fd)
+    code = 0
+    try:
+        module, func = target.split(":")
+        fn = getattr(importlib.import_module(module), func)
+        conn.send(("started", t_start, time.monotonic()))
+        # Unpickled only now, so the workload's imports are timed above
+        result = fn(link=ChildLink(conn, meter), **pickle.loads(conn.recv_bytes()))
+        conn.send(("done", result, meter.elapsed()))
+    except BaseException as e:
+        code = 1
+        try:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+        except OSError:
+            pass
+    finally:
+        os._exit(code)
+
+
+def _serve(ctrl_fd: str) -> None:
+    """
+    Fork server: a lean interpreter that forks one supervised process per
+    request (a target plus the socket it talks on, passed with SCM_RIGHTS)
+    and answers with its pid. Children are reaped automatically.
+    """
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    ctrl = socket.socket(fileno=int(ctrl_fd))
+    ctrl.sendall(b"ready\n")
+    while True:
+        msg, fds, _, _ = socket.recv_fds(ctrl, 4096, 1)
+        if not msg:
+            return
+        pid = os.fork()
+        if pid == 0:
+            ctrl.close()
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            _child_main(fds[0], msg.decode())
+        os.close(fds[0])
+        ctrl.sendall(b"%d\n" % pid)
+
+
+def _spawned(fd: str, target: str) -> None:
+    _child_main(int(fd), target)
+
+
+def _boot_env() -> Dict[str, str]:
+    # The child interpreter resolves modules exactly as this one does.
+    path = [os.path.abspath(p) if p else os.getcwd() for p in sys.path]
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(path)}
+
+
+class _Launcher:
+    """
+    Starts supervised processes: forked from a fork server ("forkserver") or
+    as fresh interpreters ("spawn"). start() returns (pid, connection).
+    """
+    def __init__(self, start_method: str):
+        self.start_method = start_method
+        self.server_start_s = 0.0
+        self._server: Optional[subprocess.Popen] = None
+        self._ctrl: Optional[socket.socket] = None
+        self._procs: Dict[int, subprocess.Popen] = {}
+        if start_method == "forkserver":
+            t = time.monotonic()
+            self._ctrl, theirs = socket.socketpair()
+            try:
+                self._server = subprocess.Popen(
+                    [sys.executable, "-c", _BOOT.format("_serve"), str(theirs.fileno())],
+                    pass_fds=(theirs.fileno(),),
+                    env=_boot_env(),
+                )
+            except BaseException:
+                self._ctrl.close()
+                raise
+            finally:
+                theirs.close()
+            self._ctrl_file = self._ctrl.makefile("rb")
+            try:
+                if self._ctrl_file.readline() != b"ready\n":
+                    raise RuntimeError("supervisor fork server failed to start")
+            except BaseException:
+                # Do not leak a server that never became ready
+                self._server.kill()
+                self._server.wait()
+                self._ctrl_file.close()
+                self._ctrl.close()
+                raise
+            self.server_start_s = time.monotonic() - t
+
+    def start(self, target: str) -> Tuple[int, Connection]:
+        ours, theirs = socket.socketpair()
+        try:
+            if self._ctrl is not None:
+                socket.send_fds(self._ctrl, [target.encode()], [theirs.fileno()])
+                line = self._ctrl_file.readline()
+                if not line:
+                    raise RuntimeError("supervisor fork server exited")
+                pid = int(line)
+            else:
+                proc = subprocess.Popen(
+                    [sys.executable, "-c", _BOOT.format("_spawned"), str(theirs.fileno()), target],
+                    pass_fds=(theirs.fileno(),),
+                    env=_boot_env(),
+                )
+                pid = proc.pid
+                self._procs[pid] = proc
+        finally:
+            theirs.close()
+        return pid, Connection(ours.detach())
+
+    def reap(self, pid: int) -> None:
+        proc = self._procs.pop(pid, None)
+        if proc is not None:
+            proc.wait()
+
+    def close(self) -> None:
+        for pid in list(self._procs):
+            self._procs[pid].kill()
+            self.reap(pid)
+        if self._server is not None:
+            self._ctrl_file.close()
+            self._ctrl.close()
+            self._server.wait()
+
+
+def supervise(
+    target: str,
+    kwargs: Dict[str, Any],
+    cuts: Dict[int, PowerCut],
+    *,
+    max_restarts: int,
+    start_method: str = "forkserver",
+) -> SupervisedRun:
+    """
+    Run target ("module:function", called with link=ChildLink plus kwargs)
+    in a child process and deliver `cuts` as real signals at its stage
+    gates. After a SIGKILL the process is gone and a fresh one is started,
+    which must resume from the workload's own durable checkpoint; the
+    supervisor measures each cold (re)start. More than max_restarts kills
+    end the run.
+
+    "forkserver" forks each process from a lean, pre-started interpreter
+    that has imported nothing of the workload, so spawn_s is just the fork
+    and import_s a cold import. "spawn" starts a fresh interpreter each
+    time, which spawn_s then includes.
+    """
+    if start_method not in START_METHODS:
+        raise ValueError(f"Unknown start method: {start_method!r} (expected one of {START_METHODS})")
+    blob = pickle.dumps(kwargs)
+
+    launcher = _Launcher(start_method)
+    t0 = time.monotonic()
+    starts: List[ColdStart] = []
+    stops: List[PowerStop] = []
+    killed_info: List[Any] = []
+    usage: List[ResourceUsage] = []
+    t_down = t0
+    try:
+        while True:
+            t_spawn = time.monotonic()
+            pid, conn = launcher.start(target)
+            try:
+                conn.send_bytes(blob)
+                outcome = _drive(conn, pid, cuts, t_down, t_spawn, starts, stops, usage)
+            finally:
+                conn.close()
+                launcher.reap(pid)
+            if outcome[0] == "done" or len(killed_info) >= max_restarts:
+                break
+            _, stage, info, t_down = outcome
+            killed_info.append(info)
+    finally:
+        launcher.close()
+
+    failed_stage: Optional[int] = None
+    if outcome[0] == "killed":
+        killed_info.append(outcome[2])
+        failed_stage = outcome[1]
+    return SupervisedRun(
+        result=outcome[1] if outcome[0] == "done" else None,
+        duration_s=time.monotonic() - t0,
+        server_start_s=launcher.server_start_s,
+        start=starts[0],
+        restarts=tuple(starts[1:]),
+        stops=tuple(stops),
+        killed_info=tuple(killed_info),
+        start_method=start_method,
+        failed_stage=failed_stage,
+        resources=sum(usage[1:], usage[0]) if usage else None,
+    )
+
+
+def _drive(
+    conn: Connection,
+    pid: int,
+    cuts: Dict[int, PowerCut],
+    t_down: float,
+    t_spawn: float,
+    starts: List[ColdStart],
+    stops: List[PowerStop],
+    usage: List[ResourceUsage],
+) -> Tuple[Any, ...]:
+    # One process lifetime: ("done", result) or ("killed", stage, info, t_kill).
+    # Its last reported resource usage is appended to `usage`.
+    t_started = t_imported = 0.0
+    first = True
+    last: Optional[ResourceUsage] = None
+    while True:
+        try:
+            msg = conn.recv()
+        except EOFError:
+            raise RuntimeError(f"supervised workload process {pid} exited unexpectedly")
+        kind = msg[0]
+        if kind == "started":
+            _, t_started, t_imported = msg
+        elif kind == "gate":
+            _, stage, info, t_gate, last = msg
+            if first:
+                first = False
+                starts.append(ColdStart(
+                    stage=stage,
+                    total_s=t_gate - (t_down if starts else t_spawn),
+                    spawn_s=t_started - t_spawn,
+                    import_s=t_imported - t_started,
+                    restore_s=t_gate - t_imported,
+                ))
+            cut = cuts.get(stage)
+            if cut is not None and cut.signal == "kill":
+                os.kill(pid, signal.SIGKILL)
+                t_kill = time.monotonic()
+                _wait_closed(conn)
+                usage.append(last)
+                return ("killed", stage, info, t_kill)
+            if cut is not None:
+                os.kill(pid, signal.SIGSTOP)
+                t_stop = time.monotonic()
+                time.sleep(cut.hold_s)
+                os.kill(pid, signal.SIGCONT)
+                stops.append(PowerStop(stage=stage, stopped_s=time.monotonic() - t_stop))
+            conn.send(True)
+        elif kind == "done":
+            usage.append(msg[2])
+            return ("done", msg[1])
+        else:
+            raise RuntimeError(f"supervised workload failed: {msg[1]}")
+
+
+def _wait_closed(conn: Connection) -> None:
+    # A killed process's socket reaches EOF once the kernel has torn it down.
+    try:
+        while True:
+            conn.recv_bytes()
+    except (EOFError, OSError):
+        pass
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from OCRB.stress.base import sr2_level
+
+SR2_WAVEFORMS = ("sine", "square")
+
+
+@dataclass(frozen=True)
+class ThermalCycle:
+    """
+    SR-2 CPU availability over time: 1.0 when cool, min_availability at the
+    hot peak of each period_s cycle, following the SR-2 waveform. The cycle
+    is split into `phases` equal bins for reporting and enforced in slices
+    of slice_s (see Throttler).
+    """
+    period_s: float
+    min_availability: float
+    waveform: str = "sine"
+    offset_s: float = 0.0
+    phases: int = 8
+    slice_s: float = 0.005
+
+    def __post_init__(self) -> None:
+        if self.waveform not in SR2_WAVEFORMS:
+            raise ValueError(f"Unknown SR-2 waveform: {self.waveform!r} (expected one of {SR2_WAVEFORMS})")
+        if self.period_s <= 0.0 or self.slice_s <= 0.0:
+            raise ValueError("SR-2 period_s and slice_s must be > 0")
+        if not 0.0 < self.min_availability <= 1.0:
+            raise ValueError("SR-2 min_availability must be in (0, 1]")
+        if self.phases < 1:
+            raise ValueError("SR-2 phases must be >= 1")
+
+    def phase(self, t: float) -> float:
+        return ((t + self.offset_s) % self.period_s) / self.period_s
+
+    def availability(self, t: float) -> float:
+        return 1.0 - (1.0 - self.min_availability) * sr2_level(self.phase(t), self.waveform)
+
+    def phase_bin(self, t: float) -> int:
+        return min(int(self.phase(t) * self.phases), self.phases - 1)
+
+    def phase_levels(self) -> List[float]:
+        """
+        Mean throttling (1 - availability) of each phase bin: the stress
+        level its throughput is reported at.
+        """
+        samples = 64
+        out = []
+        for k in range(self.phases):
+            mean = sum(
+                sr2_level((k + (j + 0.5) / samples) / self.phases, self.waveform) for j in range(samples)
+            ) / samples
+            out.append(round((1.0 - self.min_availability) * mean, 6))
+        return out
+
+    @classmethod
+    def from_sr2(cls, sr2: Optional[Dict[str, Any]], seed: int) -> Optional[ThermalCycle]:
+        """
+        Cycle declared by SR-2, or None if it does not throttle the CPU.
+        Keys: period_s, min_availability, waveform, phases, slice_s and
+        phase_offset_s (default: seeded, uniform over the period).
+        """
+        sr2 = sr2 or {}
+        if "min_availability" not in sr2 or not sr2.get("period_s"):
+            return None
+        period = float(sr2["period_s"])
+        offset = sr2.get("phase_offset_s")
+        return cls(
+            period_s=period,
+            min_availability=float(sr2["min_availability"]),
+            waveform=str(sr2.get("waveform", "sine")),
+            offset_s=float(offset) if offset is not None else random.Random(seed).random() * period,
+            phases=int(sr2.get("phases", 8)),
+            slice_s=float(sr2.get("slice_s", 0.005)),
+        )
+
+
+@dataclass
+class PhaseStats:
+    """
+    Work and wall time per phase bin, and time spent throttled. Merged
+    across workers with `+`.
+    """
+    units: List[int]
+    wall_s: List[float]
+    slept_s: float = 0.0
+
+    @classmethod
+    def empty(cls, phases: int) -> PhaseStats:
+        return cls(units=[0] * phases, wall_s=[0.0] * phases)
+
+    def __add__(self, other: PhaseStats) -> PhaseStats:
+        return PhaseStats(
+            units=[a + b for a, b in zip(self.units, other.units)],
+            wall_s=[a + b for a, b in zip(self.wall_s, other.wall_s)],
+            slept_s=self.slept_s + other.slept_s,
+        )
+
+    def busy_share(self) -> float:
+        """
+        Share of the run's wall time not spent throttled (1.0 if unknown).
+        """
+        wall = sum(self.wall_s)
+        return 1.0 - self.slept_s / wall if wall > 0.0 else 1.0
+
+    def relative_throughput(self) -> List[Optional[float]]:
+        """
+        Throughput in each phase bin relative to unthrottled throughput
+        (all work over all time not spent throttled); None for a bin the
+        run never spent time in.
+        """
+        busy = sum(self.wall_s) - self.slept_s
+        total = sum(self.units)
+        if busy <= 0.0 or total == 0:
+            return [None] * len(self.units)
+        full = total / busy
+        return [
+            min(1.0, (u / w) / full) if w > 0.0 else None
+            for u, w in zip(self.units, self.wall_s)
+        ]
+
+
+class Throttler:
+    """
+    Cooperative SR-2 duty cycle. The work loop calls it with the units done
+    since its last call, every few units; within each slice_s slice the
+    work may run for availability * slice_s and is then put to sleep until
+    the slice ends.
+
+    One throttler may be shared by the threads of a process: it is locked
+    and sleeps while holding the lock, so the process as a whole runs at the
+    cycle's availability. A copy sent to another process starts afresh.
+    Every throttler of a run shares `anchor` (a time.monotonic() reading),
+    so their cycles are in phase.
+    """
+    def __init__(
+        self,
+        cycle: ThermalCycle,
+        anchor: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.cycle = cycle
+        self.anchor = anchor
+        self.clock = clock
+        self.sleep = sleep
+        self.stats = PhaseStats.empty(cycle.phases)
+        self._lock = threading.Lock()
+        self._last: Optional[float] = None
+        self._slice_end = 0.0
+        self._budget_end = 0.0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __call__(self, units: int) -> None:
+        with self._lock:
+            now = self.clock()
+            t = now - self.anchor
+            k = self.cycle.phase_bin(t)
+            self.stats.units[k] += units
+            if self._last is not None:
+                self.stats.wall_s[k] += now - self._last
+            self._last = now
+            if now >= self._slice_end:
+                self._new_slice(now)
+            elif now >= self._budget_end:
+                self.sleep(self._slice_end - now)
+                woke = self.clock()
+                self.stats.wall_s[k] += woke - now
+                self.stats.slept_s += woke - now
+                self._last = woke
+                self._new_slice(woke)
+
+    def _new_slice(self, now: float) -> None:
+        self._slice_end = now + self.cycle.slice_s
+        self._budget_end = now + self.cycle.availability(now - self.anchor) * self.cycle.slice_s
+
+
+def phase_evidence(cycle: ThermalCycle, stats: PhaseStats) -> List[Tuple[int, float, float]]:
+    """
+    (phase bin, stress level, relative throughput) for every bin the run
+    spent time in.
+    """
+    levels = cycle.phase_levels()
+    return [
+        (k, levels[k], rate)
+        for k, rate in enumerate(stats.relative_throughput())
+        if rate is not None
+    ]
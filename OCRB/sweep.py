@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from OCRB.report.writer import write_sweep_index
+from OCRB.runner import _prepare_baseline, run_benchmark
+
+
+@dataclass(frozen=True)
+class SweepCell:
+    """
+    One (workload, stress profile, master seed) benchmark of a sweep.
+    """
+    workload_id: str
+    workload_version: str
+    stress_profile_id: str
+    stress_parameters: Dict[str, Any]
+    master_seed: int
+    n_runs: int = 10
+    gds_levels: Optional[List[float]] = None
+    isolation_duration_declared: Optional[float] = None
+    C_total: Optional[int] = None
+
+    @property
+    def cell_id(self) -> str:
+        return f"{self.workload_id}__{self.stress_profile_id}__seed{self.master_seed}"
+
+
+def expand_matrix(matrix: Dict[str, Any]) -> List[SweepCell]:
+    """
+    Expand a matrix declaration into cells (workloads x profiles x seeds):
+
+      {
+        "workloads": [{"id": "W1-A", "version": "0.1", "C_total": 5}, ...],
+        "profiles":  [{"id": "SP-0", "stress_parameters": {}}, ...],
+        "seeds":     [1, 2, 3],
+        "n_runs": 10,
+        "gds_levels": [0.1, 0.2, 0.3],
+        "isolation_duration_declared": 120.0,
+        "C_total": 5,
+      }
+
+    Workload entries may override n_runs / gds_levels /
+    isolation_duration_declared / C_total.
+    """
+    cells: List[SweepCell] = []
+    for w in matrix["workloads"]:
+        for p in matrix["profiles"]:
+            for seed in matrix["seeds"]:
+                cells.append(SweepCell(
+                    workload_id=w["id"],
+                    workload_version=w.get("version", "0.1"),
+                    stress_profile_id=p["id"],
+                    stress_parameters=p.get("stress_parameters", {}),
+                    master_seed=int(seed),
+                    n_runs=int(w.get("n_runs", matrix.get("n_runs", 10))),
+                    gds_levels=w.get("gds_levels", matrix.get("gds_levels")),
+                    isolation_duration_declared=w.get(
+                        "isolation_duration_declared", matrix.get("isolation_duration_declared")
+                    ),
+                    C_total=w.get("C_total", matrix.get("C_total")),
+                ))
+    ids = [c.cell_id for c in cells]
+    duplicates = sorted({x for x in ids if ids.count(x) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate sweep cells: {duplicates}")
+    return cells
+
+
+@dataclass
+class CellOutcome:
+    cell_id: str
+    path: str
+    status: str                       # "ok" | "failed"
+    duration_s: float
+    estimated_cost: float
+    error: Optional[str] = None
+    ori_mean: Optional[float] = None
+
+
+def _run_cell(
+    cell: SweepCell,
+    out_dir: str,
+    execution_environment: Dict[str, Any],
+    baseline_cache_dir: str,
+    clock: Optional[str],
+    resume: bool,
+) -> Dict[str, Any]:
+    t0 = time.time()
+    try:
+        run_benchmark(
+            out_dir=out_dir,
+            workload_id=cell.workload_id,
+            workload_version=cell.workload_version,
+            stress_profile_id=cell.stress_profile_id,
+            stress_parameters=cell.stress_parameters,
+            execution_environment=execution_environment,
+            master_seed=cell.master_seed,
+            n_runs=cell.n_runs,
+            gds_levels=cell.gds_levels,
+            isolation_duration_declared=cell.isolation_duration_declared,
+            C_total=cell.C_total,
+            clock=clock,
+            resume=resume,
+            baseline_cache_dir=baseline_cache_dir,
+        )
+    except Exception as e:
+        return {"status": "failed", "duration_s": time.time() - t0, "error": f"{type(e).__name__}: {e}"}
+    summary = json.loads((Path(out_dir) / "aggregate_summary.json").read_text())
+    return {"status": "ok", "duration_s": time.time() - t0, "ori_mean": summary["ori"]["mean"]}
+
+
+def run_sweep(
+    *,
+    out_dir: str,
+    cells: List[SweepCell],
+    execution_environment: Dict[str, Any],
+    workers: int = 1,
+    baseline_cache_dir: Optional[str] = None,
+    clock: Optional[str] = None,
+    resume: bool = False,
+) -> List[CellOutcome]:
+    """
+    Execute every cell into <out_dir>/cells/<cell_id>/ (standard report
+    layout) and write <out_dir>/sweep_index.json.
+
+    Shared work is done once up front: the SP-0 baseline of each distinct
+    workload is measured (or loaded) into the baseline cache, which every
+    cell then reads. Cells are scheduled longest-first across a process
+    pool, using n_runs x the real wall time of the workload's SP-0
+    execution as cost estimate (measured alike for every workload and
+    clock, unlike the baseline's resources).
+    """
+    root = Path(out_dir)
+    cache_dir = baseline_cache_dir or str(root / "baseline_cache")
+    baselines = _prepare_baselines(cells, execution_environment, cache_dir, clock)
+
+    ordered = sorted(cells, key=lambda c: _estimated_cost(c, baselines), reverse=True)
+    outcomes: Dict[str, CellOutcome] = {}
+
+    def record(cell: SweepCell, result: Dict[str, Any]) -> None:
+        outcomes[cell.cell_id] = CellOutcome(
+            cell_id=cell.cell_id,
+            path=_cell_path(cell),
+            estimated_cost=_estimated_cost(cell, baselines),
+            **result,
+        )
+
+    def args(cell: SweepCell) -> tuple:
+        return (cell, str(root / _cell_path(cell)), execution_environment, cache_dir, clock, resume)
+
+    if workers > 1 and len(ordered) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(ordered))) as pool:
+            futures = [(cell, pool.submit(_run_cell, *args(cell))) for cell in ordered]
+            for cell, f in futures:
+                record(cell, f.result())
+    else:
+        for cell in ordered:
+            record(cell, _run_cell(*args(cell)))
+
+    return _write_index(out_dir, cells, outcomes, cache_dir)
+
+
+def _cell_path(cell: SweepCell) -> str:
+    return str(Path("cells") / cell.cell_id)
+
+
+def _prepare_baselines(
+    cells: List[SweepCell],
+    execution_environment: Dict[str, Any],
+    cache_dir: str,
+    clock: Optional[str],
+) -> Dict[Tuple[str, str], float]:
+    """
+    SP-0 baseline of each distinct workload, measured once into cache_dir;
+    returns the real wall time of each workload's SP-0 execution.
+    """
+    baselines: Dict[Tuple[str, str], float] = {}
+    for cell in cells:
+        key = (cell.workload_id, cell.workload_version)
+        if key not in baselines:
+            _, baselines[key] = _prepare_baseline(
+                workload_id=cell.workload_id,
+                workload_version=cell.workload_version,
+                execution_environment=execution_environment,
+                cache_dir=cache_dir,
+                clock=clock,
+            )
+    return baselines
+
+
+def _estimated_cost(cell: SweepCell, baseline_wall_s: Dict[Tuple[str, str], float]) -> float:
+    return cell.n_runs * baseline_wall_s[(cell.workload_id, cell.workload_version)]
+
+
+def _write_index(
+    out_dir: str,
+    cells: List[SweepCell],
+    outcomes: Dict[str, CellOutcome],
+    cache_dir: str,
+) -> List[CellOutcome]:
+    # Index in declaration order
+    result = [outcomes[c.cell_id] for c in cells]
+    write_sweep_index(out_dir, {
+        "baseline_cache_dir": cache_dir,
+        "cells": [
+            {**asdict(o), "cell": asdict(c)}
+            for o, c in zip(result, cells)
+        ],
+    })
+    return result
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # not on Windows; only the mmap backend locks
+    fcntl = None
+
+FSYNC_POLICIES = ("none", "batch", "every")
+
+
+class CheckpointStore:
+    """
+    Durable W2-A progress (the next stage to execute).
+
+    save() returns the number of bytes written so callers can account for
+    checkpoint I/O; load() returns 0 when nothing has been saved yet.
+    clear() discards saved progress (a run starting over); close() releases
+    OS resources but keeps what was saved.
+    """
+    def save(self, next_stage: int) -> int:
+        raise NotImplementedError
+
+    def load(self) -> int:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryCheckpoint(CheckpointStore):
+    """
+    In-process checkpoint: survives a simulated crash within the run, but
+    touches no filesystem.
+    """
+    _SIZE = struct.calcsize("<q")
+
+    def __init__(self) -> None:
+        self._next_stage: Optional[int] = None
+
+    def save(self, next_stage: int) -> int:
+        self._next_stage = int(next_stage)
+        return self._SIZE
+
+    def load(self) -> int:
+        return self._next_stage or 0
+
+    def clear(self) -> None:
+        self._next_stage = None
+
+
+class FileCheckpoint(CheckpointStore):
+    """
+    Whole-file JSON checkpoint, rewritten through a temp file + rename.
+    A checkpoint that cannot be parsed is unrecoverable.
+    """
+    def __init__(self, run_dir: str):
+        Path(run_dir).mkdir(parents=True, exist_ok=True)
+        self.path = Path(run_dir) / "checkpoint.json"
+
+    def save(self, next_stage: int) -> int:
+        data = json.dumps({"next_stage": next_stage})
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(data)
+        tmp.replace(self.path)
+        return len(data)
+
+    def load(self) -> int:
+        if not self.path.exists():
+            return 0
+        try:
+            data = json.loads(self.path.read_text())
+            return int(data.get("next_stage", 0))
+        except Exception:
+            # corrupted checkpoint -> treat as unrecoverable
+            raise RuntimeError("checkpoint_corrupt")
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+        self.path.with_suffix(".tmp").unlink(missing_ok=True)
+
+
+# Journal record: payload length, CRC32 of payload, payload
+_RECORD_HEADER = struct.Struct("<II")
+
+
+class JournalCheckpoint(CheckpointStore):
+    """
+    Append-only checkpoint journal (checkpoint.journal).
+
+    Each save appends one record [length][crc32][payload]. load() scans to
+    the last record whose length and checksum are intact and truncates any
+    torn tail after it, so a partially written record costs only that
+    record rather than the whole checkpoint. The store remembers the offset
+    it has verified up to (including its own appends), so later loads scan
+    only records appended since.
+
+    compact_every:
+      Every record is a whole checkpoint, so after this many appends (0 =
+      never) the journal is replaced, through a temp file + rename, by its
+      last record. This bounds the scan a fresh store (a restarted process)
+      does on its first load.
+
+    fsync:
+      "none"  - leave flushing to the OS
+      "batch" - fsync every fsync_batch records and on close
+      "every" - fsync after every record
+    """
+    def __init__(self, run_dir: str, *, fsync: str = "none", fsync_batch: int = 8, compact_every: int = 64):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync!r} (expected one of {FSYNC_POLICIES})")
+        if fsync_batch < 1:
+            raise ValueError("fsync_batch must be >= 1")
+        if compact_every < 0:
+            raise ValueError("compact_every must be >= 0")
+        Path(run_dir).mkdir(parents=True, exist_ok=True)
+        self.path = Path(run_dir) / "checkpoint.journal"
+        self.fsync = fsync
+        self.fsync_batch = fsync_batch
+        self.compact_every = compact_every
+        self._fd: Optional[int] = None
+        self._unsynced = 0
+        self._appended = 0                  # records since the last compaction
+        # Journal known valid up to _verified (None: not scanned yet), where
+        # its last record holds _next_stage
+        self._verified: Optional[int] = None
+        self._next_stage = 0
+
+    def _open(self) -> int:
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        return self._fd
+
+    def save(self, next_stage: int) -> int:
+        payload = json.dumps({"next_stage": next_stage}, separators=(",", ":")).encode("utf-8")
+        record = _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        fd = self._open()
+        os.write(fd, record)
+        self._unsynced += 1
+        if self.fsync == "every" or (self.fsync == "batch" and self._unsynced >= self.fsync_batch):
+            os.fsync(fd)
+            self._unsynced = 0
+        if self._verified is not None:
+            self._verified += len(record)
+            self._next_stage = next_stage
+        self._appended += 1
+        if self.compact_every and self._appended >= self.compact_every:
+            return len(record) + self._compact(record, next_stage)
+        return len(record)
+
+    def _compact(self, record: bytes, next_stage: int) -> int:
+        self.close()
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(record)
+            if self.fsync != "none":
+                f.flush()
+                os.fsync(f.fileno())
+        tmp.replace(self.path)
+        self._appended = 0
+        self._verified = len(record)
+        self._next_stage = next_stage
+        return len(record)
+
+    def load(self) -> int:
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            self._verified, self._next_stage = 0, 0
+            return 0
+
+        # Resume the scan after the records already verified (the store is
+        # the journal's only writer), unless it has since been cut short
+        base = self._verified if self._verified is not None and self._verified <= size else 0
+        next_stage = self._next_stage if base else 0
+        with open(self.path, "rb") as f:
+            f.seek(base)
+            data = f.read()
+
+        end = 0
+        pos = 0
+        while pos + _RECORD_HEADER.size <= len(data):
+            length, crc = _RECORD_HEADER.unpack_from(data, pos)
+            start = pos + _RECORD_HEADER.size
+            payload = data[start:start + length]
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break
+            try:
+                next_stage = int(json.loads(payload)["next_stage"])
+            except (ValueError, KeyError, TypeError):
+                break
+            pos = end = start + length
+
+        if end < len(data):
+            # Drop the torn tail so later appends follow the last valid record.
+            self.close()
+            os.truncate(self.path, base + end)
+        self._verified, self._next_stage = base + end, next_stage
+        return next_stage
+
+    def clear(self) -> None:
+        self.close()
+        self.path.unlink(missing_ok=True)
+        self._appended = 0
+        self._verified, self._next_stage = 0, 0
+
+    def close(self) -> None:
+        if self._fd is not None:
+            if self.fsync == "batch" and self._unsynced:
+                os.fsync(self._fd)
+            os.close(self._fd)
+            self._fd = None
+            self._unsynced = 0
+
+
+# Slot: next_stage, CRC32 of next_stage; the rest of the page is unused
+_SLOT = struct.Struct("<qI")
+SLOT_SIZE = mmap.ALLOCATIONGRANULARITY
+
+
+class MmapSlotCheckpoint(CheckpointStore):
+    """
+    One fixed-size slot of a shared, memory-mapped slot file.
+
+    Many runs (and processes) checkpoint into a single file, run i owning
+    slot i, so a sweep creates one file instead of one per run. Slots are
+    page-sized and page-aligned: each store maps only its own slot. The
+    file grows (sparsely) under an exclusive lock as higher slots are used.
+
+    A slot that is all zeros has never been written; any other slot whose
+    checksum does not match is corrupt and unrecoverable.
+
+    fsync: as for JournalCheckpoint, applied as msync of the slot.
+
+    Needs POSIX file locks (fcntl) to grow the shared file.
+    """
+    def __init__(self, path: str, slot: int, *, fsync: str = "none", fsync_batch: int = 8):
+        if fcntl is None:
+            raise ValueError(f"The mmap checkpoint backend needs fcntl file locks, unavailable on {sys.platform}")
+        if slot < 0:
+            raise ValueError("slot must be >= 0")
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync!r} (expected one of {FSYNC_POLICIES})")
+        if fsync_batch < 1:
+            raise ValueError("fsync_batch must be >= 1")
+        self.path = Path(path)
+        self.slot = slot
+        self.fsync = fsync
+        self.fsync_batch = fsync_batch
+        self._map: Optional[mmap.mmap] = None
+        self._unsynced = 0
+
+    def _slot(self) -> mmap.mmap:
+        if self._map is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                end = (self.slot + 1) * SLOT_SIZE
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    if os.fstat(fd).st_size < end:
+                        os.ftruncate(fd, end)
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                self._map = mmap.mmap(fd, SLOT_SIZE, offset=self.slot * SLOT_SIZE)
+            finally:
+                os.close(fd)
+        return self._map
+
+    def save(self, next_stage: int) -> int:
+        value = struct.pack("<q", int(next_stage))
+        m = self._slot()
+        m[:_SLOT.size] = _SLOT.pack(int(next_stage), zlib.crc32(value))
+        self._unsynced += 1
+        if self.fsync == "every" or (self.fsync == "batch" and self._unsynced >= self.fsync_batch):
+            m.flush()
+            self._unsynced = 0
+        return _SLOT.size
+
+    def load(self) -> int:
+        raw = bytes(self._slot()[:_SLOT.size])
+        if raw == bytes(_SLOT.size):
+            return 0
+        next_stage, crc = _SLOT.unpack(raw)
+        if zlib.crc32(struct.pack("<q", next_stage)) != crc:
+            raise RuntimeError("checkpoint_corrupt")
+        return next_stage
+
+    def clear(self) -> None:
+        m = self._slot()
+        m[:_SLOT.size] = bytes(_SLOT.size)
+
+    def close(self) -> None:
+        if self._map is not None:
+            if self.fsync == "batch" and self._unsynced:
+                self._map.flush()
+            self._map.close()
+            self._map = None
+            self._unsynced = 0
+
+
+CHECKPOINT_BACKENDS = ("file", "journal", "memory", "mmap")
+
+
+def open_checkpoint_store(
+    backend: str,
+    run_dir: str,
+    *,
+    fsync: str = "none",
+    fsync_batch: int = 8,
+    compact_every: int = 64,
+    slot_file: Optional[str] = None,
+    slot: int = 0,
+) -> CheckpointStore:
+    """
+    Build a checkpoint store by name:
+      "file"    - checkpoint.json under run_dir
+      "journal" - checkpoint.journal under run_dir, compacted every
+                  compact_every records
+      "memory"  - in-process, no files
+      "mmap"    - slot `slot` of slot_file (default: run_dir/checkpoint.slots)
+    """
+    if backend == "file":
+        return FileCheckpoint(run_dir)
+    if backend == "journal":
+        return JournalCheckpoint(run_dir, fsync=fsync, fsync_batch=fsync_batch, compact_every=compact_every)
+    if backend == "memory":
+        return MemoryCheckpoint()
+    if backend == "mmap":
+        path = slot_file or str(Path(run_dir) / "checkpoint.slots")
+        return MmapSlotCheckpoint(path, slot, fsync=fsync, fsync_batch=fsync_batch)
+    raise ValueError(f"Unknown checkpoint backend: {backend!r} (expected one of {CHECKPOINT_BACKENDS})")
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import random
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+CHECKPOINT_STRATEGIES = ("full", "delta")
+
+PAGE_SIZE = 4096
+
+
+class PipelineState:
+    """
+    Synthetic W2-A state payload.
+
+    Starts at initial_bytes of seeded content; each stage overwrites
+    mutate_bytes at a seeded offset and appends growth_bytes. The content
+    after stage k depends only on (seed, k), so a pipeline restored from a
+    checkpoint and re-executing stages reproduces the same state.
+
+    Pages touched since the last checkpoint are tracked for delta
+    checkpoints.
+    """
+    def __init__(
+        self,
+        seed: int,
+        *,
+        initial_bytes: int = 0,
+        growth_bytes: int = 0,
+        mutate_bytes: int = 0,
+        page_size: int = PAGE_SIZE,
+        initial: Optional[bytes] = None,
+    ):
+        self.seed = seed
+        self.growth_bytes = growth_bytes
+        self.mutate_bytes = mutate_bytes
+        self.page_size = page_size
+        # `initial`, if given, is this seed's initial content generated earlier
+        self.data = bytearray(random.Random(seed).randbytes(initial_bytes) if initial is None else initial)
+        self._dirty: Set[int] = set(range(self._n_pages()))
+
+    def _n_pages(self) -> int:
+        return -(-len(self.data) // self.page_size)
+
+    def _touch(self, start: int, stop: int) -> None:
+        if stop > start:
+            self._dirty.update(range(start // self.page_size, (stop - 1) // self.page_size + 1))
+
+    def advance(self, stage: int) -> None:
+        rng = random.Random(self.seed * 1_000_003 + stage)
+        if self.mutate_bytes and self.data:
+            n = min(self.mutate_bytes, len(self.data))
+            off = rng.randrange(len(self.data) - n + 1)
+            self.data[off:off + n] = rng.randbytes(n)
+            self._touch(off, off + n)
+        if self.growth_bytes:
+            off = len(self.data)
+            self.data += rng.randbytes(self.growth_bytes)
+            self._touch(off, len(self.data))
+
+    def mark_dirty(self, byte_offsets: Iterable[int]) -> None:
+        """
+        Record bytes changed outside advance() (e.g. SR-1 bit flips).
+        """
+        self._dirty.update({off // self.page_size for off in byte_offsets})
+
+    def dirty_pages(self) -> List[int]:
+        return sorted(self._dirty)
+
+    def mark_clean(self) -> None:
+        self._dirty.clear()
+
+    def restore(self, data: bytearray) -> None:
+        self.data = data
+        self._dirty.clear()
+
+
+# Framing shared by snapshot files and delta log records: length, CRC32, body
+_FRAME = struct.Struct("<II")
+_SNAPSHOT = struct.Struct("<qQ")          # stage, state length
+_DELTA = struct.Struct("<qQI")            # stage, state length, page count
+_PAGE = struct.Struct("<I")               # page index (page bytes follow)
+
+
+def _frame(body: bytes) -> bytes:
+    return _FRAME.pack(len(body), zlib.crc32(body)) + body
+
+
+def _unframe(buf: bytes) -> Iterator[bytes]:
+    """
+    Intact frames of buf, stopping at the first torn or damaged one.
+    """
+    pos = 0
+    while pos + _FRAME.size <= len(buf):
+        length, crc = _FRAME.unpack_from(buf, pos)
+        body = buf[pos + _FRAME.size:pos + _FRAME.size + length]
+        if len(body) < length or zlib.crc32(body) != crc:
+            return
+        yield body
+        pos += _FRAME.size + length
+
+
+class _MemoryBlobs:
+    def __init__(self) -> None:
+        self.snapshot: Optional[bytes] = None
+        self.deltas: List[bytes] = []
+
+    def write_snapshot(self, frame: bytes) -> None:
+        self.snapshot = frame
+        self.deltas = []
+
+    def append_delta(self, frame: bytes) -> None:
+        self.deltas.append(frame)
+
+    def read(self) -> Tuple[Optional[bytes], bytes]:
+        return self.snapshot, b"".join(self.deltas)
+
+    def size(self) -> int:
+        return len(self.snapshot or b"") + sum(len(d) for d in self.deltas)
+
+    def clear(self) -> None:
+        self.snapshot = None
+        self.deltas = []
+
+
+class _FileBlobs:
+    """
+    state.snap (replaced atomically) + state.delta (append-only log).
+    """
+    def __init__(self, run_dir: str):
+        Path(run_dir).mkdir(parents=True, exist_ok=True)
+        self.snap = Path(run_dir) / "state.snap"
+        self.delta = Path(run_dir) / "state.delta"
+
+    def write_snapshot(self, frame: bytes) -> None:
+        tmp = self.snap.with_suffix(".tmp")
+        tmp.write_bytes(frame)
+        tmp.replace(self.snap)
+        # Deltas up to the snapshot are superseded by it
+        self.delta.unlink(missing_ok=True)
+
+    def append_delta(self, frame: bytes) -> None:
+        with open(self.delta, "ab") as f:
+            f.write(frame)
+
+    def read(self) -> Tuple[Optional[bytes], bytes]:
+        try:
+            snap: Optional[bytes] = self.snap.read_bytes()
+        except FileNotFoundError:
+            snap = None
+        try:
+            deltas = self.delta.read_bytes()
+        except FileNotFoundError:
+            deltas = b""
+        return snap, deltas
+
+    def size(self) -> int:
+        return sum(p.stat().st_size for p in (self.snap, self.delta) if p.exists())
+
+    def clear(self) -> None:
+        for p in (self.snap, self.snap.with_suffix(".tmp"), self.delta):
+            p.unlink(missing_ok=True)
+
+
+class StateCheckpointer:
+    """
+    Checkpoints a PipelineState alongside the pipeline's progress.
+
+    strategy:
+      "full"  - every checkpoint writes a snapshot of the whole state
+      "delta" - the first checkpoint is a snapshot; later ones append only
+                the pages touched since the previous checkpoint. Every
+                compact_every deltas (0 = never) a fresh snapshot replaces
+                the snapshot + delta log.
+
+    Storage is in process ("memory") or state.snap / state.delta under
+    run_dir ("file"). restore(stage) rebuilds the state saved for `stage`.
+    """
+    def __init__(self, strategy: str, *, storage: str, run_dir: str, compact_every: int = 0):
+        if strategy not in CHECKPOINT_STRATEGIES:
+            raise ValueError(f"Unknown checkpoint strategy: {strategy!r} (expected one of {CHECKPOINT_STRATEGIES})")
+        if compact_every < 0:
+            raise ValueError("compact_every must be >= 0")
+        self.strategy = strategy
+        self.compact_every = compact_every
+        self._blobs = _MemoryBlobs() if storage == "memory" else _FileBlobs(run_dir)
+        self._has_snapshot = False
+        self._deltas = 0
+
+    def save(self, state: PipelineState, stage: int) -> int:
+        """
+        Checkpoint state as of `stage`; returns bytes written.
+        """
+        full = (
+            self.strategy == "full"
+            or not self._has_snapshot
+            or (self.compact_every and self._deltas >= self.compact_every)
+        )
+        if full:
+            frame = _frame(_SNAPSHOT.pack(stage, len(state.data)) + bytes(state.data))
+            self._blobs.write_snapshot(frame)
+            self._has_snapshot = True
+            self._deltas = 0
+        else:
+            pages = state.dirty_pages()
+            ps = state.page_size
+            parts = [_DELTA.pack(stage, len(state.data), len(pages))]
+            for p in pages:
+                parts.append(_PAGE.pack(p))
+                parts.append(bytes(state.data[p * ps:(p + 1) * ps]))
+            frame = _frame(b"".join(parts))
+            self._blobs.append_delta(frame)
+            self._deltas += 1
+        state.mark_clean()
+        return len(frame)
+
+    def restore(self, stage: int, page_size: int = PAGE_SIZE) -> bytearray:
+        snap, deltas = self._blobs.read()
+        frames = list(_unframe(snap)) if snap else []
+        if not frames:
+            raise RuntimeError("checkpoint_corrupt")
+        body = frames[0]
+        at, length = _SNAPSHOT.unpack_from(body)
+        data = bytearray(body[_SNAPSHOT.size:_SNAPSHOT.size + length])
+        n_deltas = 0
+        for body in _unframe(deltas):
+            d_stage, length, n_pages = _DELTA.unpack_from(body)
+            if d_stage <= at:
+                continue
+            if d_stage > stage:
+                break
+            del data[length:]
+            data.extend(bytes(length - len(data)))
+            pos = _DELTA.size
+            for _ in range(n_pages):
+                (p,) = _PAGE.unpack_from(body, pos)
+                pos += _PAGE.size
+                n = min(page_size, length - p * page_size)
+                data[p * page_size:p * page_size + n] = body[pos:pos + n]
+                pos += n
+            at = d_stage
+            n_deltas += 1
+        if at != stage:
+            # Progress and state checkpoints disagree
+            raise RuntimeError("checkpoint_corrupt")
+        self._has_snapshot = True
+        self._deltas = n_deltas
+        return data
+
+    def size_bytes(self) -> int:
+        return self._blobs.size()
+
+    def clear(self) -> None:
+        self._blobs.clear()
+        self._has_snapshot = False
+        self._deltas = 0
+
+
+def state_checkpointer_for(backend: str, run_dir: str, strategy: str, compact_every: int) -> StateCheckpointer:
+    """
+    State payload storage matching a checkpoint backend: in process for
+    "memory", files under run_dir otherwise.
+    """
+    return StateCheckpointer(
+        strategy,
+        storage="memory" if backend == "memory" else "file",
+        run_dir=run_dir,
+        compact_every=compact_every,
+    )
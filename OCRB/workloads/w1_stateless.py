@@ -2,7 +2,21 @@ from __future__ import annotations
 
 import hashlib
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from OCRB.stress.base import StressTimeline
+from OCRB.stress.thermal import PhaseStats, ThermalCycle, Throttler
+
+# Work units between calls into an SR-2 throttler
+_THROTTLE_EVERY = 32
+
+
+@dataclass(frozen=True)
+class W1AConfig:
+    tasks: int = 100
+    work_units_per_task: int = 2000
 
 
 @dataclass(frozen=True)
@@ -11,37 +25,154 @@ class W1AResult:
     tasks_completed: int
     work_done: int
     duration_s: float
+    checksum: int = 0
+    shard_durations_s: Tuple[float, ...] = ()   # one entry per shard (parallel mode only)
+    phase_stats: Optional[PhaseStats] = None    # SR-2 thermal cycle only, merged over shards
+
 
+@dataclass(frozen=True)
+class _ShardResult:
+    completed: int
+    checksum: int
+    duration_s: float
+    phase_stats: Optional[PhaseStats] = None
 
-def _cpu_work(units: int, seed: int) -> int:
+
+def _cpu_work(units: int, seed: int, throttle: Optional[Callable[[int], None]] = None) -> int:
     """
     Deterministic CPU-bound work. Returns checksum so the loop isn't "empty".
+    throttle(n), if given, is called after every chunk of n units.
     """
     h = hashlib.sha256(str(seed).encode("utf-8")).digest()
     acc = 0
-    for i in range(units):
-        h = hashlib.sha256(h + i.to_bytes(4, "little")).digest()
-        acc ^= int.from_bytes(h[:4], "little")
+    step = _THROTTLE_EVERY if throttle is not None else max(units, 1)
+    for start in range(0, units, step):
+        stop = min(start + step, units)
+        for i in range(start, stop):
+            h = hashlib.sha256(h + i.to_bytes(4, "little")).digest()
+            acc ^= int.from_bytes(h[:4], "little")
+        if throttle is not None:
+            throttle(stop - start)
     return acc
 
 
-def run_w1a(tasks: int, work_units_per_task: int, seed: int) -> W1AResult:
+def _run_shard(
+    start: int,
+    stop: int,
+    work_units_per_task: int,
+    seed: int,
+    timeline: Optional[StressTimeline] = None,
+    throttle: Optional[Throttler] = None,
+) -> _ShardResult:
     """
-    Stateless workload: N independent tasks, deterministic work.
+    Execute tasks [start, stop). Sub-seeds depend only on (seed, task index),
+    so any partition of the task range yields the same merged result.
     """
     t0 = time.time()
     completed = 0
     checksum = 0
 
-    for i in range(tasks):
+    for i in range(start, stop):
         sub_seed = (seed * 1_000_003 + i) & 0xFFFFFFFF
         try:
-            checksum ^= _cpu_work(work_units_per_task, sub_seed)
+            if timeline is not None and timeline.fault_at(i):
+                raise RuntimeError("transient_fault")
+            checksum ^= _cpu_work(work_units_per_task, sub_seed, throttle)
             completed += 1
         except Exception:
             # Stateless tasks: failure means "didn't complete"
             pass
 
+    return _ShardResult(
+        completed=completed,
+        checksum=checksum,
+        duration_s=time.time() - t0,
+        phase_stats=throttle.stats if throttle is not None else None,
+    )
+
+
+def _shard_bounds(tasks: int, shards: int) -> List[Tuple[int, int]]:
+    # Contiguous, near-equal ranges; the first (tasks % shards) shards take one extra task.
+    base, extra = divmod(tasks, shards)
+    bounds = []
+    start = 0
+    for k in range(shards):
+        stop = start + base + (1 if k < extra else 0)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def run_w1a(
+    tasks: int,
+    work_units_per_task: int,
+    seed: int,
+    *,
+    workers: Optional[int] = None,
+    executor: str = "process",
+    timeline: Optional[StressTimeline] = None,
+    thermal: Optional[ThermalCycle] = None,
+) -> W1AResult:
+    """
+    Stateless workload: N independent tasks, deterministic work.
+
+    workers:
+      If > 1, tasks are split into `workers` contiguous shards executed on a
+      pool ("process" or "thread" executor). Completion counts and the XOR
+      checksum are merged, so results match serial execution; per-shard wall
+      time is reported in shard_durations_s.
+
+    timeline:
+      Optional compiled stress timeline with one tick per task; a task whose
+      tick carries an SR-1 fault does not complete.
+
+    thermal:
+      Optional SR-2 thermal cycle. Work is duty-cycled to the cycle's CPU
+      availability (threads share one throttler, worker processes throttle
+      individually, all in phase), and per-phase work and wall time are
+      returned in phase_stats.
+    """
+    t0 = time.time()
+    throttle = Throttler(thermal, time.monotonic()) if thermal is not None else None
+
+    if workers is None or workers <= 1 or tasks <= 1:
+        shard = _run_shard(0, tasks, work_units_per_task, seed, timeline, throttle)
+        return W1AResult(
+            tasks_total=tasks,
+            tasks_completed=shard.completed,
+            work_done=shard.completed,
+            duration_s=time.time() - t0,
+            checksum=shard.checksum,
+            phase_stats=shard.phase_stats,
+        )
+
+    if executor == "process":
+        pool_cls = ProcessPoolExecutor
+    elif executor == "thread":
+        pool_cls = ThreadPoolExecutor
+    else:
+        raise ValueError(f"Unknown executor: {executor!r} (expected 'process' or 'thread')")
+
+    bounds = _shard_bounds(tasks, min(workers, tasks))
+    with pool_cls(max_workers=len(bounds)) as pool:
+        futures = [
+            pool.submit(_run_shard, start, stop, work_units_per_task, seed, timeline, throttle)
+            for start, stop in bounds
+        ]
+        shards = [f.result() for f in futures]
+
+    completed = 0
+    checksum = 0
+    phase_stats = None
+    if throttle is not None:
+        # Threads share the throttler; each worker process throttled a copy
+        phase_stats = throttle.stats
+        if executor == "process":
+            phase_stats = sum((s.phase_stats for s in shards), PhaseStats.empty(thermal.phases))
+    for shard in shards:
+        completed += shard.completed
+        checksum ^= shard.checksum
+
     dt = time.time() - t0
 
     return W1AResult(
@@ -49,4 +180,7 @@ def run_w1a(tasks: int, work_units_per_task: int, seed: int) -> W1AResult:
         tasks_completed=completed,
         work_done=completed,
         duration_s=dt,
+        checksum=checksum,
+        shard_durations_s=tuple(s.duration_s for s in shards),
+        phase_stats=phase_stats,
     )
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import json
-import os
-import time
+import asyncio
+import zlib
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Awaitable, Callable, Generator, Iterable, Optional, Tuple
+
+from OCRB.measure.clock import Clock, SystemClock
+from OCRB.stress.base import StressTimeline
+from OCRB.workloads.checkpoint import CheckpointStore, open_checkpoint_store
+from OCRB.workloads.state import PipelineState, StateCheckpointer, state_checkpointer_for
 
 
 @dataclass(frozen=True)
@@ -16,6 +19,20 @@ class W2AConfig:
     external_required_every: int = 1          # how often we require external call (in stages)
     external_grace_failures: int = 10         # how many consecutive external failures tolerated
     stage_work_s: float = 0.005               # small delay to make timing measurable
+    checkpoint_backend: str = "file"          # see OCRB.workloads.checkpoint
+    checkpoint_fsync: str = "none"            # journal fsync policy: none | batch | every
+    checkpoint_fsync_batch: int = 8
+    checkpoint_compact_every: int = 64        # journal: compact after this many records (0 = never)
+    # Synthetic state payload (see OCRB.workloads.state); none by default
+    state_initial_bytes: int = 0
+    state_growth_bytes: int = 0               # appended per stage
+    state_mutate_bytes: int = 0               # overwritten per stage
+    checkpoint_strategy: str = "full"         # state checkpoints: full | delta
+    compact_every: int = 0                    # delta: snapshot after this many deltas (0 = never)
+
+    @property
+    def has_state(self) -> bool:
+        return bool(self.state_initial_bytes or self.state_growth_bytes)
 
 
 @dataclass(frozen=True)
@@ -25,47 +42,52 @@ class W2AResult:
     restarts: int
     duration_s: float
     failed: bool
+    # Checkpoint I/O (write latency measured on the run's clock)
+    checkpoint_writes: int = 0
+    checkpoint_bytes: int = 0
+    checkpoint_write_s: float = 0.0
+    # Restores from a saved checkpoint (restore latency measured on the run's clock)
+    checkpoint_restores: int = 0
+    checkpoint_restore_s: float = 0.0
+    # State payload at the end of the run and its checkpoint footprint
+    state_bytes: int = 0
+    state_crc32: int = 0
+    checkpoint_size_bytes: int = 0
 
 
-def _load_checkpoint(path: Path) -> int:
-    if not path.exists():
-        return 0
-    try:
-        data = json.loads(path.read_text())
-        return int(data.get("next_stage", 0))
-    except Exception:
-        # corrupted checkpoint -> treat as unrecoverable
-        raise RuntimeError("checkpoint_corrupt")
+@dataclass(frozen=True)
+class CheckpointIO:
+    """
+    Checkpoint I/O of a run so far (the W2AResult fields of the same name).
+    """
+    writes: int = 0
+    bytes: int = 0
+    write_s: float = 0.0
+    restores: int = 0
+    restore_s: float = 0.0
 
 
-def _save_checkpoint(path: Path, next_stage: int) -> None:
-    tmp = path.with_suffix(".tmp")
-    tmp.write_text(json.dumps({"next_stage": next_stage}))
-    tmp.replace(path)
+# Pipeline operations requested from a driver (see _pipeline)
+_LOAD = "load"           # -> next stage from the checkpoint
+_SAVE = "save"           # (next_stage) -> None
+_EXTERNAL = "external"   # -> None, or raises when unavailable
+_WORK = "work"           # (stage, seconds) -> None
 
 
-def run_w2a(
-    *,
-    run_dir: str,
+def _pipeline(
     seed: int,
     cfg: W2AConfig,
-    external_call: Callable[[], None],
-    should_crash: Optional[Callable[[int, int], bool]] = None,
-) -> W2AResult:
+    should_crash: Optional[Callable[[int, int], bool]],
+    timeline: Optional[StressTimeline],
+) -> Generator[Tuple[Any, ...], Any, Tuple[int, int, bool]]:
     """
-    Stateful pipeline:
-    - progresses through N stages
-    - checkpoints every K stages
-    - may "crash" deterministically at stages (should_crash hook)
-    - depends on external_call; during isolation external_call should raise
+    W2-A control flow, independent of how I/O and waits are performed.
 
-    Autonomous recovery is: restart pipeline from last checkpoint.
+    Yields (op, *args) tuples; the driver performs the operation and sends
+    back its result, or throws its exception into the generator. Returns
+    (stages_completed, restarts, failed). Shared by run_w2a and
+    run_w2a_async so both execute exactly the same pipeline.
     """
-    rd = Path(run_dir)
-    rd.mkdir(parents=True, exist_ok=True)
-    ckpt = rd / "checkpoint.json"
-
-    t0 = time.time()
     restarts = 0
     stages_completed = 0
 
@@ -73,19 +95,23 @@ def run_w2a(
     consecutive_ext_failures = 0
 
     # Determine resume point
-    next_stage = _load_checkpoint(ckpt)
+    next_stage = yield (_LOAD,)
 
     while True:
         try:
             for stage in range(next_stage, cfg.stages):
                 # optional deterministic crash injection point
+                if timeline is not None and timeline.crash_at(stage):
+                    raise RuntimeError("simulated_crash")
                 if should_crash and should_crash(seed, stage):
                     raise RuntimeError("simulated_crash")
 
                 # external dependency requirement
                 if (stage % cfg.external_required_every) == 0:
                     try:
-                        external_call()
+                        if timeline is not None and not timeline.external_available_at(stage):
+                            raise RuntimeError("isolated")
+                        yield (_EXTERNAL,)
                         consecutive_ext_failures = 0
                     except Exception:
                         consecutive_ext_failures += 1
@@ -93,40 +119,328 @@ def run_w2a(
                             raise RuntimeError("external_unavailable")
 
                 # simulate useful work
-                if cfg.stage_work_s:
-                    time.sleep(cfg.stage_work_s)
+                yield (_WORK, stage, cfg.stage_work_s)
 
                 stages_completed = stage + 1
 
                 # checkpointing
                 if (stages_completed % cfg.checkpoint_every) == 0:
-                    _save_checkpoint(ckpt, stages_completed)
+                    yield (_SAVE, stages_completed)
 
             # completed all stages
-            _save_checkpoint(ckpt, cfg.stages)
-            dt = time.time() - t0
-            return W2AResult(
-                stages_total=cfg.stages,
-                stages_completed=cfg.stages,
-                restarts=restarts,
-                duration_s=dt,
-                failed=False,
-            )
+            yield (_SAVE, cfg.stages)
+            return cfg.stages, restarts, False
 
         except RuntimeError as e:
             reason = str(e)
             if reason in ("simulated_crash",) and restarts < cfg.max_restarts:
                 # autonomous recovery: restart from last saved checkpoint
                 restarts += 1
-                next_stage = _load_checkpoint(ckpt)
+                next_stage = yield (_LOAD,)
                 continue
 
             # unrecoverable or exceeded restarts
-            dt = time.time() - t0
-            return W2AResult(
-                stages_total=cfg.stages,
-                stages_completed=stages_completed,
-                restarts=restarts,
-                duration_s=dt,
-                failed=True,
+            return stages_completed, restarts, True
+
+
+def run_w2a(
+    *,
+    run_dir: str,
+    seed: int,
+    cfg: W2AConfig,
+    external_call: Callable[[], None],
+    should_crash: Optional[Callable[[int, int], bool]] = None,
+    clock: Optional[Clock] = None,
+    timeline: Optional[StressTimeline] = None,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    state_faults: Optional[Callable[[int, bytearray], Iterable[int]]] = None,
+    stage_gate: Optional[Callable[[int, CheckpointIO], None]] = None,
+    initial_state: Optional[bytes] = None,
+) -> W2AResult:
+    """
+    Stateful pipeline:
+    - progresses through N stages
+    - checkpoints every K stages
+    - may "crash" deterministically at stages (timeline CRASH ticks or should_crash hook)
+    - depends on external_call; unavailable while the timeline marks the stage
+      isolated / lost, or whenever external_call raises
+
+    Autonomous recovery is: restart pipeline from last checkpoint.
+
+    Stage work and duration are taken from `clock` (wall clock by default), so a
+    SimulatedClock runs the pipeline without real sleeps.
+
+    Progress is checkpointed to `checkpoint_store` if given, otherwise to the
+    cfg.checkpoint_backend store under run_dir; the store is closed on return.
+
+    state_faults(stage, data), if given, is called on the state payload after
+    each stage's work and may modify it in place (SR-1 bit flips); it returns
+    the byte offsets it changed.
+
+    stage_gate(stage, io), if given, is called as each stage begins (where
+    crashes are injected) with the checkpoint I/O so far; a supervisor uses
+    it to interrupt the process at a stage boundary.
+
+    initial_state, if given, is the state payload's initial content for this
+    seed, generated once and shared by runs that start from it.
+    """
+    if clock is None:
+        clock = SystemClock()
+
+    ck = _Checkpointing(
+        checkpoint_store or _open_store(run_dir, cfg), cfg, seed, run_dir, state_faults, initial_state
+    )
+    if stage_gate is not None:
+        crash_hook = should_crash
+
+        def should_crash(seed: int, stage: int) -> bool:
+            stage_gate(stage, ck.io())
+            return bool(crash_hook and crash_hook(seed, stage))
+
+    t0 = clock.now()
+    gen = _pipeline(seed, cfg, should_crash, timeline)
+    result: Any = None
+    error: Optional[BaseException] = None
+    try:
+        while True:
+            try:
+                op = gen.throw(error) if error is not None else gen.send(result)
+            except StopIteration as stop:
+                stages_completed, restarts, failed = stop.value
+                break
+            result, error = None, None
+            try:
+                if op[0] == _LOAD:
+                    t = clock.now()
+                    result = ck.load()
+                    ck.loaded(result, clock.now() - t)
+                elif op[0] == _SAVE:
+                    t = clock.now()
+                    nbytes = ck.save(op[1])
+                    ck.saved(nbytes, clock.now() - t)
+                elif op[0] == _EXTERNAL:
+                    external_call()
+                else:
+                    ck.advance(op[1])
+                    clock.sleep(op[2])
+            except Exception as e:
+                error = e
+    finally:
+        ck.close()
+
+    return ck.result(stages_completed, restarts, clock.now() - t0, failed)
+
+
+async def run_w2a_async(
+    *,
+    run_dir: str,
+    seed: int,
+    cfg: W2AConfig,
+    external_call: Callable[[], Awaitable[None]],
+    should_crash: Optional[Callable[[int, int], bool]] = None,
+    clock: Optional[Clock] = None,
+    timeline: Optional[StressTimeline] = None,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    save_checkpoint: Optional[Callable[[int], Awaitable[int]]] = None,
+    load_checkpoint: Optional[Callable[[], Awaitable[int]]] = None,
+    state_faults: Optional[Callable[[int, bytearray], Iterable[int]]] = None,
+    initial_state: Optional[bytes] = None,
+) -> W2AResult:
+    """
+    asyncio variant of run_w2a: same pipeline and result, but the external
+    call, stage waits (clock.sleep_async) and checkpoint I/O are awaited, so
+    many pipelines can share one event loop.
+
+    save_checkpoint(next_stage) -> bytes written and load_checkpoint() ->
+    next stage default to the checkpoint store (as for run_w2a), run in a
+    worker thread.
+    """
+    if clock is None:
+        clock = SystemClock()
+    ck = _Checkpointing(
+        checkpoint_store or _open_store(run_dir, cfg), cfg, seed, run_dir, state_faults, initial_state
+    )
+    if save_checkpoint is None:
+        async def save_checkpoint(next_stage: int) -> int:
+            return await asyncio.to_thread(ck.save, next_stage)
+    if load_checkpoint is None:
+        async def load_checkpoint() -> int:
+            return await asyncio.to_thread(ck.load)
+
+    t0 = clock.now()
+    gen = _pipeline(seed, cfg, should_crash, timeline)
+    result: Any = None
+    error: Optional[BaseException] = None
+    try:
+        while True:
+            try:
+                op = gen.throw(error) if error is not None else gen.send(result)
+            except StopIteration as stop:
+                stages_completed, restarts, failed = stop.value
+                break
+            result, error = None, None
+            try:
+                if op[0] == _LOAD:
+                    t = clock.now()
+                    result = await load_checkpoint()
+                    ck.loaded(result, clock.now() - t)
+                elif op[0] == _SAVE:
+                    t = clock.now()
+                    nbytes = await save_checkpoint(op[1])
+                    ck.saved(nbytes, clock.now() - t)
+                elif op[0] == _EXTERNAL:
+                    await external_call()
+                else:
+                    ck.advance(op[1])
+                    await clock.sleep_async(op[2])
+            except Exception as e:
+                error = e
+    finally:
+        ck.close()
+
+    return ck.result(stages_completed, restarts, clock.now() - t0, failed)
+
+
+def run_w2a_in_child(
+    *,
+    link: Any,
+    run_dir: str,
+    seed: int,
+    cfg: W2AConfig,
+    timeline: Optional[StressTimeline] = None,
+    slot_file: Optional[str] = None,
+    slot: int = 0,
+) -> W2AResult:
+    """
+    Entry point of a supervised W2-A process (see OCRB.stress.power):
+    reopens the run's checkpoint store, resumes from it and reports every
+    stage to the supervisor through link.gate. Crashes are the supervisor's
+    signals, so the timeline should carry none. The external dependency is
+    governed by the timeline only.
+    """
+    store = open_checkpoint_store(
+        cfg.checkpoint_backend,
+        run_dir,
+        fsync=cfg.checkpoint_fsync,
+        fsync_batch=cfg.checkpoint_fsync_batch,
+        compact_every=cfg.checkpoint_compact_every,
+        slot_file=slot_file,
+        slot=slot,
+    )
+    return run_w2a(
+        run_dir=run_dir,
+        seed=seed,
+        cfg=cfg,
+        external_call=lambda: None,
+        timeline=timeline,
+        checkpoint_store=store,
+        stage_gate=link.gate,
+    )
+
+
+def _open_store(run_dir: str, cfg: W2AConfig) -> CheckpointStore:
+    return open_checkpoint_store(
+        cfg.checkpoint_backend,
+        run_dir,
+        fsync=cfg.checkpoint_fsync,
+        fsync_batch=cfg.checkpoint_fsync_batch,
+        compact_every=cfg.checkpoint_compact_every,
+    )
+
+
+class _Checkpointing:
+    """
+    A run's checkpoint: progress in the checkpoint store plus, if cfg
+    declares one, the state payload (written first, so saved progress never
+    points past saved state). Also accounts checkpoint I/O for W2AResult.
+    """
+    def __init__(
+        self,
+        store: CheckpointStore,
+        cfg: W2AConfig,
+        seed: int,
+        run_dir: str,
+        state_faults: Optional[Callable[[int, bytearray], Iterable[int]]] = None,
+        initial_state: Optional[bytes] = None,
+    ):
+        self.store = store
+        self.cfg = cfg
+        self.seed = seed
+        self.state_faults = state_faults
+        self.initial_state = initial_state
+        self.state: Optional[PipelineState] = None
+        self.payload: Optional[StateCheckpointer] = None
+        if cfg.has_state:
+            self.state = self._fresh_state()
+            self.payload = state_checkpointer_for(
+                cfg.checkpoint_backend, run_dir, cfg.checkpoint_strategy, cfg.compact_every,
             )
+        self.writes = 0
+        self.bytes = 0
+        self.write_s = 0.0
+        self.restores = 0
+        self.restore_s = 0.0
+
+    def _fresh_state(self) -> PipelineState:
+        return PipelineState(
+            self.seed,
+            initial_bytes=self.cfg.state_initial_bytes,
+            growth_bytes=self.cfg.state_growth_bytes,
+            mutate_bytes=self.cfg.state_mutate_bytes,
+            initial=self.initial_state,
+        )
+
+    def advance(self, stage: int) -> None:
+        if self.state is not None:
+            self.state.advance(stage)
+            if self.state_faults is not None:
+                self.state.mark_dirty(self.state_faults(stage, self.state.data))
+
+    def save(self, next_stage: int) -> int:
+        nbytes = 0
+        if self.payload is not None:
+            nbytes += self.payload.save(self.state, next_stage)
+        return nbytes + self.store.save(next_stage)
+
+    def load(self) -> int:
+        next_stage = self.store.load()
+        if self.payload is not None:
+            if next_stage:
+                self.state.restore(self.payload.restore(next_stage, self.state.page_size))
+            else:
+                self.state = self._fresh_state()
+                self.payload.clear()
+        return next_stage
+
+    def io(self) -> CheckpointIO:
+        return CheckpointIO(self.writes, self.bytes, self.write_s, self.restores, self.restore_s)
+
+    def saved(self, nbytes: int, seconds: float) -> None:
+        self.writes += 1
+        self.bytes += nbytes
+        self.write_s += seconds
+
+    def loaded(self, next_stage: int, seconds: float) -> None:
+        if next_stage:
+            self.restores += 1
+            self.restore_s += seconds
+
+    def close(self) -> None:
+        self.store.close()
+
+    def result(self, stages_completed: int, restarts: int, duration_s: float, failed: bool) -> W2AResult:
+        return W2AResult(
+            stages_total=self.cfg.stages,
+            stages_completed=stages_completed,
+            restarts=restarts,
+            duration_s=duration_s,
+            failed=failed,
+            checkpoint_writes=self.writes,
+            checkpoint_bytes=self.bytes,
+            checkpoint_write_s=self.write_s,
+            checkpoint_restores=self.restores,
+            checkpoint_restore_s=self.restore_s,
+            state_bytes=len(self.state.data) if self.state is not None else 0,
+            state_crc32=zlib.crc32(self.state.data) if self.state is not None else 0,
+            checkpoint_size_bytes=self.payload.size_bytes() if self.payload is not None else 0,
+        )
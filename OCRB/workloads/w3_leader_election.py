@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from OCRB.stress.base import NET_LOSS, POWER_LOSS, StressTimeline
+from OCRB.stress.network import MessageBus, NetworkProfile
+
+
+@dataclass(frozen=True)
+class W3AConfig:
+    nodes: int = 5                        # declared participant count (v0: 3-7; simulation scales to hundreds)
+    duration_s: float = 10.0              # simulated time
+    heartbeat_s: float = 0.05             # leader heartbeat interval (= one stress tick)
+    election_timeout_min_s: float = 0.15
+    election_timeout_max_s: float = 0.30
+    latency_s: float = 0.002              # unstressed one-way message latency
+    latency_jitter_s: float = 0.003       # plus uniform [0, jitter); SR-4 may override both
+    node_restart_s: float = 0.5           # minimum downtime of a crashed node
+    liveness_bound_s: float = 2.0         # longest tolerated leaderless gap
+
+    @property
+    def network(self) -> NetworkProfile:
+        """
+        The unstressed (SP-0) network.
+        """
+        return NetworkProfile(latency_s=self.latency_s, jitter_s=self.latency_jitter_s)
+
+
+@dataclass(frozen=True)
+class W3ACrash:
+    node: int
+    t_down: float
+    t_up: float
+    was_leader: bool
+    recovered: bool                       # a leader was present within liveness_bound_s of the crash
+
+
+@dataclass(frozen=True)
+class W3AResult:
+    nodes: int
+    sim_time_s: float
+    duration_s: float                     # wall time of the simulation
+    failed: bool
+    leader_elections: int
+    leader_changes: int                   # elections after the first (leader churn)
+    final_term: int
+    election_latencies_s: Tuple[float, ...]
+    leader_availability: float            # fraction of simulated time with a leader up
+    crashes: Tuple[W3ACrash, ...]
+    affected_nodes: Tuple[int, ...]       # crashed, or forced into an election after the first leader
+    heartbeat_rounds: int                 # heartbeats acknowledged by a majority
+    node_seconds: float                   # simulated uptime summed over nodes
+    messages_sent: int
+    messages_dropped: int                 # lost in the network or addressed to a down node
+    message_latency_mean_s: float
+    safety_violations: int                # two leaders elected in one term
+    liveness_violations: int              # leaderless gaps longer than liveness_bound_s
+
+
+# Node roles
+_FOLLOWER = 0
+_CANDIDATE = 1
+_LEADER = 2
+
+# Message kinds; payloads are (kind, src, term, arg)
+_VOTE_REQUEST = 0
+_VOTE = 1         # arg: granted
+_APPEND = 2       # heartbeat; arg: round
+_ACK = 3          # arg: round, or -1 when rejected
+
+# Local events; payloads are (kind, arg)
+_TIMER = 4        # arg: timer generation (election timeout, or a leader's next heartbeat)
+_CRASH = 5        # arg: down until
+_RESTART = 6
+
+
+class _Cluster:
+    """
+    Discrete-event simulation of W3-A: heartbeat/timeout leader election
+    (Raft's election rules, without a replicated log) over a simulated
+    network. The message bus orders timers, message deliveries and stress
+    events on one heap; nothing sleeps.
+    """
+    def __init__(self, seed: int, cfg: W3AConfig, timeline: Optional[StressTimeline], bus: MessageBus):
+        n = cfg.nodes
+        self.cfg = cfg
+        self.timeline = timeline
+        self.bus = bus
+        self.n = n
+        self.majority = n // 2 + 1
+        self.rng = random.Random(seed)
+
+        self.term = [0] * n
+        self.voted_for = [-1] * n
+        self.role = [_FOLLOWER] * n
+        self.up = [True] * n
+        self.gen = [0] * n
+        self.votes = [0] * n
+
+        self.leaders: Set[int] = set()
+        self.leader_of_term: Dict[int, int] = {}
+        self.elections = 0
+        self.safety_violations = 0
+        self.gap_start: Optional[float] = 0.0
+        self.election_latencies: List[float] = []
+        self.liveness_violations = 0
+        self.leader_time: List[Tuple[float, float]] = []
+        self.leader_since = 0.0
+
+        self.acks: Dict[int, int] = {}
+        self.rounds = 0
+        self.committed = 0
+        self.dropped = 0
+        self.crashes: List[Tuple[int, float, float, bool]] = []
+        self.affected: Set[int] = set()
+
+    @property
+    def now(self) -> float:
+        return self.bus.now
+
+    def _reset_timer(self, node: int, delay: Optional[float] = None) -> None:
+        self.gen[node] += 1
+        if delay is None:
+            delay = self.rng.uniform(self.cfg.election_timeout_min_s, self.cfg.election_timeout_max_s)
+        self.bus.schedule(delay, node, (_TIMER, self.gen[node]))
+
+    def _send(self, src: int, dst: int, kind: int, term: int, arg: int) -> None:
+        self.bus.send(src, dst, (kind, src, term, arg))
+
+    def _broadcast(self, src: int, kind: int, term: int, arg: int) -> None:
+        self.bus.broadcast(src, range(self.n), (kind, src, term, arg))
+
+    # Leader bookkeeping (as observed by the harness, not by the nodes)
+
+    def _leader_up(self, node: int) -> None:
+        if not self.leaders:
+            self.election_latencies.append(self.now - self.gap_start)
+            if self.now - self.gap_start > self.cfg.liveness_bound_s:
+                self.liveness_violations += 1
+            self.gap_start = None
+            self.leader_since = self.now
+        self.leaders.add(node)
+
+    def _leader_down(self, node: int) -> None:
+        self.leaders.discard(node)
+        if not self.leaders and self.gap_start is None:
+            self.gap_start = self.now
+            self.leader_time.append((self.leader_since, self.now))
+
+    # Node behaviour
+
+    def _step_down(self, node: int, term: int) -> None:
+        self.term[node] = term
+        self.voted_for[node] = -1
+        if self.role[node] != _FOLLOWER:
+            if self.role[node] == _LEADER:
+                self._leader_down(node)
+            self.role[node] = _FOLLOWER
+            self._reset_timer(node)
+
+    def _start_election(self, node: int) -> None:
+        if self.elections:
+            self.affected.add(node)
+        self.term[node] += 1
+        self.voted_for[node] = node
+        self.votes[node] = 1
+        self.role[node] = _CANDIDATE
+        self._reset_timer(node)
+        if self.votes[node] >= self.majority:
+            self._become_leader(node)
+        else:
+            self._broadcast(node, _VOTE_REQUEST, self.term[node], 0)
+
+    def _become_leader(self, node: int) -> None:
+        term = self.term[node]
+        if self.leader_of_term.setdefault(term, node) != node:
+            self.safety_violations += 1
+        self.elections += 1
+        self.role[node] = _LEADER
+        self._leader_up(node)
+        self._heartbeat(node)
+
+    def _heartbeat(self, node: int) -> None:
+        self.rounds += 1
+        self.acks[self.rounds] = 1
+        self._broadcast(node, _APPEND, self.term[node], self.rounds)
+        self._reset_timer(node, self.cfg.heartbeat_s)
+
+    def _deliver(self, dst: int, kind: int, src: int, term: int, arg: int) -> None:
+        if not self.up[dst]:
+            self.dropped += 1
+            return
+        if term > self.term[dst]:
+            self._step_down(dst, term)
+        own = self.term[dst]
+
+        if kind == _VOTE_REQUEST:
+            granted = term == own and self.voted_for[dst] in (-1, src)
+            if granted:
+                self.voted_for[dst] = src
+                self._reset_timer(dst)
+            self._send(dst, src, _VOTE, own, int(granted))
+        elif kind == _VOTE:
+            if self.role[dst] == _CANDIDATE and term == own and arg:
+                self.votes[dst] += 1
+                if self.votes[dst] >= self.majority:
+                    self._become_leader(dst)
+        elif kind == _APPEND:
+            if term < own:
+                self._send(dst, src, _ACK, own, -1)
+                return
+            if self.role[dst] == _CANDIDATE:
+                self.role[dst] = _FOLLOWER
+            self._reset_timer(dst)
+            self._send(dst, src, _ACK, own, arg)
+        elif kind == _ACK:
+            if self.role[dst] == _LEADER and term == own and arg in self.acks:
+                self.acks[arg] += 1
+                if self.acks[arg] >= self.majority:
+                    del self.acks[arg]
+                    self.committed += 1
+
+    def _crash(self, down_until: float) -> None:
+        if self.leaders:
+            node = max(self.leaders, key=lambda k: self.term[k])
+        else:
+            candidates = [k for k in range(self.n) if self.up[k]]
+            if not candidates:
+                return
+            node = self.rng.choice(candidates)
+        was_leader = self.role[node] == _LEADER
+        if was_leader:
+            self._leader_down(node)
+        self.up[node] = False
+        self.role[node] = _FOLLOWER
+        self.gen[node] += 1
+        self.affected.add(node)
+        t_up = max(down_until, self.now + self.cfg.node_restart_s)
+        self.crashes.append((node, self.now, t_up, was_leader))
+        self.bus.schedule(t_up - self.now, node, (_RESTART, None))
+
+    def _restart(self, node: int) -> None:
+        # Term and vote are persistent; everything else starts over.
+        self.up[node] = True
+        self.votes[node] = 0
+        self._reset_timer(node)
+
+    def run(self) -> None:
+        for node in range(self.n):
+            self._reset_timer(node)
+        tl = self.timeline
+        if tl is not None:
+            window_end = {start: end for start, end in tl.windows(POWER_LOSS)}
+            for tick in range(tl.horizon):
+                if tl.crash_at(tick):
+                    self.bus.schedule(tick * tl.tick_s - self.now, None, (_CRASH, window_end.get(tick, tick) * tl.tick_s))
+
+        end = self.cfg.duration_s
+        bus = self.bus
+        while bus.next_time() <= end:
+            _, dst, event = bus.pop()
+            kind = event[0]
+            if kind < _TIMER:
+                self._deliver(dst, *event)
+            elif kind == _TIMER:
+                if not self.up[dst] or event[1] != self.gen[dst]:
+                    continue
+                if self.role[dst] == _LEADER:
+                    self._heartbeat(dst)
+                else:
+                    self._start_election(dst)
+            elif kind == _CRASH:
+                self._crash(event[1])
+            else:
+                self._restart(dst)
+
+        bus.advance_to(end)
+        if self.gap_start is not None:
+            if end - self.gap_start > self.cfg.liveness_bound_s:
+                self.liveness_violations += 1
+        else:
+            self.leader_time.append((self.leader_since, end))
+
+    def recovered(self, t_down: float) -> bool:
+        horizon = t_down + self.cfg.liveness_bound_s
+        return any(start <= horizon and stop > t_down for start, stop in self.leader_time)
+
+
+def run_w3a(
+    *,
+    seed: int,
+    cfg: W3AConfig,
+    timeline: Optional[StressTimeline] = None,
+    network: Optional[NetworkProfile] = None,
+    network_seed: Optional[int] = None,
+) -> W3AResult:
+    """
+    Distributed coordination workload: cfg.nodes nodes elect a leader with
+    randomized election timeouts and keep it with periodic heartbeats.
+
+    The network and time are simulated (discrete events on a MessageBus, no
+    real sleeps), so hundreds of nodes run in one process and results depend
+    only on the seeds, cfg, network and timeline.
+
+    network:
+      SR-4 network model (see OCRB.stress.network); cfg.network by default.
+      Its latency, loss and partitions draw from network_seed (default
+      derived from seed).
+
+    timeline (one tick per heartbeat interval):
+      - CRASH ticks (SR-3 interruptions, declared crash points) take down
+        the node holding leadership (a seeded node when there is none) until
+        the end of the SR-3 window, at least node_restart_s
+      - SR-4 NET_LOSS ticks are full network outages
+      - SR-5 isolation cuts external links only; the cluster is unaffected
+
+    Safety: at most one leader per term. Liveness: no leaderless gap longer
+    than liveness_bound_s. The run fails if either is violated.
+    """
+    if cfg.nodes < 1:
+        raise ValueError("nodes must be >= 1")
+    if not 0 < cfg.election_timeout_min_s <= cfg.election_timeout_max_s:
+        raise ValueError("election timeouts must satisfy 0 < min <= max")
+
+    if network is None:
+        network = cfg.network
+    if timeline is not None:
+        network = network.with_outages(
+            (start * timeline.tick_s, end * timeline.tick_s) for start, end in timeline.windows(NET_LOSS)
+        )
+    if network_seed is None:
+        network_seed = seed * 1_000_003 + 1
+
+    t0 = time.time()
+    bus = MessageBus(network, network_seed)
+    sim = _Cluster(seed, cfg, timeline, bus)
+    sim.run()
+
+    crashes = tuple(
+        W3ACrash(node=node, t_down=t_down, t_up=t_up, was_leader=was_leader, recovered=sim.recovered(t_down))
+        for node, t_down, t_up, was_leader in sim.crashes
+    )
+    downtime = sum(min(t_up, cfg.duration_s) - t_down for _, t_down, t_up, _ in sim.crashes)
+    leader_time = sum(stop - start for start, stop in sim.leader_time)
+
+    return W3AResult(
+        nodes=cfg.nodes,
+        sim_time_s=cfg.duration_s,
+        duration_s=time.time() - t0,
+        failed=bool(sim.safety_violations or sim.liveness_violations),
+        leader_elections=sim.elections,
+        leader_changes=max(sim.elections - 1, 0),
+        final_term=max(sim.term),
+        election_latencies_s=tuple(sim.election_latencies),
+        leader_availability=leader_time / cfg.duration_s if cfg.duration_s > 0 else 0.0,
+        crashes=crashes,
+        affected_nodes=tuple(sorted(sim.affected)),
+        heartbeat_rounds=sim.committed,
+        node_seconds=cfg.nodes * cfg.duration_s - downtime,
+        messages_sent=bus.sent,
+        messages_dropped=bus.dropped + sim.dropped,
+        message_latency_mean_s=bus.latency_total_s / (bus.sent - bus.dropped) if bus.sent > bus.dropped else 0.0,
+        safety_violations=sim.safety_violations,
+        liveness_violations=sim.liveness_violations,
+    )
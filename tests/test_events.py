@@ -0,0 +1,63 @@
+import pickle
+
+import pytest
+
+from OCRB.measure.events import EventLog, EventType
+
+
+def test_events_view_is_live_and_read_only():
+    log = EventLog(run_id="r", workload_id="W1-A")
+    view = log.events
+    log.emit(EventType.RUN_START, t_utc=1.0)
+    log.emit(EventType.RUN_END, t_utc=2.0)
+
+    assert len(view) == 2 and view[-1].type == EventType.RUN_END
+    with pytest.raises(TypeError):
+        view[0] = view[1]
+    assert not hasattr(view[0], "__dict__")
+    assert log.to_dicts()[0]["meta"] == {}
+    assert view[0].meta == {} and view[0].meta is view[1].meta
+    with pytest.raises(TypeError):
+        view[0].meta["k"] = 1
+    assert pickle.loads(pickle.dumps(view[0])).meta is view[0].meta
+
+
+def test_resource_meter_counts_cpu_and_io_and_round_trips_through_sinks(tmp_path):
+    from OCRB.measure.resources import ResourceMeter, ResourceUsage
+    from OCRB.measure.sink import JsonlEventSink
+
+    with pytest.raises(ValueError, match="process"):
+        ResourceMeter("thread", reset_peak=True)
+    with ResourceMeter("process", reset_peak=True):
+        pass
+    with ResourceMeter("thread") as meter:
+        sum(i * i for i in range(300_000))
+        (tmp_path / "blob").write_bytes(b"x" * (1 << 20))
+    usage = meter.usage
+    assert usage.cpu_user_s > 0.0 and usage.wall_s > 0.0
+    assert usage.max_rss_bytes > 0.0
+    assert usage.value("io_bytes") == usage.read_bytes + usage.write_bytes
+    assert usage.per_unit(4).cpu_s == pytest.approx(usage.cpu_s / 4)
+    assert usage.per_unit(4).max_rss_bytes == usage.max_rss_bytes
+    with pytest.raises(ValueError):
+        usage.value("bogomips")
+
+    path = tmp_path / "events.jsonl"
+    log = EventLog(run_id="r", workload_id="W1-A", sink=JsonlEventSink(str(path)))
+    log.emit(EventType.WORK_UNIT_END, t_utc=1.0, work_done=4.0, resources=usage)
+    log.emit(EventType.RUN_END, t_utc=2.0)
+    events = list(log.events)
+    assert events[0].resources == usage and isinstance(events[0].resources, ResourceUsage)
+    assert events[1].resources is None
+
+
+def test_resource_meter_without_the_resource_module_meters_wall_time_only(monkeypatch):
+    from OCRB.measure import resources
+
+    monkeypatch.setattr(resources, "resource", None)
+    with resources.ResourceMeter("thread") as meter:
+        sum(i * i for i in range(10_000))
+    assert meter.usage.wall_s > 0.0 and meter.usage.cpu_s == 0.0
+    resources.check_resource_dimension("wall_s")
+    with pytest.raises(ValueError, match="not available"):
+        resources.check_resource_dimension("cpu_s")
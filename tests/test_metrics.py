@@ -0,0 +1,134 @@
+import json
+
+import pytest
+
+from OCRB.measure.events import EventLog, EventType, FailureClass
+from OCRB.metrics.arr import compute_arr
+from OCRB.metrics.cfr import compute_cfr
+from OCRB.metrics.fused import compute_proxies, measure_baseline
+from OCRB.metrics.gds import compute_gds
+from OCRB.metrics.ist import compute_ist
+from OCRB.metrics.online import ProxyAccumulator
+from OCRB.metrics.ori import compute_ori
+from OCRB.metrics.rec import compute_rec
+
+
+def _logs():
+    baseline = EventLog(run_id="baseline", workload_id="W")
+    baseline.emit(EventType.RUN_START, t_utc=0.0)
+    baseline.emit(EventType.WORK_UNIT_END, work_done=100.0, resources_used=50.0)
+
+    full = EventLog(run_id="full", workload_id="W")
+    full.emit(EventType.RUN_START, t_utc=1000.0)
+    full.emit(EventType.WORK_UNIT_END, t_utc=1001.0, stress_level=0.2, completion_rate=0.5, work_done=10.0, resources_used=8.0)
+    full.emit(EventType.WORK_UNIT_END, t_utc=1002.0, stress_level=0.1, completion_rate=1.0)
+    full.emit(EventType.FAILURE, t_utc=1003.0, failure_class=FailureClass.AUTONOMOUSLY_RECOVERED, component_id="a")
+    full.emit(EventType.FAILURE, t_utc=1004.0, failure_class=FailureClass.RECOVERABLE_NOT_RECOVERED)
+    full.emit(EventType.COMPONENT_AFFECTED, t_utc=1005.0, component_id="b")
+    full.emit(EventType.ISOLATION_START, t_utc=1010.0)
+    full.emit(EventType.FAILURE, t_utc=1030.0, failure_class=FailureClass.IRREVERSIBLE)
+    full.emit(EventType.RUN_END, t_utc=1080.0)
+
+    # Terminator logged before isolation_start but timestamped inside the window
+    out_of_order = EventLog(run_id="ooo", workload_id="W")
+    out_of_order.emit(EventType.RUN_START, t_utc=1000.0)
+    out_of_order.emit(EventType.ISOLATION_END, t_utc=1050.0)
+    out_of_order.emit(EventType.ISOLATION_START, t_utc=1010.0)
+    out_of_order.emit(EventType.WORK_UNIT_END, t_utc=1090.0)
+
+    # No terminator at all
+    open_window = EventLog(run_id="open", workload_id="W")
+    open_window.emit(EventType.ISOLATION_START, t_utc=5.0)
+    open_window.emit(EventType.WORK_UNIT_END, t_utc=9.0)
+
+    return baseline, [full, out_of_order, open_window, EventLog(run_id="empty", workload_id="W")]
+
+
+def test_fused_matches_individual_metrics():
+    baseline, logs = _logs()
+    totals = measure_baseline(baseline.events)
+    for log in logs:
+        for kwargs in (
+            dict(expected_levels=None, isolation_duration_declared=60.0, C_total=5),
+            dict(expected_levels=[0.1, 0.3], isolation_duration_declared=None, C_total=1),
+            dict(expected_levels=[0.1, 0.2], isolation_duration_declared=120.0, C_total=None),
+        ):
+            fused = compute_proxies(log.events, baseline=totals, **kwargs)
+            assert fused.gds == compute_gds(log.events, expected_levels=kwargs["expected_levels"])
+            assert fused.arr == compute_arr(log.events)
+            assert fused.ist == compute_ist(log.events, kwargs["isolation_duration_declared"])
+            assert fused.rec == compute_rec(baseline.events, log.events)
+            assert fused.cfr == compute_cfr(log.events, C_total=kwargs["C_total"])
+            assert fused.ori == compute_ori(fused.proxies())
+
+
+def test_online_accumulator_matches_batch():
+    baseline, logs = _logs()
+    totals = measure_baseline(baseline.events)
+    kwargs = dict(expected_levels=None, isolation_duration_declared=60.0, C_total=5)
+
+    for log in logs:
+        replay = EventLog(run_id=log.run_id, workload_id="W")
+        acc = ProxyAccumulator(baseline=totals, **kwargs)
+        replay.subscribe(acc.add)
+        for e in log.events:
+            replay.emit(e.type, t_utc=e.t_utc, stress_level=e.stress_level, completion_rate=e.completion_rate,
+                        failure_class=e.failure_class, component_id=e.component_id,
+                        work_done=e.work_done, resources_used=e.resources_used)
+            # snapshot on demand equals batch evaluation of the prefix seen so far
+            assert acc.snapshot() == compute_proxies(replay.events, baseline=totals, **kwargs)
+
+
+def test_batch_scores_match_run_records(tmp_path):
+    np = pytest.importorskip("numpy")
+    from OCRB.metrics.batch import load_run_dir, score_runs
+    from OCRB.runner import run_benchmark
+
+    for workload_id, C_total in (("STUB", 5), ("STUB", 1), ("W2-A", 5)):
+        out = tmp_path / f"{workload_id}-{C_total}"
+        run_benchmark(
+            out_dir=str(out),
+            workload_id=workload_id,
+            workload_version="0.1",
+            stress_profile_id="SP-1",
+            stress_parameters={"SR-5": {"duration_s": 120}},
+            execution_environment={},
+            master_seed=3,
+            n_runs=3,
+            gds_levels=[0.1, 0.2],
+            isolation_duration_declared=120.0,
+            C_total=C_total,
+        )
+        scores = score_runs(load_run_dir(str(out)), expected_levels=[0.1, 0.2])
+        for i, run_id in enumerate(scores.run_ids):
+            record = json.loads((out / "runs" / f"run_{i + 1:02d}.json").read_text())
+            for name in ("gds", "arr", "ist", "rec", "cfr", "ori"):
+                expected = record["proxies"][name]
+                got = scores.proxy(name)[i]
+                assert (got is None) == (expected is None), (run_id, name)
+                if expected is not None:
+                    assert np.isclose(got, expected)
+
+
+def test_rec_normalizes_by_the_selected_resource_dimension():
+    from OCRB.measure.resources import ResourceUsage
+
+    baseline = EventLog(run_id="baseline", workload_id="W")
+    baseline.emit(EventType.WORK_UNIT_END, t_utc=0.0, work_done=100.0, resources_used=50.0,
+                  resources=ResourceUsage(wall_s=50.0, cpu_user_s=8.0, cpu_sys_s=2.0))
+    stressed = EventLog(run_id="stressed", workload_id="W")
+    stressed.emit(EventType.WORK_UNIT_END, t_utc=1.0, work_done=80.0, resources_used=80.0,
+                  resources=ResourceUsage(wall_s=80.0, cpu_user_s=9.0, cpu_sys_s=1.0))
+
+    assert compute_rec(baseline.events, stressed.events).rec == pytest.approx(0.5)
+    by_cpu = compute_rec(baseline.events, stressed.events, resource_dimension="cpu_s")
+    assert by_cpu.E_base == 10.0 and by_cpu.rec == pytest.approx(0.8)
+    totals = measure_baseline(baseline.events, "cpu_s")
+    assert compute_proxies(stressed.events, baseline=totals, resource_dimension="cpu_s").rec == by_cpu
+    acc = ProxyAccumulator(baseline=totals, resource_dimension="cpu_s")
+    for e in stressed.events:
+        acc.add(e)
+    assert acc.snapshot().rec == by_cpu
+    assert acc.rec.usage.cpu_s == 10.0
+    with pytest.raises(ValueError):
+        compute_rec(baseline.events, stressed.events, resource_dimension="watts")
@@ -0,0 +1,356 @@
+import json
+
+import pytest
+
+from OCRB.runner import run_benchmark
+from OCRB.workloads.w2_stateful_pipeline import W2AConfig
+
+
+def _benchmark(out_dir, workload_id, **kwargs):
+    # Declarations shared by every benchmark here; kwargs add the rest
+    run_benchmark(
+        out_dir=str(out_dir),
+        workload_id=workload_id,
+        workload_version="0.1",
+        execution_environment={"os": "test", "runtime": "python"},
+        **{"stress_profile_id": "SP-1", "master_seed": 123, **kwargs},
+    )
+
+
+def _run(out_dir, workload_id, **kwargs):
+    # An SR-5 isolation window with the inputs of every proxy declared
+    scenario = dict(
+        stress_parameters={"SR-5": {"duration_s": 120}},
+        n_runs=4,
+        gds_levels=[0.1, 0.2, 0.3],
+        isolation_duration_declared=120.0,
+        C_total=5,
+    )
+    _benchmark(out_dir, workload_id, **{**scenario, **kwargs})
+
+
+def _strip_timing(record):
+    # Timestamps and wall-clock durations legitimately differ between executions.
+    for e in record["events"]:
+        e.pop("t_utc")
+        e.pop("resources_used")
+        e["meta"].pop("checkpoint_write_s", None)
+        e["meta"].pop("checkpoint_restore_s", None)
+    record.pop("start_utc")
+    record.pop("end_utc")
+    record["evidence"].pop("E_stress")
+    record["proxies"].pop("rec")
+    record["proxies"].pop("ori")
+    return record
+
+
+def test_parallel_runs_match_serial(tmp_path):
+    for workload_id in ("W2-A", "STUB"):
+        serial = tmp_path / workload_id / "serial"
+        parallel = tmp_path / workload_id / "parallel"
+        # A shared baseline cache gives both paths the same measured SP-0 baseline.
+        cache = str(tmp_path / "cache")
+        _run(serial, workload_id, baseline_cache_dir=cache)
+        _run(parallel, workload_id, workers=3, baseline_cache_dir=cache)
+
+        for i in range(1, 5):
+            a = json.loads((serial / "runs" / f"run_{i:02d}.json").read_text())
+            b = json.loads((parallel / "runs" / f"run_{i:02d}.json").read_text())
+            assert _strip_timing(a) == _strip_timing(b)
+
+    summary = json.loads((tmp_path / "STUB" / "serial" / "aggregate_summary.json").read_text())
+    assert all(s["n_included"] + s["n_na"] == 4 for s in summary.values())
+
+    # The stub workload has no timing-dependent evidence, so summaries are identical.
+    assert (tmp_path / "STUB" / "serial" / "aggregate_summary.json").read_bytes() == (
+        tmp_path / "STUB" / "parallel" / "aggregate_summary.json"
+    ).read_bytes()
+    assert "reference implementation" in (tmp_path / "W2-A" / "serial" / "disclosure.md").read_text()
+    assert "placeholder evidence" in (tmp_path / "STUB" / "serial" / "disclosure.md").read_text()
+
+
+def test_simulated_clock_timestamps_are_deterministic(tmp_path):
+    kwargs = dict(
+        stress_parameters={"SR-5": {"duration_s": 7200}},
+        n_runs=2,
+        gds_levels=[0.1],
+        isolation_duration_declared=7200.0,
+        clock="simulated",
+    )
+    _benchmark(tmp_path / "a", "W2-A", **kwargs)
+    _benchmark(tmp_path / "b", "W2-A", **kwargs)
+
+    for i in (1, 2):
+        a = json.loads((tmp_path / "a" / "runs" / f"run_{i:02d}.json").read_text())
+        b = json.loads((tmp_path / "b" / "runs" / f"run_{i:02d}.json").read_text())
+        assert a == b
+        assert a["start_utc"] == 1000.0
+
+
+def test_streamed_events_match_in_memory(tmp_path):
+    _run(tmp_path / "mem", "STUB")
+    _run(tmp_path / "stream", "STUB", stream_events=True)
+
+    a = json.loads((tmp_path / "mem" / "runs" / "run_01.json").read_text())
+    b = json.loads((tmp_path / "stream" / "runs" / "run_01.json").read_text())
+    assert b["events"] == [] and b["events_path"] == "events/run_01.jsonl"
+    assert a["proxies"] == b["proxies"] and a["evidence"] == b["evidence"]
+
+    lines = (tmp_path / "stream" / b["events_path"]).read_text().splitlines()
+    streamed = [json.loads(line) for line in lines]
+    for e in a["events"] + streamed:
+        e.pop("t_utc")
+    assert streamed == a["events"]
+
+
+def test_resume_skips_completed_runs(tmp_path):
+    _run(tmp_path, "W2-A")
+    manifest = (tmp_path / "manifest.json").read_text()
+    run_02 = (tmp_path / "runs" / "run_02.json").read_text()
+    (tmp_path / "runs" / "run_03.json").unlink()
+
+    _run(tmp_path, "W2-A", resume=True)
+    assert (tmp_path / "manifest.json").read_text() == manifest
+    assert (tmp_path / "runs" / "run_02.json").read_text() == run_02
+    assert (tmp_path / "runs" / "run_03.json").exists()
+
+    # A changed metric input changes every run key, so everything is recomputed.
+    _run(tmp_path, "W2-A", resume=True, workers=2)
+    assert (tmp_path / "runs" / "run_02.json").read_text() == run_02
+    _run(tmp_path, "W2-A", C_total=6, resume=True)
+    assert json.loads((tmp_path / "runs" / "run_02.json").read_text())["evidence"]["C_total"] == 6
+
+
+def test_sp0_baseline_is_cached(tmp_path):
+    cache = str(tmp_path / "cache")
+    _run(tmp_path / "a", "W2-A", baseline_cache_dir=cache)
+    _run(tmp_path / "b", "W2-A", baseline_cache_dir=cache)
+
+    a = json.loads((tmp_path / "a" / "baseline.json").read_text())
+    b = json.loads((tmp_path / "b" / "baseline.json").read_text())
+    assert (a["source"], b["source"]) == ("measured", "cache")
+    assert a["key"] == b["key"] and a["work"] == b["work"] == 50
+
+
+def test_async_runs_match_serial(tmp_path):
+    for mode, kwargs in (("serial", {}), ("async", {"async_runs": True})):
+        _run(tmp_path / mode, "W2-A", clock="simulated", **kwargs)
+
+    for i in range(1, 5):
+        a = (tmp_path / "serial" / "runs" / f"run_{i:02d}.json").read_text()
+        b = (tmp_path / "async" / "runs" / f"run_{i:02d}.json").read_text()
+        assert a == b
+
+
+def test_mmap_runs_share_one_slot_file_across_workers(tmp_path):
+    records = {}
+    for backend in ("file", "mmap"):
+        _run(tmp_path / backend, "W2-A", clock="simulated", workers=2, checkpoint_backend=backend)
+        manifest = json.loads((tmp_path / backend / "manifest.json").read_text())
+        assert manifest["checkpoint_backend"] == backend
+        records[backend] = []
+        for i in range(1, 5):
+            r = json.loads((tmp_path / backend / "runs" / f"run_{i:02d}.json").read_text())
+            for e in r["events"]:
+                e["meta"].pop("checkpoint_backend", None)
+                e["meta"].pop("checkpoint_bytes", None)
+            r.pop("run_key")
+            records[backend].append(r)
+    assert records["mmap"] == records["file"]
+
+    # mmap: one shared slot file instead of a checkpoint file per run
+    state = tmp_path / "mmap" / "w2_state"
+    assert [p.name for p in state.iterdir()] == ["checkpoints.slots"]
+
+
+def test_w3a_emits_failure_and_component_evidence(tmp_path):
+    kwargs = dict(
+        stress_parameters={"SR-3": {"availability": 0.9, "interruption_s": 0.5}, "SR-4": {"loss": 0.05}},
+        n_runs=2,
+        gds_levels=[0.0, 1.0],
+        C_total=7,
+        w3a_config={"nodes": 7},
+        clock="simulated",
+    )
+    _benchmark(tmp_path / "a", "W3-A", **kwargs)
+    _benchmark(tmp_path / "b", "W3-A", **kwargs)
+
+    for i in (1, 2):
+        a = json.loads((tmp_path / "a" / "runs" / f"run_{i:02d}.json").read_text())
+        assert a == json.loads((tmp_path / "b" / "runs" / f"run_{i:02d}.json").read_text())
+        failures = [e for e in a["events"] if e["type"] == "failure"]
+        assert failures and all(e["component_id"].startswith("node-") for e in failures)
+        assert a["evidence"]["C_local"] >= len({e["component_id"] for e in failures})
+        assert a["proxies"]["arr"] is not None and a["proxies"]["cfr"] is not None
+        (rec,) = [e for e in a["events"] if e["work_done"] is not None]
+        assert rec["meta"]["leader_changes"] >= 2
+        assert len(rec["meta"]["election_latencies_s"]) == rec["meta"]["leader_elections"]
+        # Each level is executed at its own scaled stress
+        assert a["evidence"]["stress_levels"] == [0.0, 1.0]
+        unstressed, stressed = a["evidence"]["completion_rates"]
+        assert unstressed > stressed
+
+
+def test_sr4_network_delays_and_drops_external_calls(tmp_path):
+    kwargs = dict(stress_profile_id="SP-2", n_runs=1, clock="simulated")
+    _benchmark(tmp_path / "sp0", "W2-A", stress_parameters={}, **kwargs)
+    sr4 = {"SR-4": {"latency_ms": 40, "jitter_ms": 10, "packet_loss": 0.3}}
+    _benchmark(tmp_path / "sr4", "W2-A", stress_parameters=sr4, **kwargs)
+    sp0 = json.loads((tmp_path / "sp0" / "runs" / "run_01.json").read_text())
+    sr4 = json.loads((tmp_path / "sr4" / "runs" / "run_01.json").read_text())
+    # Every external call now costs a round trip (>= 80 ms) or, if lost, a timeout (100 ms)
+    calls = int((sp0["end_utc"] - sp0["start_utc"]) / W2AConfig().stage_work_s)
+    assert sr4["end_utc"] - sr4["start_utc"] >= sp0["end_utc"] - sp0["start_utc"] + calls * 0.08
+
+
+def test_sr1_bit_flips_are_emitted_as_fault_evidence(tmp_path):
+    pytest.importorskip("numpy")
+    _benchmark(
+        tmp_path,
+        "W2-A",
+        stress_parameters={"SR-1": {"bit_flip_rate": 0.01}},
+        n_runs=1,
+        clock="simulated",
+        w2a_config={"state_initial_bytes": 1 << 16, "state_mutate_bytes": 256, "checkpoint_strategy": "delta"},
+    )
+    r = json.loads((tmp_path / "runs" / "run_01.json").read_text())
+    flips = [e for e in r["events"] if e["type"] == "fault_injected"]
+    assert flips and all(e["component_id"] == "w2a-state" for e in flips)
+    assert {e["meta"]["stage"] for e in flips} <= set(range(W2AConfig().stages))
+    assert all({"byte", "bit"} <= set(e["meta"]) for e in flips)
+
+
+def test_supervised_runs_report_cold_restarts(tmp_path):
+    kwargs = dict(stress_parameters={"SR-3": {"availability": 0.9, "interruption_s": 0.01}}, n_runs=1)
+    _benchmark(tmp_path / "sup", "W2-A", supervised="forkserver", **kwargs)
+
+    r = json.loads((tmp_path / "sup" / "runs" / "run_01.json").read_text())
+    (rec,) = [e for e in r["events"] if e["work_done"] is not None]
+    restarts = [e for e in r["events"] if e["type"] == "failure" and e["failure_id"] != "terminal"]
+    assert restarts and len(rec["meta"]["cold_restart_s"]) == len(restarts)
+    for e in restarts:
+        m = e["meta"]
+        assert m["signal"] == "SIGKILL"
+        assert m["spawn_s"] > 0 and m["import_s"] > 0 and m["restore_s"] > 0
+        assert m["total_s"] >= m["spawn_s"] + m["import_s"] + m["restore_s"]
+    assert rec["resources_used"] > sum(rec["meta"]["cold_restart_s"])
+
+    with pytest.raises(ValueError):
+        _benchmark(tmp_path / "bad", "W2-A", supervised="forkserver", checkpoint_backend="memory", **kwargs)
+    with pytest.raises(ValueError, match="start method"):
+        _benchmark(tmp_path / "bad", "W2-A", supervised="fork", **kwargs)
+
+
+def test_sr2_thermal_cycle_reports_throughput_per_phase(tmp_path):
+    sr2 = {"period_s": 0.05, "min_availability": 0.4, "waveform": "square", "phases": 2}
+    _benchmark(tmp_path, "W1-A", stress_parameters={"SR-2": sr2}, n_runs=1)
+    r = json.loads((tmp_path / "runs" / "run_01.json").read_text())
+    phases = [e for e in r["events"] if e["stress_level"] is not None]
+    assert [e["meta"]["phase"] for e in phases] == [0, 1]
+    assert r["evidence"]["stress_levels"] == [0.0, 0.6]
+    assert all(0.0 <= c <= 1.0 for c in r["evidence"]["completion_rates"])
+    assert r["proxies"]["gds"] is not None
+
+
+def test_gds_levels_are_each_executed_at_scaled_stress(tmp_path):
+    kwargs = dict(
+        stress_parameters={"SR-3": {"availability": 0.6, "interruption_s": 1}},
+        n_runs=1,
+        gds_levels=[0.0, 0.5, 1.0],
+        clock="simulated",
+    )
+    _benchmark(tmp_path / "levels", "W2-A", **kwargs)
+    r = json.loads((tmp_path / "levels" / "runs" / "run_01.json").read_text())
+    assert r["evidence"]["stress_levels"] == [0.0, 0.5, 1.0]
+    rates = r["evidence"]["completion_rates"]
+    assert rates == sorted(rates, reverse=True) and rates[0] > rates[2]
+    (rec,) = [e for e in r["events"] if e["work_done"] is not None]
+    assert rates[2] == rec["work_done"] / W2AConfig().stages
+    assert "3 declared stress levels" in (tmp_path / "levels" / "disclosure.md").read_text()
+
+    # Without level runs, GDS is the main run's rate at its declared stress
+    _benchmark(tmp_path / "main", "W2-A", gds_level_runs=False, **kwargs)
+    r = json.loads((tmp_path / "main" / "runs" / "run_01.json").read_text())
+    assert r["evidence"]["stress_levels"] == [1.0] and r["evidence"]["completion_rates"] == [rates[2]]
+    assert r["proxies"]["gds"] == rates[2]
+    assert "level runs were disabled" in (tmp_path / "main" / "disclosure.md").read_text()
+
+
+def test_gds_level_runs_match_across_workers(tmp_path):
+    kwargs = dict(stress_parameters={"SR-1": {"rate": 0.3}}, n_runs=2, gds_levels=[0.0, 1.0])
+    _benchmark(tmp_path / "serial", "W1-A", **kwargs)
+    _benchmark(tmp_path / "parallel", "W1-A", workers=2, **kwargs)
+    for i in (1, 2):
+        serial = json.loads((tmp_path / "serial" / "runs" / f"run_{i:02d}.json").read_text())
+        parallel = json.loads((tmp_path / "parallel" / "runs" / f"run_{i:02d}.json").read_text())
+        assert parallel["evidence"]["completion_rates"] == serial["evidence"]["completion_rates"]
+        assert serial["evidence"]["completion_rates"][0] == 1.0
+
+
+def test_resource_dimension_meters_runs_for_rec(tmp_path):
+    kwargs = dict(stress_parameters={"SR-1": {"rate": 0.3}}, n_runs=1)
+    _benchmark(tmp_path / "cpu", "W1-A", resource_dimension="cpu_s", **kwargs)
+    r = json.loads((tmp_path / "cpu" / "runs" / "run_01.json").read_text())
+    (rec,) = [e for e in r["events"] if e["work_done"] is not None]
+    usage, per_unit = r["evidence"]["resource_usage"], r["evidence"]["resource_usage_per_unit"]
+    assert r["evidence"]["resource_dimension"] == "cpu_s"
+    assert rec["resources"] == usage and usage["cpu_user_s"] > 0.0 and usage["max_rss_bytes"] > 0.0
+    assert per_unit["cpu_user_s"] == pytest.approx(usage["cpu_user_s"] / rec["work_done"])
+    baseline = json.loads((tmp_path / "cpu" / "baseline.json").read_text())
+    assert baseline["key_material"]["resource_dimension"] == "cpu_s"
+    assert r["evidence"]["E_stress"] == pytest.approx(rec["work_done"] / (usage["cpu_user_s"] + usage["cpu_sys_s"]))
+
+    _benchmark(tmp_path / "wall", "W1-A", **kwargs)
+    r = json.loads((tmp_path / "wall" / "runs" / "run_01.json").read_text())
+    assert r["evidence"]["resource_usage"] is None
+    with pytest.raises(ValueError, match="resource dimension"):
+        _benchmark(tmp_path / "bad", "W1-A", resource_dimension="watts", **kwargs)
+
+
+def test_profiled_runs_write_profiles_and_record_overhead(tmp_path):
+    kwargs = dict(stress_parameters={"SR-1": {"rate": 0.3}}, n_runs=2, baseline_cache_dir=str(tmp_path / "cache"))
+    _benchmark(tmp_path / "plain", "W1-A", **kwargs)
+    _benchmark(tmp_path / "prof", "W1-A", profile=["tracemalloc", "cprofile"], profile_runs=[2], profile_top_n=5, **kwargs)
+    runs = tmp_path / "prof" / "runs"
+    assert not (runs / "run_01.profile.json").exists()
+    profile = json.loads((runs / "run_02.profile.json").read_text())
+    assert profile["profilers"] == ["cprofile", "tracemalloc"]
+    assert 0 < len(profile["hot_functions"]) <= 5 and 0 < len(profile["allocation_sites"]) <= 5
+    assert any(f["file"].endswith("w1_stateless.py") for f in profile["hot_functions"])
+    own = [f["own_s"] for f in profile["hot_functions"]]
+    assert own == sorted(own, reverse=True)
+
+    manifest = json.loads((tmp_path / "prof" / "manifest.json").read_text())
+    assert set(manifest["profiling"]["runs"]) == {"run_02"}
+    assert manifest["profiling"]["runs"]["run_02"] == profile["overhead"]
+    assert manifest["profiling"]["calibration"]["slowdown"] > 1.0
+    # Profiling leaves the records and their run keys alone
+    for i in (1, 2):
+        a = json.loads((tmp_path / "plain" / "runs" / f"run_{i:02d}.json").read_text())
+        b = json.loads((runs / f"run_{i:02d}.json").read_text())
+        assert _strip_timing(a) == _strip_timing(b)
+
+    with pytest.raises(ValueError, match="profilers"):
+        _benchmark(tmp_path / "bad", "W1-A", profile=["perf"], **kwargs)
+    with pytest.raises(ValueError, match="profile_runs"):
+        _benchmark(tmp_path / "bad", "W1-A", profile=["cprofile"], profile_runs=[3], **kwargs)
+
+
+def test_w2a_meter_is_stopped_when_the_workload_raises(tmp_path, monkeypatch):
+    from OCRB import runner
+    from OCRB.measure.resources import ResourceMeter
+
+    meters = []
+
+    def meter(ctx, scope="thread"):
+        meters.append(ResourceMeter(scope))
+        return meters[-1]
+
+    def fail(**kwargs):
+        raise RuntimeError("workload failed")
+
+    monkeypatch.setattr(runner, "_meter", meter)
+    monkeypatch.setattr(runner, "run_w2a", fail)
+    with pytest.raises(RuntimeError, match="workload failed"):
+        _run(tmp_path, "W2-A")
+    assert meters and all(m.usage is not None for m in meters)
@@ -0,0 +1,226 @@
+import pytest
+
+from OCRB.config import generate_seeds
+from OCRB.stress.base import ISOLATED, POWER_LOSS, compile_timeline, scale_stress
+from OCRB.stress.network import LATENCY_DISTRIBUTIONS, MessageBus, NetworkProfile
+
+
+def test_timeline_is_deterministic_per_run():
+    seeds = generate_seeds(42)
+    params = {"SR-1": {"rate": 0.05}, "SR-2": {"period_s": 100, "amplitude": 1.5}, "SR-4": {"loss": 0.1}}
+    a = compile_timeline(params, seeds, horizon=1000, run_index=1)
+    b = compile_timeline(params, seeds, horizon=1000, run_index=1)
+    c = compile_timeline(params, seeds, horizon=1000, run_index=2)
+    assert a == b
+    assert a.flags != c.flags
+    assert any(a.fault_at(t) for t in range(1000))
+
+
+def test_timeline_windows():
+    seeds = generate_seeds(1)
+    params = {
+        "SR-3": {"availability": 0.9, "interruption_s": 10, "schedule": "periodic"},
+        "SR-5": {"start_s": 20, "duration_s": 30},
+    }
+    tl = compile_timeline(params, seeds, horizon=200, tick_s=1.0, crash_points=[3])
+
+    assert tl.windows(ISOLATED) == [(20, 50)]
+    assert not tl.external_available_at(20) and tl.external_available_at(50)
+
+    power = tl.windows(POWER_LOSS)
+    assert sum(end - start for start, end in power) == 20
+    assert all(tl.crash_at(start) for start, _ in power)
+    assert tl.crash_at(3)
+    assert not tl.crash_at(500)  # beyond the horizon: unstressed
+
+
+def test_message_bus_bounds_latency_and_is_seeded():
+    for distribution in LATENCY_DISTRIBUTIONS:
+        profile = NetworkProfile.from_sr4({
+            "latency_ms": 10, "jitter_ms": 5, "max_latency_ms": 20, "distribution": distribution,
+            "packet_loss": 0.1, "partitions": [{"start_s": 1.0, "duration_s": 1.0, "nodes": [0]}],
+        })
+        runs = []
+        for _ in range(2):
+            bus = MessageBus(profile, seed=7)
+            delivered = []
+            for k in range(20_000):
+                bus.advance_to(k * 1e-4)
+                bus.send(k % 3, (k + 1) % 3, k)
+                while bus.next_time() <= bus.now:
+                    delivered.append(bus.pop())
+            while len(bus):
+                delivered.append(bus.pop())
+            runs.append(delivered)
+        assert runs[0] == runs[1]
+        assert bus.sent == 20_000 and 0.05 < bus.dropped / bus.sent < 0.5
+        sent_at = {k: k * 1e-4 for k in range(20_000)}
+        assert all(0.0 <= t - sent_at[k] <= 0.020 + 1e-12 for t, _, k in runs[0])
+        # Nothing crosses the partition of node 0 during [1s, 2s)
+        assert not any(1.0 <= sent_at[k] < 2.0 and 0 in (k % 3, (k + 1) % 3) for _, _, k in runs[0])
+
+
+def test_bit_flips_are_in_place_and_seeded():
+    np = pytest.importorskip("numpy")
+    from OCRB.stress.bitflip import inject_bit_flips
+
+    buf = bytearray(1 << 16)
+    flips = inject_bit_flips(buf, 1e-3, seed=7)
+    assert flips.count > 0 and flips.nbits == len(buf) * 8
+    assert sum(bin(b).count("1") for b in buf) == flips.count
+    assert inject_bit_flips(bytearray(1 << 16), 1e-3, seed=7).positions.tolist() == flips.positions.tolist()
+
+    # Flipping the same bits again restores the buffer; numpy arrays work too.
+    inject_bit_flips(buf, 1e-3, seed=7)
+    assert not any(buf)
+    arr = np.zeros(1 << 13, dtype=np.float64)
+    assert inject_bit_flips(arr, 1e-3, seed=7).count == flips.count
+    assert np.count_nonzero(arr.view(np.uint8)) > 0
+
+    with pytest.raises(ValueError):
+        inject_bit_flips(bytes(16), 0.5, seed=1)
+    with pytest.raises(ValueError):
+        inject_bit_flips(bytearray(16), 1.5, seed=1)
+
+
+def test_power_cuts_follow_crash_ticks():
+    from OCRB.stress.base import CRASH
+    from OCRB.stress.power import power_cuts
+
+    sr3 = {"availability": 0.8, "interruption_s": 2, "schedule": "periodic"}
+    tl = compile_timeline({"SR-3": sr3}, generate_seeds(1), horizon=20, crash_points=[1])
+    kills = power_cuts(tl, sr3)
+    assert sorted(kills) == [t for t in range(20) if tl.crash_at(t)]
+    assert {c.signal for c in kills.values()} == {"kill"}
+
+    stops = power_cuts(tl, {**sr3, "signal": "stop"})
+    assert stops[1].signal == "kill"  # a declared crash point, outside any window
+    assert all(c.signal == "stop" and c.hold_s == 2.0 for t, c in stops.items() if t != 1)
+    assert not any(tl.without(CRASH).crash_at(t) for t in range(20))
+    with pytest.raises(ValueError):
+        power_cuts(tl, {"signal": "hup"})
+
+
+def test_throttler_duty_cycles_to_the_thermal_cycle():
+    from OCRB.stress.thermal import ThermalCycle, Throttler, phase_evidence
+
+    now = [0.0]
+
+    def sleep(s):
+        now[0] += s
+
+    for waveform in ("sine", "square"):
+        cycle = ThermalCycle(period_s=1.0, min_availability=0.25, waveform=waveform, phases=4, slice_s=0.01)
+        throttle = Throttler(cycle, anchor=0.0, clock=lambda: now[0], sleep=sleep)
+        now[0] = 0.0
+        while now[0] < 20.0:
+            now[0] += 1e-4  # 32 units of work
+            throttle(32)
+        evidence = phase_evidence(cycle, throttle.stats)
+        assert [level for _, level, _ in evidence] == cycle.phase_levels()
+        for _, level, rate in evidence:
+            assert abs(rate - (1.0 - level)) < 0.05
+
+    assert ThermalCycle.from_sr2({"period_s": 1.0}, seed=1) is None
+    seeded = ThermalCycle.from_sr2({"period_s": 2.0, "min_availability": 0.5}, seed=1)
+    assert seeded == ThermalCycle.from_sr2({"period_s": 2.0, "min_availability": 0.5}, seed=1)
+    assert 0.0 <= seeded.offset_s < 2.0
+    with pytest.raises(ValueError):
+        ThermalCycle(period_s=1.0, min_availability=0.5, waveform="saw")
+
+
+def test_scale_stress_interpolates_from_unstressed_to_declared():
+    declared = {
+        "SR-1": {"rate": 0.2, "bit_flip_rate": 0.01},
+        "SR-3": {"availability": 0.6, "interruption_s": 2},
+        "SR-4": {"loss": 0.1, "latency_ms": 40, "partitions": [{"at_s": 1, "duration_s": 4}]},
+        "SR-5": {"duration_s": 120},
+    }
+    assert scale_stress(declared, 1.0) == {
+        **declared,
+        "SR-4": {"loss": 0.1, "latency_ms": 40.0, "partitions": [{"at_s": 1, "duration_s": 4.0}]},
+        "SR-5": {"duration_s": 120.0},
+    }
+    half = scale_stress(declared, 0.5)
+    assert half["SR-1"] == {"rate": 0.1, "bit_flip_rate": 0.005}
+    assert half["SR-3"] == {"availability": 0.8, "interruption_s": 2}
+    assert half["SR-4"]["partitions"] == [{"at_s": 1, "duration_s": 2.0}]
+    assert scale_stress(declared, 0.0) == {}
+    assert scale_stress({"SR-5": {}}, 0.5) == {"SR-5": {}}
+
+
+def test_fork_server_is_not_leaked_when_it_fails_to_start(monkeypatch):
+    import subprocess
+
+    from OCRB.stress import power
+
+    started = []
+    popen = subprocess.Popen
+
+    def record(*args, **kwargs):
+        started.append(popen(*args, **kwargs))
+        return started[-1]
+
+    # A server that answers the handshake wrongly and then hangs
+    boot = "import socket, sys, time; socket.socket(fileno=int(sys.argv[1])).sendall(b'no\\n'); time.sleep(60)"
+    monkeypatch.setattr(power, "_BOOT", boot)
+    monkeypatch.setattr(power.subprocess, "Popen", record)
+    with pytest.raises(RuntimeError):
+        power._Launcher("forkserver")
+    assert len(started) == 1 and started[0].poll() is not None
+
+
+def test_sr1_bit_flips_without_numpy_fail_before_running(monkeypatch, tmp_path):
+    import sys
+
+    from OCRB.runner import run_benchmark
+    from OCRB.stress.bitflip import check_bit_flips
+
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    check_bit_flips({"rate": 0.1})
+    with pytest.raises(ImportError, match="NumPy"):
+        check_bit_flips({"bit_flip_rate": 1e-4})
+    with pytest.raises(ImportError, match="NumPy"):
+        run_benchmark(
+            out_dir=str(tmp_path),
+            workload_id="W2-A",
+            workload_version="0.1",
+            stress_profile_id="SP-1",
+            stress_parameters={"SR-1": {"bit_flip_rate": 1e-4}},
+            execution_environment={"os": "test", "runtime": "python"},
+            master_seed=1,
+        )
+    assert not (tmp_path / "manifest.json").exists()
+
+
+def test_supervise_kills_at_crash_ticks_and_times_cold_restarts(tmp_path):
+    from OCRB.measure.clock import SimulatedClock
+    from OCRB.stress.base import CRASH
+    from OCRB.stress.power import power_cuts, supervise
+    from OCRB.workloads.w2_stateful_pipeline import W2AConfig, run_w2a
+
+    # A crash tick fires again on every pass, so the run fails at stage 7
+    # once its restarts are used up
+    cfg = W2AConfig(max_restarts=2)
+    sr3 = {"availability": 0.9, "interruption_s": 0.01}
+    tl = compile_timeline({"SR-3": sr3}, generate_seeds(123), horizon=cfg.stages, tick_s=cfg.stage_work_s,
+                          crash_points=[7])
+    inproc = run_w2a(run_dir=str(tmp_path / "inproc"), seed=5, cfg=cfg, external_call=lambda: None,
+                     timeline=tl, clock=SimulatedClock())
+    sup = supervise(
+        "OCRB.workloads.w2_stateful_pipeline:run_w2a_in_child",
+        dict(run_dir=str(tmp_path / "sup"), seed=5, cfg=cfg, timeline=tl.without(CRASH)),
+        power_cuts(tl, sr3),
+        max_restarts=cfg.max_restarts,
+    )
+    # SIGKILL + cold restart behaves like the simulated crash, only slower
+    assert inproc.failed and sup.result is None
+    assert sup.failed_stage == inproc.stages_completed == 7
+    assert len(sup.restarts) == inproc.restarts == 2 and len(sup.killed_info) == 3
+    for start in sup.restarts:
+        assert start.spawn_s > 0 and start.import_s > 0 and start.restore_s > 0
+        assert start.total_s >= start.spawn_s + start.import_s + start.restore_s
+    assert sup.duration_s > sum(s.total_s for s in sup.restarts)
+    assert sup.server_start_s > 0 and sup.resources is not None
+    with pytest.raises(ValueError, match="start method"):
+        supervise("OCRB.workloads.w2_stateful_pipeline:run_w2a_in_child", {}, {}, max_restarts=0, start_method="fork")
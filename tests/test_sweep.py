@@ -0,0 +1,101 @@
+import json
+import multiprocessing
+import socket
+
+from OCRB.distributed import SweepCoordinator, run_worker
+from OCRB.sweep import expand_matrix, run_sweep
+
+
+def test_sweep_runs_every_cell_and_writes_index(tmp_path):
+    cells = expand_matrix({
+        "workloads": [{"id": "STUB", "version": "0.1"}, {"id": "W2-A", "version": "0.1"}],
+        "profiles": [
+            {"id": "SP-0", "stress_parameters": {}},
+            {"id": "SP-1", "stress_parameters": {"SR-5": {"duration_s": 120}}},
+        ],
+        "seeds": [1, 2],
+        "n_runs": 2,
+        "gds_levels": [0.1, 0.2, 0.3],
+        "isolation_duration_declared": 120.0,
+        "C_total": 5,
+    })
+    assert len(cells) == 8
+
+    outcomes = run_sweep(
+        out_dir=str(tmp_path),
+        cells=cells,
+        execution_environment={"os": "test", "runtime": "python"},
+        workers=2,
+        clock="simulated",
+    )
+    assert [o.status for o in outcomes] == ["ok"] * 8
+
+    index = json.loads((tmp_path / "sweep_index.json").read_text())
+    assert [c["cell_id"] for c in index["cells"]] == [c.cell_id for c in cells]
+    for cell in cells:
+        cell_dir = tmp_path / "cells" / cell.cell_id
+        assert (cell_dir / "aggregate_summary.json").exists()
+        assert len(list((cell_dir / "runs").glob("run_*.json"))) == 2
+
+    # One shared baseline per distinct workload; its real SP-0 wall time
+    # (not its resources, whose units differ by workload) estimates cost
+    records = [json.loads(p.read_text()) for p in (tmp_path / "baseline_cache" / "baselines").glob("*.json")]
+    assert len(records) == 2
+    wall = {r["key_material"]["workload_id"]: r["wall_s"] for r in records}
+    for c in index["cells"]:
+        assert c["estimated_cost"] == c["cell"]["n_runs"] * wall[c["cell"]["workload_id"]]
+
+
+def _matrix():
+    return expand_matrix({
+        "workloads": [{"id": "STUB", "version": "0.1"}, {"id": "W2-A", "version": "0.1"}],
+        "profiles": [{"id": "SP-1", "stress_parameters": {"SR-5": {"duration_s": 120}}}],
+        "seeds": [1, 2],
+        "n_runs": 3,
+        "gds_levels": [0.1, 0.2, 0.3],
+        "isolation_duration_declared": 120.0,
+        "C_total": 5,
+    })
+
+
+def test_distributed_sweep_matches_single_node(tmp_path):
+    env = {"os": "test", "runtime": "python"}
+    single = tmp_path / "single"
+    run_sweep(out_dir=str(single), cells=_matrix(), execution_environment=env, clock="simulated")
+
+    multi = tmp_path / "multi"
+    coordinator = SweepCoordinator(
+        out_dir=str(multi), cells=_matrix(), execution_environment=env, clock="simulated",
+    )
+    host, port = coordinator.address
+
+    # A worker that sends malformed messages (answered with an error, the
+    # connection stays up), takes an item, returns a record that is not one
+    # and drops the connection; the item is re-queued.
+    with socket.create_connection((host, port)) as sock, sock.makefile("rwb") as f:
+        def exchange(msg):
+            f.write(msg if isinstance(msg, bytes) else json.dumps(msg).encode() + b"\n")
+            f.flush()
+            return json.loads(f.readline())
+
+        for msg in ({"op": "result"}, {"op": "failed", "item_id": 0}, b"[1]\n", b"not json\n"):
+            assert exchange(msg)["op"] == "error"
+        reply = exchange({"op": "get"})
+        assert reply["op"] == "work"
+        item_id = reply["item"]["item_id"]
+        for record in ({}, {"run_id": "run-01", "proxies": {}}):
+            assert exchange({"op": "result", "item_id": item_id, "record": record})["op"] == "error"
+
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=run_worker, args=(host, port)) for _ in range(3)]
+    for w in workers:
+        w.start()
+    outcomes = coordinator.run(timeout=120)
+    for w in workers:
+        w.join(timeout=60)
+
+    assert [o.status for o in outcomes] == ["ok"] * 4
+    for cell in _matrix():
+        a, b = single / "cells" / cell.cell_id, multi / "cells" / cell.cell_id
+        for name in ["aggregate_summary.json"] + [f"runs/run_{i:02d}.json" for i in (1, 2, 3)]:
+            assert (a / name).read_bytes() == (b / name).read_bytes()
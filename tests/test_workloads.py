@@ -0,0 +1,281 @@
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from OCRB.config import StressSeeds
+from OCRB.measure.clock import SimulatedClock
+from OCRB.stress.base import compile_timeline
+from OCRB.workloads.checkpoint import (
+    CHECKPOINT_BACKENDS,
+    SLOT_SIZE,
+    JournalCheckpoint,
+    MmapSlotCheckpoint,
+    open_checkpoint_store,
+)
+from OCRB.workloads.state import PipelineState, StateCheckpointer
+from OCRB.workloads.w1_stateless import W1AConfig, run_w1a
+from OCRB.workloads.w2_stateful_pipeline import W2AConfig, run_w2a, run_w2a_async
+from OCRB.workloads.w3_leader_election import W3AConfig, run_w3a
+
+
+def test_w1a_sharded_matches_serial():
+    serial = run_w1a(tasks=23, work_units_per_task=50, seed=7)
+    for executor in ("process", "thread"):
+        sharded = run_w1a(tasks=23, work_units_per_task=50, seed=7, workers=4, executor=executor)
+        assert sharded.tasks_completed == serial.tasks_completed == 23
+        assert sharded.checksum == serial.checksum
+        assert len(sharded.shard_durations_s) == 4
+
+
+def test_w2a_simulated_clock_runs_without_sleeping(tmp_path):
+    clock = SimulatedClock(start=0.0)
+    cfg = W2AConfig(stages=20, stage_work_s=3600.0)
+    res = run_w2a(run_dir=str(tmp_path), seed=1, cfg=cfg, external_call=lambda: None, clock=clock)
+    assert not res.failed
+    assert res.duration_s == clock.now() == 20 * 3600.0
+
+
+def test_w2a_async_matches_sync_across_concurrent_instances(tmp_path):
+    cfg = W2AConfig(stages=30)
+
+    def crash(seed, stage):
+        return stage in (seed % 30, (seed * 7) % 30)
+
+    async def external_call():
+        return None
+
+    async def main():
+        return await asyncio.gather(*(
+            run_w2a_async(
+                run_dir=str(tmp_path / "async" / str(seed)), seed=seed, cfg=cfg, external_call=external_call,
+                should_crash=crash, clock=SimulatedClock(),
+            )
+            for seed in range(200)
+        ))
+
+    for seed, res in enumerate(asyncio.run(main())):
+        sync = run_w2a(
+            run_dir=str(tmp_path / "sync" / str(seed)), seed=seed, cfg=cfg, external_call=lambda: None,
+            should_crash=crash, clock=SimulatedClock(),
+        )
+        assert res == sync
+
+
+def test_journal_checkpoint_recovers_last_valid_record(tmp_path):
+    for fsync in ("none", "batch", "every"):
+        run_dir = tmp_path / fsync
+        run_dir.mkdir()
+        journal = JournalCheckpoint(str(run_dir), fsync=fsync, fsync_batch=2)
+        assert journal.load() == 0
+        sizes = [journal.save(n) for n in (5, 10, 15)]
+        journal.close()
+
+        path = run_dir / "checkpoint.journal"
+        assert path.stat().st_size == sum(sizes)
+        # Tear the last record: recovery falls back to the one before it.
+        with open(path, "r+b") as f:
+            f.truncate(sum(sizes) - 2)
+        assert JournalCheckpoint(str(run_dir)).load() == 10
+        assert path.stat().st_size == sum(sizes[:2])
+
+        # Appends continue after the last valid record.
+        journal = JournalCheckpoint(str(run_dir))
+        journal.save(20)
+        journal.close()
+        assert JournalCheckpoint(str(run_dir)).load() == 20
+
+
+def test_journal_checkpoint_compacts_and_loads_incrementally(tmp_path):
+    journal = JournalCheckpoint(str(tmp_path), compact_every=4)
+    assert journal.load() == 0
+    sizes = [journal.save(n) for n in range(1, 10)]
+    # Saves 4 and 8 also rewrite the journal as their own record
+    assert sizes[3] == sizes[7] == 2 * sizes[0]
+    path = tmp_path / "checkpoint.journal"
+    assert path.stat().st_size == 2 * sizes[0]
+    assert journal.load() == 9
+    assert JournalCheckpoint(str(tmp_path)).load() == 9
+
+    # Records verified once are not scanned again; later appends are
+    other = JournalCheckpoint(str(tmp_path))
+    other.save(10)
+    other.close()
+    with open(path, "r+b") as f:
+        f.write(b"\xff" * 8)
+    assert journal.load() == 10
+    journal.close()
+    assert open_checkpoint_store("journal", str(tmp_path), compact_every=0).compact_every == 0
+
+
+def test_w2a_checkpoint_backends_give_identical_results(tmp_path):
+    def crash(seed, stage):
+        return stage == 17
+
+    results = {}
+    for backend in CHECKPOINT_BACKENDS:
+        cfg = W2AConfig(stages=30, checkpoint_backend=backend, max_restarts=1)
+        results[backend] = run_w2a(
+            run_dir=str(tmp_path / backend), seed=1, cfg=cfg, external_call=lambda: None,
+            should_crash=crash, clock=SimulatedClock(),
+        )
+    file = results["file"]
+    for res in results.values():
+        assert (res.stages_completed, res.restarts, res.failed, res.checkpoint_restores) == (
+            file.stages_completed, file.restarts, file.failed, file.checkpoint_restores,
+        )
+        assert res.checkpoint_writes == file.checkpoint_writes > 0
+    assert results["journal"].checkpoint_bytes > 0
+
+    # The journal's compaction interval is configurable (0 never compacts)
+    sizes = {}
+    for every in (0, 1):
+        cfg = W2AConfig(stages=30, checkpoint_backend="journal", checkpoint_compact_every=every)
+        run_dir = tmp_path / f"compact_{every}"
+        run_w2a(run_dir=str(run_dir), seed=1, cfg=cfg, external_call=lambda: None, clock=SimulatedClock())
+        sizes[every] = (run_dir / "checkpoint.journal").stat().st_size
+    assert sizes[1] < sizes[0]
+
+
+def test_mmap_slot_checkpoints_are_independent(tmp_path):
+    path = str(tmp_path / "slots")
+    stores = [MmapSlotCheckpoint(path, slot) for slot in (3, 0, 1)]
+    for n, store in enumerate(stores):
+        assert store.load() == 0
+        store.save(10 * (n + 1))
+    for store in stores:
+        store.close()
+    assert [MmapSlotCheckpoint(path, slot).load() for slot in (3, 0, 1, 2)] == [10, 20, 30, 0]
+
+    # A damaged slot is detected, not silently resumed.
+    with open(path, "r+b") as f:
+        f.seek(SLOT_SIZE)
+        f.write(b"\x01")
+    with pytest.raises(RuntimeError, match="checkpoint_corrupt"):
+        MmapSlotCheckpoint(path, 1).load()
+    with pytest.raises(ValueError, match="fsync_batch"):
+        MmapSlotCheckpoint(path, 0, fsync="batch", fsync_batch=0)
+
+
+def test_delta_checkpoints_restore_same_state_as_full(tmp_path):
+    for storage in ("memory", "file"):
+        for strategy, compact_every in (("full", 0), ("delta", 0), ("delta", 2)):
+            state = PipelineState(3, initial_bytes=20_000, growth_bytes=1500, mutate_bytes=700)
+            ck = StateCheckpointer(
+                strategy, storage=storage, run_dir=str(tmp_path / storage / f"{strategy}{compact_every}"),
+                compact_every=compact_every,
+            )
+            snapshots = {}
+            for stage in range(12):
+                state.advance(stage)
+                if (stage + 1) % 3 == 0:
+                    ck.save(state, stage + 1)
+                    snapshots[stage + 1] = bytes(state.data)
+            assert bytes(ck.restore(12)) == snapshots[12]
+
+
+def test_w2a_state_payload_recovers_after_crash(tmp_path):
+    crashed = set()
+
+    def crash(seed, stage):
+        # Crash once at each of these stages
+        if stage in (7, 13) and stage not in crashed:
+            crashed.add(stage)
+            return True
+        return False
+
+    results = {}
+    for strategy in ("full", "delta"):
+        cfg = W2AConfig(
+            stages=20, max_restarts=1, state_initial_bytes=64 * 1024, state_mutate_bytes=512,
+            checkpoint_strategy=strategy,
+        )
+        results[strategy] = run_w2a(
+            run_dir=str(tmp_path / strategy), seed=2, cfg=cfg, external_call=lambda: None,
+            should_crash=lambda seed, stage: False, clock=SimulatedClock(),
+        )
+    full, delta = results["full"], results["delta"]
+    assert full.state_bytes == delta.state_bytes == 64 * 1024
+    assert delta.checkpoint_bytes < full.checkpoint_bytes
+
+    cfg = W2AConfig(stages=20, max_restarts=3, state_growth_bytes=4096, checkpoint_strategy="delta")
+    res = run_w2a(
+        run_dir=str(tmp_path / "crash"), seed=2, cfg=cfg, external_call=lambda: None,
+        should_crash=crash, clock=SimulatedClock(),
+    )
+    assert not res.failed and res.restarts == res.checkpoint_restores == 2
+    clean = run_w2a(
+        run_dir=str(tmp_path / "clean"), seed=2, cfg=cfg, external_call=lambda: None, clock=SimulatedClock(),
+    )
+    assert (res.state_bytes, res.state_crc32) == (clean.state_bytes, clean.state_crc32)
+    assert res.state_bytes == 20 * 4096
+
+
+def test_w3a_elects_one_leader_and_fails_over():
+    cfg = W3AConfig(nodes=5)
+    clean = run_w3a(seed=11, cfg=cfg)
+    assert not clean.failed
+    assert clean.leader_elections == 1 and clean.crashes == () and clean.affected_nodes == ()
+
+    # Leader crashes at ticks 60 and 130: each is followed by a new election
+    timeline = compile_timeline({}, StressSeeds(0, 0, 0, 0, 0), horizon=200, tick_s=cfg.heartbeat_s,
+                                crash_points=[60, 130])
+    res = run_w3a(seed=11, cfg=cfg, timeline=timeline)
+    # Everything but wall time is a function of (seed, cfg, timeline)
+    assert replace(res, duration_s=0.0) == replace(run_w3a(seed=11, cfg=cfg, timeline=timeline), duration_s=0.0)
+    assert [c.was_leader for c in res.crashes] == [True, True]
+    assert all(c.recovered for c in res.crashes)
+    assert res.leader_changes >= 2 and res.safety_violations == 0
+    assert len(res.election_latencies_s) == res.leader_elections
+    assert res.leader_availability < clean.leader_availability
+
+
+def test_w3a_scales_to_hundreds_of_nodes():
+    res = run_w3a(seed=3, cfg=W3AConfig(nodes=300, duration_s=2.0))
+    assert not res.failed
+    assert res.leader_elections >= 1 and res.heartbeat_rounds > 0
+    assert res.heartbeat_rounds > 30 and res.messages_sent > 20_000
+
+
+def test_mmap_checkpoint_needs_file_locks(tmp_path, monkeypatch):
+    from OCRB.workloads import checkpoint
+
+    monkeypatch.setattr(checkpoint, "fcntl", None)
+    assert checkpoint.open_checkpoint_store("file", str(tmp_path)).load() == 0
+    with pytest.raises(ValueError, match="fcntl"):
+        checkpoint.open_checkpoint_store("mmap", str(tmp_path))
+
+
+def test_w2a_state_faults_change_the_state_payload(tmp_path):
+    pytest.importorskip("numpy")
+    from OCRB.stress.bitflip import inject_bit_flips
+
+    cfg = W2AConfig(state_initial_bytes=1 << 16, state_mutate_bytes=256, checkpoint_strategy="delta")
+    flipped = []
+
+    def faults(stage, data):
+        offsets = inject_bit_flips(data, 1e-4, seed=stage).byte_offsets.tolist()
+        flipped.extend(offsets)
+        return offsets
+
+    results = [
+        run_w2a(run_dir=str(tmp_path / name), seed=1, cfg=cfg, external_call=lambda: None,
+                clock=SimulatedClock(), state_faults=fault_hook)
+        for name, fault_hook in (("clean", None), ("a", faults), ("b", faults))
+    ]
+    clean, a, b = results
+    assert flipped and not a.failed
+    assert a.state_crc32 == b.state_crc32 != clean.state_crc32
+    assert a.state_bytes == clean.state_bytes
+
+
+def test_w1a_reports_throughput_per_thermal_phase():
+    from OCRB.stress.thermal import ThermalCycle, phase_evidence
+
+    cycle = ThermalCycle(period_s=0.05, min_availability=0.4, waveform="square", phases=2)
+    cfg = W1AConfig()
+    res = run_w1a(tasks=cfg.tasks, work_units_per_task=cfg.work_units_per_task, seed=1, thermal=cycle)
+    evidence = phase_evidence(cycle, res.phase_stats)
+    assert [k for k, _, _ in evidence] == [0, 1]
+    assert [level for _, level, _ in evidence] == [0.0, 0.6]
+    assert all(0.0 <= rate <= 1.0 for _, _, rate in evidence)